@@ -0,0 +1,64 @@
+import sys
+import time
+
+import numpy as np
+
+from chaotic_inventory_opt.fractal.hurst import HurstEstimator, IncrementalHurstEstimator
+
+
+# ----------------------------
+# Demand-like series whose lagged differences become constant
+# ----------------------------
+def segmented_series(rng, segments):
+    # Segment lengths are random, so that the periodic exact refresh
+    # of the running sums does not line up with the flat stretches
+    parts = []
+    for _ in range(segments):
+        parts.append(rng.gamma(2.0, 3.0, rng.integers(30, 300)))
+        parts.append(np.full(rng.integers(1, 120), 1.5))
+        parts.append(1.5 + 0.25 * np.arange(rng.integers(0, 60)))
+    return np.concatenate(parts)
+
+
+def streaming(series, window):
+    est = IncrementalHurstEstimator(window=window)
+    out = np.empty(len(series))
+    for i, value in enumerate(series):
+        est.push(value)
+        out[i] = est.value()
+    return out
+
+
+def reference(series, window):
+    est = HurstEstimator()
+    return np.array(
+        [est.estimate(series[max(0, i + 1 - window):i + 1]) for i in range(len(series))]
+    )
+
+
+# ----------------------------
+# Check against ``HurstEstimator.estimate``
+# ----------------------------
+segments = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+windows = [25, 50, 100]
+
+rng = np.random.default_rng(0)
+
+print(f"{'window':>8} {'stream s':>10} {'batch s':>10} {'max |diff|':>12}")
+
+for window in windows:
+    x = segmented_series(rng, segments)
+
+    start = time.perf_counter()
+    fast = streaming(x, window)
+    fast_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    slow = reference(x, window)
+    slow_seconds = time.perf_counter() - start
+
+    diff = float(np.max(np.abs(fast - slow)))
+    print(f"{window:>8} {fast_seconds:>10.3f} {slow_seconds:>10.3f} {diff:>12.2e}")
+
+    if diff > 1e-6:
+        raise SystemExit(f"streaming estimate deviates by {diff:.3g} (window={window})")
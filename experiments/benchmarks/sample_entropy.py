@@ -0,0 +1,80 @@
+import sys
+import time
+
+import numpy as np
+
+from chaotic_inventory_opt.chaos.entropy import SampleEntropy
+
+
+# ----------------------------
+# Reference O(N^2) implementation
+# ----------------------------
+def sample_entropy_reference(series, m=2, r_ratio=0.2):
+    x = np.asarray(series, dtype=float)
+    N = len(x)
+
+    if N <= m + 1:
+        return 0.0
+
+    r = r_ratio * np.std(x)
+
+    def _count(m):
+        patterns = np.array([x[i:i + m] for i in range(N - m)])
+        count = 0
+        for i in range(len(patterns)):
+            dist = np.max(np.abs(patterns - patterns[i]), axis=1)
+            count += np.sum(dist < r) - 1
+        return count
+
+    Cm = _count(m)
+    Cm1 = _count(m + 1)
+
+    if Cm == 0 or Cm1 == 0:
+        return 0.0
+
+    return float(-np.log(Cm1 / Cm))
+
+
+def timed(fn, x):
+    start = time.perf_counter()
+    value = fn(x)
+    return value, time.perf_counter() - start
+
+
+# ----------------------------
+# Benchmark
+# ----------------------------
+sizes = [int(s) for s in sys.argv[1:]] or [
+    1_000, 10_000, 100_000, 1_000_000
+]
+
+# Largest N timed per engine; the quadratic paths are capped
+limits = {
+    "kdtree": None,
+    "sorted": 20_000,
+    "reference": 5_000,
+}
+engines = {
+    "kdtree": SampleEntropy(method="kdtree").estimate,
+    "sorted": SampleEntropy(method="sorted").estimate,
+    "reference": sample_entropy_reference,
+}
+
+rng = np.random.default_rng(0)
+
+print(f"{'N':>10} {'method':>10} {'seconds':>10} {'SampEn':>10}")
+
+for N in sizes:
+    # AR(1) demand-like series
+    noise = rng.normal(size=N)
+    x = np.empty(N)
+    x[0] = noise[0]
+    for t in range(1, N):
+        x[t] = 0.7 * x[t - 1] + noise[t]
+
+    for name, fn in engines.items():
+        if limits[name] is not None and N > limits[name]:
+            continue
+
+        value, seconds = timed(fn, x)
+        print(f"{N:>10} {name:>10} {seconds:>10.3f} {value:>10.4f}")
@@ -1,14 +1,14 @@
 import yaml
-import pandas as pd
 import numpy as np
 from pathlib import Path
 
 from chaotic_inventory_opt.control.classical import sSPolicy, BaseStockPolicy
-from chaotic_inventory_opt.control.fcio import FCIOPolicy
-from chaotic_inventory_opt.core.inventory_system import InventorySystem
+from chaotic_inventory_opt.control.fleet import FCIOFleetPolicy
+from chaotic_inventory_opt.core.batch import BatchInventorySimulator
 from chaotic_inventory_opt.core.cost import CostModel
-from chaotic_inventory_opt.evaluation.performance import PerformanceMetrics
-from chaotic_inventory_opt.evaluation.stability import StabilityMetrics
+from chaotic_inventory_opt.data.ingest import iter_blocks
+from chaotic_inventory_opt.data.store import DemandStore
+from chaotic_inventory_opt.evaluation.stability import BatchStabilityMetrics
 from chaotic_inventory_opt.chaos.lyapunov import LyapunovExponentEstimator
 
 
@@ -21,17 +21,15 @@ with open(CONFIG_PATH) as f:
 # ----------------------------
 # Load multiple SKUs
 # ----------------------------
-sales = pd.read_csv(cfg["data"]["path"])
-d_cols = [c for c in sales.columns if c.startswith("d_")]
+store = DemandStore.open_or_convert(cfg["data"]["store"], cfg["data"]["path"])
 
-subset = sales.sample(cfg["data"]["num_skus"], random_state=42)
-demand_matrix = subset[d_cols].values.astype(float)
+rows = store.sample(cfg["data"]["num_skus"], seed=42)
 
 
 # ----------------------------
 # Policy factory
 # ----------------------------
-def make_policy():
+def make_policy(n_skus):
     p = cfg["policy"]
 
     if p["type"] == "sS":
@@ -41,7 +39,8 @@ def make_policy():
         return BaseStockPolicy(p["base_stock_level"])
 
     if p["type"] == "fcio":
-        return FCIOPolicy(
+        return FCIOFleetPolicy(
+            n_skus,
             base_stock_level=p["base_stock_level"],
             reorder_point=p["reorder_point"],
             alpha=p["alpha"],
@@ -60,34 +59,36 @@ def make_policy():
 # ----------------------------
 # Init systems
 # ----------------------------
-N, T = demand_matrix.shape
-
-systems = [InventorySystem(cfg["system"]["initial_inventory"]) for _ in range(N)]
-policies = [make_policy() for _ in range(N)]
-
 cost_model = CostModel(**cfg["cost"])
-perf = PerformanceMetrics()
-stab = StabilityMetrics(LyapunovExponentEstimator())
+simulator = BatchInventorySimulator(
+    cfg["system"]["initial_inventory"], cost_model, relative_accuracy=0.01
+)
 
 
 # ----------------------------
-# Simulation
+# Simulation, one block of SKUs at a time
 # ----------------------------
-for t in range(T):
-    demands = demand_matrix[:, t]
-
-    for i in range(N):
-        if hasattr(policies[i], "observe"):
-            policies[i].observe(demands[i])
-
-    for i in range(N):
-        q = policies[i].order(systems[i].I)
-        inv = systems[i].step(demands[i], q)
-        cost = cost_model.compute(inv, q)
-
-        perf.update(demands[i], inv, cost)
-        stab.update(inv)
-
-
-print("Performance:", perf.results())
-print("Stability:", stab.results())
+performance = None
+stability = None
+
+for block in iter_blocks(store, block_rows=cfg["data"]["block_rows"], rows=rows):
+    res = simulator.run(block.data, make_policy(len(block.rows)))
+
+    stab = BatchStabilityMetrics(
+        len(block.rows), LyapunovExponentEstimator(), relative_accuracy=0.01
+    )
+    stab.update_block(res["inventory"])
+
+    # Blocks reduce into one accumulator each, in catalogue order
+    if performance is None:
+        performance, stability = simulator.performance, stab
+    else:
+        performance.merge(simulator.performance)
+        stability.merge(stab)
+
+quantile_levels = [0.05, 0.5, 0.95]
+
+print("Performance:", performance.aggregate())
+print("Stability:", stability.aggregate())
+print("Cost quantiles:", performance.quantiles(quantile_levels)["cost"])
+print("Inventory quantiles:", stability.quantiles(quantile_levels)["inventory"])
@@ -1,11 +1,11 @@
 import yaml
-import pandas as pd
 from pathlib import Path
 
 from chaotic_inventory_opt.control.classical import sSPolicy, BaseStockPolicy
 from chaotic_inventory_opt.control.fcio import FCIOPolicy
 from chaotic_inventory_opt.core.inventory_system import InventorySystem
 from chaotic_inventory_opt.core.cost import CostModel
+from chaotic_inventory_opt.data.store import DemandStore
 from chaotic_inventory_opt.evaluation.performance import PerformanceMetrics
 from chaotic_inventory_opt.evaluation.stability import StabilityMetrics
 from chaotic_inventory_opt.chaos.lyapunov import LyapunovExponentEstimator
@@ -24,13 +24,8 @@ with open(CONFIG_PATH) as f:
 # Load demand (M5)
 # ----------------------------
 def load_m5(item_id, store_id):
-    sales = pd.read_csv(cfg["data"]["path"])
-    row = sales[
-        (sales["item_id"] == item_id) &
-        (sales["store_id"] == store_id)
-    ]
-    d_cols = [c for c in row.columns if c.startswith("d_")]
-    return row[d_cols].values.flatten().astype(float)
+    store = DemandStore.open_or_convert(cfg["data"]["store"], cfg["data"]["path"])
+    return store.get(item_id, store_id).astype(float)
 
 
 demand = load_m5(cfg["data"]["item_id"], cfg["data"]["store_id"])
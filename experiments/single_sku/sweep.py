@@ -0,0 +1,62 @@
+import yaml
+import numpy as np
+from pathlib import Path
+
+from chaotic_inventory_opt.core.cost import CostModel
+from chaotic_inventory_opt.data.store import DemandStore
+from chaotic_inventory_opt.evaluation.sweep import FCIOSweep
+
+
+# ----------------------------
+# Load config
+# ----------------------------
+CONFIG_PATH = Path(__file__).parents[1] / "configs" / "sweep.yaml"
+
+with open(CONFIG_PATH) as f:
+    cfg = yaml.safe_load(f)
+
+
+# ----------------------------
+# Load demand once (M5)
+# ----------------------------
+def load_m5(item_id, store_id):
+    store = DemandStore.open_or_convert(cfg["data"]["store"], cfg["data"]["path"])
+    return store.get(item_id, store_id).astype(float)
+
+
+demand = load_m5(cfg["data"]["item_id"], cfg["data"]["store_id"])
+
+
+# ----------------------------
+# Sweep
+# ----------------------------
+sweep = FCIOSweep(
+    demand,
+    CostModel(**cfg["cost"]),
+    cfg["system"]["initial_inventory"],
+    base_params=cfg["base"],
+)
+
+res = sweep.run(
+    cfg["grid"],
+    output_path=cfg["sweep"]["output"],
+    n_jobs=cfg["sweep"]["n_jobs"],
+    chunk_size=cfg["sweep"]["chunk_size"],
+)
+
+
+# ----------------------------
+# Pareto frontier
+# ----------------------------
+front = np.flatnonzero(res["pareto"])
+front = front[np.argsort(res["total_cost"][front])]
+
+print(f"Evaluated {len(res['index'])} combinations")
+print("Pareto frontier (cost vs service level):")
+for i in front:
+    params = {p: res[p][i].item() for p in cfg["grid"]}
+    print(
+        f"  cost={res['total_cost'][i]:.1f} "
+        f"service={res['service_level'][i]:.4f} "
+        f"{params}"
+    )
@@ -5,12 +5,13 @@ This module provides quantitative measures of instability,
 unpredictability, and nonlinear dynamics in time series.
 """
 
-from .lyapunov import LyapunovExponentEstimator
+from .lyapunov import LyapunovExponentEstimator, StreamingLyapunovEstimator
 from .entropy import SampleEntropy
 from .recurrence import RecurrenceAnalyzer
 
 __all__ = [
     "LyapunovExponentEstimator",
+    "StreamingLyapunovEstimator",
     "SampleEntropy",
     "RecurrenceAnalyzer",
 ]
@@ -1,15 +1,33 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.spatial import cKDTree
+
+from chaotic_inventory_opt.utils.rolling import rolling_window
 
 
 class SampleEntropy:
     """
     Sample entropy estimator for time series complexity.
+
+    Template matches are counted with Chebyshev-distance range
+    queries instead of an all-pairs scan:
+
+    - ``"kdtree"``: dual-tree counting with ``scipy.spatial.cKDTree``
+    - ``"sorted"``: templates sorted on their first coordinate and
+      candidate pairs checked in chunks of bounded size
+
+    Both engines count exactly the same pairs, so the result does
+    not depend on the method. When distinct values are at least r
+    apart (e.g. integer unit sales with r < 1) a match can only be
+    an exact repeat, and templates are counted with ``np.unique``.
     """
 
     def __init__(
         self,
         m: int = 2,
         r_ratio: float = 0.2,
+        method: str = "kdtree",
+        chunk_size: int = 1_000_000,
     ):
         """
         Parameters
@@ -19,9 +37,21 @@ class SampleEntropy:
 
         r_ratio : float
             Tolerance as a fraction of series standard deviation
+
+        method : str
+            Neighbor counting engine, ``"kdtree"`` or ``"sorted"``
+
+        chunk_size : int
+            Maximum number of candidate pairs held in memory at once
+            by the ``"sorted"`` engine
         """
+        if method not in ("kdtree", "sorted"):
+            raise ValueError("method must be 'kdtree' or 'sorted'")
+
         self.m = m
         self.r_ratio = r_ratio
+        self.method = method
+        self.chunk_size = chunk_size
 
     def estimate(self, series) -> float:
         """
@@ -44,18 +74,150 @@ class SampleEntropy:
 
         r = self.r_ratio * np.std(x)
 
-        def _count(m):
-            patterns = np.array([x[i:i + m] for i in range(N - m)])
-            count = 0
-            for i in range(len(patterns)):
-                dist = np.max(np.abs(patterns - patterns[i]), axis=1)
-                count += np.sum(dist < r) - 1
-            return count
+        values = np.unique(x)
+        lattice = len(values) < 2 or np.min(np.diff(values)) >= r
 
-        Cm = _count(self.m)
-        Cm1 = _count(self.m + 1)
+        Cm = self._count(x, self.m, r, lattice)
+        Cm1 = self._count(x, self.m + 1, r, lattice)
 
         if Cm == 0 or Cm1 == 0:
             return 0.0
 
         return float(-np.log(Cm1 / Cm))
+
+    def estimate_rolling(self, series, window: int, step: int = 1) -> np.ndarray:
+        """
+        Sample entropy of every sliding window of a series.
+
+        Windows are zero-copy rows of ``rolling_window``. Template
+        matches of many windows are counted together with dense
+        (windows, templates, templates) comparisons, in blocks of at
+        most ``chunk_size`` pairs; windows too long for that fall
+        back to ``estimate`` one by one.
+
+        Parameters
+        ----------
+        series : array-like
+            Time series data
+
+        window : int
+            Window length
+
+        step : int
+            Offset between consecutive windows
+
+        Returns
+        -------
+        np.ndarray
+            Estimate for the window starting at i * step, one per window
+        """
+        windows = rolling_window(series, window, step)
+        out = np.zeros(len(windows))
+
+        if len(windows) == 0 or window <= self.m + 1:
+            return out
+
+        n = window - self.m
+        if n * n > self.chunk_size:
+            return np.fromiter(
+                (self.estimate(w) for w in windows), dtype=float, count=len(windows)
+            )
+
+        r = self.r_ratio * windows.std(axis=1)
+        rows = max(1, self.chunk_size // (n * n))
+
+        for start in range(0, len(windows), rows):
+            block = windows[start:start + rows]
+            rb = r[start:start + rows]
+
+            Cm = _count_dense(block, self.m, rb)
+            Cm1 = _count_dense(block, self.m + 1, rb)
+
+            ok = (Cm != 0) & (Cm1 != 0)
+            ratio = np.where(ok, Cm1, 1) / np.where(ok, Cm, 1)
+            out[start:start + len(block)] = np.where(ok, -np.log(ratio), 0.0)
+
+        return out
+
+    def _count(self, x, m, r, lattice=False) -> int:
+        """
+        Number of ordered template pairs (i != j) closer than r.
+
+        Templates are x[i:i + m] for i in range(len(x) - m).
+        Self-matches are subtracted even when r == 0, as in the
+        reference definition.
+        """
+        templates = sliding_window_view(x, m)[:len(x) - m]
+        n = len(templates)
+
+        if r > 0:
+            if lattice:
+                # + 0.0 folds -0.0 into 0.0 before byte-wise uniqueness
+                _, counts = np.unique(templates + 0.0, axis=0, return_counts=True)
+                pairs = int(np.dot(counts, counts))
+            elif self.method == "kdtree":
+                pairs = _count_kdtree(templates, r)
+            else:
+                pairs = _count_sorted(templates, r, self.chunk_size)
+        else:
+            pairs = 0
+
+        return pairs - n
+
+
+def _count_dense(windows, m, r) -> np.ndarray:
+    """
+    ``SampleEntropy._count`` for every row of ``windows``, with
+    per-row tolerances r, by comparing all template pairs.
+    """
+    n = windows.shape[1] - m
+    templates = sliding_window_view(windows, m, axis=1)[:, :n]
+    tol = np.asarray(r)[:, None, None]
+
+    match = np.ones((len(windows), n, n), dtype=bool)
+    for k in range(m):
+        t = templates[:, :, k]
+        match &= np.abs(t[:, :, None] - t[:, None, :]) < tol
+
+    return np.count_nonzero(match, axis=(1, 2)) - n
+
+
+def _count_kdtree(templates, r) -> int:
+    tree = cKDTree(templates)
+    # count_neighbors uses d <= r; shrink r by one ulp for d < r
+    r_strict = np.nextafter(r, 0.0)
+    return int(tree.count_neighbors(tree, r_strict, p=np.inf))
+
+
+def _count_sorted(templates, r, chunk_size) -> int:
+    order = np.argsort(templates[:, 0], kind="stable")
+    T = templates[order]
+    col = T[:, 0]
+
+    # Slightly widened candidate range; matches are checked exactly below
+    pad = 4 * np.spacing(max(float(np.max(np.abs(col))), r))
+    lo = np.searchsorted(col, col - r - pad, side="left")
+    hi = np.searchsorted(col, col + r + pad, side="right")
+    cand = hi - lo
+    ends = np.cumsum(cand)
+
+    count = 0
+    start = 0
+    n = len(T)
+
+    while start < n:
+        base = ends[start - 1] if start else 0
+        stop = int(np.searchsorted(ends, base + chunk_size, side="right"))
+        stop = min(max(stop, start + 1), n)
+
+        sizes = cand[start:stop]
+        i = np.repeat(np.arange(start, stop), sizes)
+        offsets = np.arange(len(i)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        j = lo[i] + offsets
+
+        dist = np.max(np.abs(T[i] - T[j]), axis=1)
+        count += int(np.count_nonzero(dist < r))
+
+        start = stop
+
+    return count
@@ -1,5 +1,10 @@
+import math
+
 import numpy as np
 
+from chaotic_inventory_opt.utils.ring import RingBuffer
+from chaotic_inventory_opt.utils.rolling import window_starts, window_sums
+
 
 class LyapunovExponentEstimator:
     """
@@ -51,3 +56,172 @@ class LyapunovExponentEstimator:
             return 0.0
 
         return float(np.mean(np.log(diffs + self.eps)))
+
+    def estimate_batch(self, windows) -> np.ndarray:
+        """
+        Estimate the largest Lyapunov exponent for many series at once.
+
+        Parameters
+        ----------
+        windows : array-like
+            2-D array of shape (N, window), one series per row
+
+        Returns
+        -------
+        np.ndarray
+            Estimated exponents of shape (N,)
+        """
+        X = np.asarray(windows, dtype=float)
+        if X.ndim != 2:
+            raise ValueError("windows must be a 2-D array")
+
+        if X.shape[1] < 50:
+            return np.zeros(X.shape[0])
+
+        diffs = np.abs(np.diff(X, axis=1))
+        lam = np.mean(np.log(diffs + self.eps), axis=1)
+
+        return np.where(np.any(diffs != 0, axis=1), lam, 0.0)
+
+    def estimate_rolling(self, series, window: int, step: int = 1) -> np.ndarray:
+        """
+        Lyapunov exponent of every sliding window of a series.
+
+        Log-differences are computed once and averaged per window
+        with a cumulative sum, so all windows cost O(T).
+
+        Parameters
+        ----------
+        series : array-like
+            Time series data
+
+        window : int
+            Window length
+
+        step : int
+            Offset between consecutive windows
+
+        Returns
+        -------
+        np.ndarray
+            Estimate for the window starting at i * step, one per window
+        """
+        x = np.asarray(series, dtype=float)
+        starts = window_starts(len(x), window, step)
+
+        if window < 50 or len(starts) == 0:
+            return np.zeros(len(starts))
+
+        diffs = np.abs(np.diff(x))
+        log_diffs = np.log(diffs + self.eps)
+
+        lam = window_sums(log_diffs, starts, window - 1) / (window - 1)
+        nonzero = window_sums(diffs != 0, starts, window - 1)
+
+        return np.where(nonzero > 0, lam, 0.0)
+
+
+class StreamingLyapunovEstimator(LyapunovExponentEstimator):
+    """
+    Streaming largest-Lyapunov-exponent estimator over a sliding window.
+
+    Keeps a ring buffer of log-differences and their running sum so
+    that each ``push`` costs O(1). ``value()`` returns the same
+    estimate as ``LyapunovExponentEstimator.estimate`` on the window.
+    """
+
+    def __init__(
+        self,
+        window: int = 50,
+        min_neighbors: int = 5,
+        eps: float = 1e-8,
+    ):
+        """
+        Parameters
+        ----------
+        window : int
+            Number of most recent samples the estimate covers
+
+        min_neighbors : int
+            Minimum number of neighbors used in divergence estimation
+
+        eps : float
+            Small constant to avoid log(0)
+        """
+        super().__init__(min_neighbors=min_neighbors, eps=eps)
+
+        if window < 2:
+            raise ValueError("window must be >= 2")
+
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the window and running sums.
+        """
+        self._log_diffs = RingBuffer(self.window - 1)
+        self._nonzero = RingBuffer(self.window - 1, dtype=bool)
+        self._last = None
+        self._sum = 0.0
+        self._nonzero_count = 0
+        self._pushes = 0
+
+    def restore(self, values):
+        """
+        Rebuild the state from the most recent samples.
+
+        Equivalent (up to rounding) to ``reset`` followed by pushing
+        the last ``window`` of ``values``.
+        """
+        self.reset()
+        x = np.asarray(values, dtype=float)[-self.window:]
+        if not len(x):
+            return
+
+        diff = np.abs(np.diff(x))
+        log_diffs = np.log(diff + self.eps)
+
+        self._log_diffs.fill(log_diffs)
+        self._nonzero.fill(diff != 0)
+        self._sum = float(np.sum(log_diffs))
+        self._nonzero_count = int(np.count_nonzero(diff))
+        self._last = float(x[-1])
+
+    def push(self, value: float):
+        """
+        Add one sample, evicting the oldest once the window is full.
+        """
+        value = float(value)
+
+        if self._last is not None:
+            diff = abs(value - self._last)
+            log_diff = math.log(diff + self.eps)
+
+            if self._log_diffs.full:
+                self._sum -= self._log_diffs.view()[0]
+                self._nonzero_count -= int(self._nonzero.view()[0])
+
+            self._log_diffs.append(log_diff)
+            self._nonzero.append(diff != 0)
+            self._sum += log_diff
+            self._nonzero_count += int(diff != 0)
+
+            self._pushes += 1
+            if self._pushes % self._log_diffs.capacity == 0:
+                # Exact refresh of the running sum to bound rounding drift
+                self._sum = float(np.sum(self._log_diffs.view()))
+
+        self._last = value
+
+    def __len__(self) -> int:
+        return len(self._log_diffs) + (self._last is not None)
+
+    def value(self) -> float:
+        """
+        Lyapunov exponent of the current window.
+        """
+        if len(self) < 50 or self._nonzero_count == 0:
+            return 0.0
+
+        return self._sum / len(self._log_diffs)
@@ -6,6 +6,11 @@ class RecurrenceAnalyzer:
     Recurrence Quantification Analysis (RQA).
 
     Computes recurrence-based chaos metrics.
+
+    Only ``recurrence_matrix`` materializes the N x N matrix;
+    the recurrence rate is counted from sorted values and the
+    line-based measures stream over tiles of diagonals/columns,
+    so memory stays O(N * tile).
     """
 
     def __init__(
@@ -20,7 +25,10 @@ class RecurrenceAnalyzer:
         """
         self.threshold_ratio = threshold_ratio
 
-    def recurrence_matrix(self, series):
+    def _threshold(self, x) -> float:
+        return self.threshold_ratio * np.std(x)
+
+    def recurrence_matrix(self, series, packed: bool = False, block_size: int = 1024):
         """
         Compute recurrence matrix.
 
@@ -28,29 +36,220 @@ class RecurrenceAnalyzer:
         ----------
         series : array-like
 
+        packed : bool
+            If True, return the matrix bit-packed along rows
+            (``np.packbits(R, axis=1)``), built block by block so
+            only ``block_size`` unpacked rows exist at a time
+
+        block_size : int
+            Rows per block in packed mode
+
         Returns
         -------
         np.ndarray
-            Binary recurrence matrix
+            Binary recurrence matrix, or uint8 array of shape
+            (N, ceil(N / 8)) when ``packed``
         """
         x = np.asarray(series, dtype=float)
         N = len(x)
 
+        if packed:
+            out = np.zeros((N, (N + 7) // 8), dtype=np.uint8)
+            for start, block in self.recurrence_blocks(x, block_size):
+                out[start:start + len(block)] = np.packbits(block, axis=1)
+            return out
+
         if N < 10:
             return np.zeros((N, N))
 
-        eps = self.threshold_ratio * np.std(x)
+        eps = self._threshold(x)
         dist = np.abs(x[:, None] - x[None, :])
 
         return (dist < eps).astype(int)
 
+    def recurrence_blocks(self, series, block_size: int = 1024):
+        """
+        Iterate over row blocks of the recurrence matrix.
+
+        Yields
+        ------
+        tuple
+            (row_start, boolean block of shape (rows, N))
+        """
+        x = np.asarray(series, dtype=float)
+        N = len(x)
+        eps = self._threshold(x) if N >= 10 else 0.0
+
+        for start in range(0, N, block_size):
+            rows = x[start:start + block_size]
+            yield start, np.abs(rows[:, None] - x[None, :]) < eps
+
     def recurrence_rate(self, series) -> float:
         """
         Recurrence rate (RR).
 
-        Fraction of recurrent points.
+        Fraction of recurrent points, counted in O(N log N)
+        without building the matrix.
         """
-        R = self.recurrence_matrix(series)
-        if R.size == 0:
+        x = np.asarray(series, dtype=float)
+        N = len(x)
+
+        if N < 10:
+            return 0.0
+
+        eps = self._threshold(x)
+        if eps <= 0:
             return 0.0
-        return float(np.sum(R) / R.size)
+
+        counts = _neighbor_counts(np.sort(x), eps)
+        return float(np.sum(counts) / (N * N))
+
+    def rqa(
+        self,
+        series,
+        l_min: int = 2,
+        theiler: int = 1,
+        tile: int = 256,
+    ) -> dict:
+        """
+        Line-based recurrence quantification measures.
+
+        Diagonal lines are collected by streaming over tiles of
+        diagonals and vertical lines over tiles of columns, so the
+        full matrix is never held in memory.
+
+        Parameters
+        ----------
+        series : array-like
+
+        l_min : int
+            Minimum line length counted as a line
+
+        theiler : int
+            Points with |i - j| < theiler are excluded from line
+            measures (1 excludes the main diagonal)
+
+        tile : int
+            Number of diagonals/columns processed per tile
+
+        Returns
+        -------
+        dict
+            recurrence_rate, determinism, laminarity and
+            mean_diagonal_line
+        """
+        x = np.asarray(series, dtype=float)
+        N = len(x)
+
+        out = {
+            "recurrence_rate": self.recurrence_rate(x),
+            "determinism": 0.0,
+            "laminarity": 0.0,
+            "mean_diagonal_line": 0.0,
+        }
+
+        eps = self._threshold(x) if N >= 10 else 0.0
+        if eps <= 0:
+            return out
+
+        theiler = max(theiler, 0)
+
+        # Diagonals k and -k are mirror images; count k > 0 twice
+        total = 0
+        diag_points = 0
+        diag_lines = 0
+
+        for k0 in range(max(theiler, 1), N, tile):
+            ks = np.arange(k0, min(k0 + tile, N))
+            i = np.arange(N)
+            j = i[None, :] + ks[:, None]
+            valid = j < N
+            block = np.zeros(j.shape, dtype=bool)
+            block[valid] = np.abs(
+                np.broadcast_to(x, j.shape)[valid] - x[j[valid]]
+            ) < eps
+
+            lengths = _run_lengths(block)
+            long = lengths[lengths >= l_min]
+            total += 2 * int(lengths.sum())
+            diag_points += 2 * int(long.sum())
+            diag_lines += 2 * len(long)
+
+        if theiler == 0:
+            lengths = _run_lengths((np.zeros(N) < eps)[None, :])
+            long = lengths[lengths >= l_min]
+            total += int(lengths.sum())
+            diag_points += int(long.sum())
+            diag_lines += len(long)
+
+        vert_points = 0
+        idx = np.arange(N)
+
+        for j0 in range(0, N, tile):
+            cols = np.arange(j0, min(j0 + tile, N))
+            block = np.abs(x[cols][:, None] - x[None, :]) < eps
+            if theiler > 0:
+                block &= np.abs(cols[:, None] - idx[None, :]) >= theiler
+
+            lengths = _run_lengths(block)
+            vert_points += int(lengths[lengths >= l_min].sum())
+
+        if total > 0:
+            out["determinism"] = diag_points / total
+            out["laminarity"] = vert_points / total
+        if diag_lines > 0:
+            out["mean_diagonal_line"] = diag_points / diag_lines
+
+        return out
+
+
+def _neighbor_counts(s, eps) -> np.ndarray:
+    """
+    For sorted s, count j with |s[i] - s[j]| < eps for every i.
+
+    Since s is sorted the matching j form a contiguous range around
+    i; both ends are located by a vectorized binary search on the
+    exact predicate, so ties at the threshold match the dense matrix.
+    """
+    n = len(s)
+    i = np.arange(n)
+
+    # Right end: first j >= i with s[j] - s[i] >= eps
+    lo, hi = i + 1, np.full(n, n)
+    while True:
+        active = lo < hi
+        if not active.any():
+            break
+        mid = (lo + hi) // 2
+        ok = np.zeros(n, dtype=bool)
+        ok[active] = (s[mid[active]] - s[active]) < eps
+        lo = np.where(active & ok, mid + 1, lo)
+        hi = np.where(active & ~ok, mid, hi)
+    right = lo
+
+    # Left end: first j <= i with s[i] - s[j] < eps
+    lo, hi = np.zeros(n, dtype=int), i.copy()
+    while True:
+        active = lo < hi
+        if not active.any():
+            break
+        mid = (lo + hi) // 2
+        ok = np.zeros(n, dtype=bool)
+        ok[active] = (s[active] - s[mid[active]]) < eps
+        hi = np.where(active & ok, mid, hi)
+        lo = np.where(active & ~ok, mid + 1, lo)
+    left = lo
+
+    return right - left
+
+
+def _run_lengths(block) -> np.ndarray:
+    """
+    Lengths of all runs of True along the rows of a boolean block.
+    """
+    padded = np.zeros((block.shape[0], block.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = block
+    edges = np.diff(padded, axis=1)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return ends - starts
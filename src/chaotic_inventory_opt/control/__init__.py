@@ -5,14 +5,24 @@ This module defines classical and chaos-aware inventory
 control laws.
 """
 
+from .base import BatchPolicy
 from .classical import EOQPolicy, BaseStockPolicy, sSPolicy
+from .plan import OrderPlan
 from .fcio import FCIOPolicy
+from .refresh import RefreshSchedule
 from .network import NetworkFCIOPolicy
+from .state import FCIOFleetState
+from .fleet import FCIOFleetPolicy
 
 __all__ = [
+    "BatchPolicy",
     "EOQPolicy",
     "BaseStockPolicy",
     "sSPolicy",
+    "OrderPlan",
     "FCIOPolicy",
+    "RefreshSchedule",
     "NetworkFCIOPolicy",
+    "FCIOFleetState",
+    "FCIOFleetPolicy",
 ]
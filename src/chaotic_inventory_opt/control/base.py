@@ -0,0 +1,54 @@
+from typing import Protocol, runtime_checkable
+
+import numpy as np
+
+
+@runtime_checkable
+class BatchPolicy(Protocol):
+    """
+    Array-native inventory policy.
+
+    A batched policy holds its parameters as per-SKU arrays (or
+    scalars shared by all SKUs) and computes the orders of every
+    SKU in a single call. Stateful policies may additionally expose
+    ``observe_batch(demand)``.
+    """
+
+    def order_batch(self, inventory: np.ndarray) -> np.ndarray:
+        """
+        Compute orders for all SKUs.
+
+        Parameters
+        ----------
+        inventory : np.ndarray
+            Inventory levels of shape (N,)
+
+        Returns
+        -------
+        np.ndarray
+            Order quantities of shape (N,)
+        """
+        ...
+
+
+def as_param(value):
+    """
+    Convert a policy parameter to a float or a float array.
+    """
+    if np.ndim(value) == 0:
+        return float(value)
+    return np.asarray(value, dtype=float)
+
+
+def check_scalar_params(policy, *names):
+    """
+    Raise if any of the named parameters of a policy is per-SKU.
+
+    Policies built with per-SKU array parameters are batch-only:
+    their scalar ``order`` cannot tell which SKU it is called for.
+    """
+    for name in names:
+        if isinstance(getattr(policy, name), np.ndarray):
+            raise ValueError(
+                f"{type(policy).__name__} has per-SKU parameters; use order_batch"
+            )
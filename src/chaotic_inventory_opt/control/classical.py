@@ -1,53 +1,92 @@
+import numpy as np
+
+from chaotic_inventory_opt.control.base import as_param, check_scalar_params
+
+
 class EOQPolicy:
     """
     Economic Order Quantity (EOQ) policy.
 
     Assumes deterministic average demand.
+
+    ``order_quantity`` may be a scalar or a per-SKU array; with an
+    array the policy is batch-only and ``order`` raises ValueError.
     """
 
-    def __init__(self, order_quantity: float):
-        self.Q = float(order_quantity)
+    def __init__(self, order_quantity):
+        self.Q = as_param(order_quantity)
 
     def order(self, inventory: float) -> float:
         """
         EOQ places a fixed order when inventory is depleted.
         """
+        check_scalar_params(self, "Q")
         if inventory <= 0:
             return self.Q
         return 0.0
 
+    def order_batch(self, inventory: np.ndarray) -> np.ndarray:
+        """
+        Vectorized ``order`` over all SKUs.
+        """
+        inventory = np.asarray(inventory, dtype=float)
+        return np.where(inventory <= 0, self.Q, 0.0)
+
 
 class BaseStockPolicy:
     """
     Base-stock (order-up-to) policy.
+
+    ``base_stock_level`` may be a scalar or a per-SKU array; with an
+    array the policy is batch-only and ``order`` raises ValueError.
     """
 
-    def __init__(self, base_stock_level: float):
-        self.S = float(base_stock_level)
+    def __init__(self, base_stock_level):
+        self.S = as_param(base_stock_level)
 
     def order(self, inventory: float) -> float:
         """
         Order up to the base-stock level.
         """
+        check_scalar_params(self, "S")
         return max(0.0, self.S - inventory)
 
+    def order_batch(self, inventory: np.ndarray) -> np.ndarray:
+        """
+        Vectorized ``order`` over all SKUs.
+        """
+        inventory = np.asarray(inventory, dtype=float)
+        return np.maximum(0.0, self.S - inventory)
+
 
 class sSPolicy:
     """
     (s,S) reorder point policy.
+
+    ``reorder_point`` and ``order_up_to`` may be scalars or per-SKU
+    arrays; with arrays the policy is batch-only and ``order``
+    raises ValueError.
     """
 
-    def __init__(self, reorder_point: float, order_up_to: float):
-        if order_up_to <= reorder_point:
+    def __init__(self, reorder_point, order_up_to):
+        if np.any(np.asarray(order_up_to) <= np.asarray(reorder_point)):
             raise ValueError("S must be greater than s")
 
-        self.s = float(reorder_point)
-        self.S = float(order_up_to)
+        self.s = as_param(reorder_point)
+        self.S = as_param(order_up_to)
 
     def order(self, inventory: float) -> float:
         """
         Place order if inventory drops below s.
         """
+        check_scalar_params(self, "s", "S")
         if inventory < self.s:
             return self.S - inventory
         return 0.0
+
+    def order_batch(self, inventory: np.ndarray) -> np.ndarray:
+        """
+        Vectorized ``order`` over all SKUs.
+        """
+        inventory = np.asarray(inventory, dtype=float)
+        return np.where(inventory < self.s, self.S - inventory, 0.0)
@@ -1,10 +1,47 @@
 import math
-from chaotic_inventory_opt.fractal.hurst import HurstEstimator
-from chaotic_inventory_opt.chaos.lyapunov import LyapunovExponentEstimator
+
+import numpy as np
+
+from chaotic_inventory_opt.fractal.hurst import IncrementalHurstEstimator
+from chaotic_inventory_opt.chaos.lyapunov import StreamingLyapunovEstimator
+from chaotic_inventory_opt.control.refresh import RefreshSchedule
 from chaotic_inventory_opt.regimes.classifier import RegimeClassifier, Regime
+from chaotic_inventory_opt.utils.ring import RingBuffer, RollingMean
+
+
+# Number of recent H/λ estimates averaged by the order rule
+SMOOTHING_STEPS = 5
 
 
 class FCIOPolicy:
+    # Thousands of instances are held per network; slots keep each
+    # one to its fixed set of fields
+    __slots__ = (
+        "S0",
+        "s",
+        "alpha",
+        "beta",
+        "scale_min",
+        "scale_max",
+        "rho",
+        "gamma",
+        "k_cap",
+        "window",
+        "hurst",
+        "lyapunov",
+        "regime_classifier",
+        "_demand_buffer",
+        "_H_hist",
+        "_lam_hist",
+        "_backlog",
+        "refresh",
+        "audit",
+        "_H_raw",
+        "_lam_raw",
+        "_H_fresh",
+        "_lam_fresh",
+    )
+
     def __init__(
         self,
         base_stock_level: float,
@@ -20,6 +57,9 @@ class FCIOPolicy:
         hurst_estimator=None,
         lyapunov_estimator=None,
         regime_classifier=None,
+        refresh_every: int = 1,
+        drift_threshold: float | None = None,
+        audit: bool = False,
     ):
         self.S0 = float(base_stock_level)
         self.s = float(reorder_point)
@@ -35,36 +75,133 @@ class FCIOPolicy:
 
         self.window = window
 
-        self.hurst = hurst_estimator or HurstEstimator()
-        self.lyapunov = lyapunov_estimator or LyapunovExponentEstimator()
+        # Streaming estimators (exposing ``push``) are fed from
+        # ``observe`` and must cover the same window as the policy.
+        # They may define ``__len__`` (empty ones are falsy), so test for None
+        if hurst_estimator is None:
+            hurst_estimator = IncrementalHurstEstimator(window=window)
+        self.hurst = hurst_estimator
+        if getattr(self.hurst, "window", window) != window:
+            raise ValueError("hurst_estimator window must match policy window")
+
+        if lyapunov_estimator is None:
+            lyapunov_estimator = StreamingLyapunovEstimator(window=window)
+        self.lyapunov = lyapunov_estimator
+        if getattr(self.lyapunov, "window", window) != window:
+            raise ValueError("lyapunov_estimator window must match policy window")
+
         self.regime_classifier = regime_classifier or RegimeClassifier()
 
-        self._demand_buffer = []
-        self._H_hist = []
-        self._lam_hist = []
+        self._demand_buffer = RingBuffer(window)
+        self._H_hist = RollingMean(SMOOTHING_STEPS)
+        self._lam_hist = RollingMean(SMOOTHING_STEPS)
         self._backlog = 0.0
 
+        # H/λ are re-estimated only when the schedule says so and
+        # reused in between; in audit mode fresh estimates are still
+        # computed to measure the effect on orders
+        self.refresh = RefreshSchedule(refresh_every, drift_threshold)
+        self.audit = audit
+        self._H_raw = 0.5
+        self._lam_raw = 0.0
+        self._H_fresh = RollingMean(SMOOTHING_STEPS) if audit else None
+        self._lam_fresh = RollingMean(SMOOTHING_STEPS) if audit else None
+
+    def get_state(self) -> dict:
+        """
+        Snapshot of the mutable policy state.
+
+        Returns
+        -------
+        dict
+            ``demand`` (recent window, oldest first), ``H_hist`` and
+            ``lam_hist`` (the estimates still used for smoothing),
+            ``backlog``, the cached raw estimates ``H_raw`` and
+            ``lam_raw``, and the refresh schedule state
+            ``refresh_age``, ``refresh_mean`` and ``refresh_std``
+        """
+        refresh = self.refresh.get_state()
+        return {
+            "demand": self._demand_buffer.view().copy(),
+            "H_hist": np.array(self._H_hist.values(), dtype=float),
+            "lam_hist": np.array(self._lam_hist.values(), dtype=float),
+            "backlog": self._backlog,
+            "H_raw": float(self._H_raw),
+            "lam_raw": float(self._lam_raw),
+            "refresh_age": refresh["age"],
+            "refresh_mean": refresh["mean"],
+            "refresh_std": refresh["std"],
+        }
+
+    def set_state(self, state: dict):
+        """
+        Restore a snapshot taken by ``get_state``.
+
+        Streaming estimators are rebuilt from the demand window, so
+        no history has to be re-observed. Orders then continue as
+        without the interruption, up to the rounding of running sums.
+        Snapshots without the cached estimates (``H_raw`` ...)
+        invalidate the cache instead, so with ``refresh_every > 1``
+        the resumed orders are only approximately those of an
+        uninterrupted run. Usage and audit counters of ``refresh``
+        are not part of the snapshot.
+        """
+        demand = np.asarray(state["demand"], dtype=float)
+        self._demand_buffer.fill(demand)
+
+        for est in (self.hurst, self.lyapunov):
+            if hasattr(est, "restore"):
+                est.restore(demand)
+            elif hasattr(est, "push"):
+                est.reset()
+                for d in demand:
+                    est.push(d)
+
+        self._H_hist.fill(state["H_hist"])
+        self._lam_hist.fill(state["lam_hist"])
+        self._backlog = float(state["backlog"])
+
+        if "refresh_age" in state:
+            self._H_raw = float(state["H_raw"])
+            self._lam_raw = float(state["lam_raw"])
+            self.refresh.set_state(
+                {
+                    "age": state["refresh_age"],
+                    "mean": state["refresh_mean"],
+                    "std": state["refresh_std"],
+                }
+            )
+        else:
+            self.refresh.reset()
+        if self.audit:
+            self._H_fresh.fill(state["H_hist"])
+            self._lam_fresh.fill(state["lam_hist"])
+
     def observe(self, demand: float):
         self._demand_buffer.append(float(demand))
-        if len(self._demand_buffer) > self.window:
-            self._demand_buffer.pop(0)
+
+        if hasattr(self.hurst, "push"):
+            self.hurst.push(demand)
+        if hasattr(self.lyapunov, "push"):
+            self.lyapunov.push(demand)
 
         unmet = max(0.0, demand - self._backlog)
         self._backlog = self.rho * self._backlog + unmet
 
-    def order(self, inventory: float) -> float:
-        if len(self._demand_buffer) < 10:
-            return max(0.0, self.S0 - inventory)
-
-        H_raw = self.hurst.estimate(self._demand_buffer)
-        lam_raw = self.lyapunov.estimate(self._demand_buffer)
+    def _estimate(self, window) -> tuple:
+        if hasattr(self.hurst, "push"):
+            H_raw = self.hurst.value()
+        else:
+            H_raw = self.hurst.estimate(window)
 
-        self._H_hist.append(H_raw)
-        self._lam_hist.append(lam_raw)
+        if hasattr(self.lyapunov, "push"):
+            lam_raw = self.lyapunov.value()
+        else:
+            lam_raw = self.lyapunov.estimate(window)
 
-        H = sum(self._H_hist[-5:]) / min(len(self._H_hist), 5)
-        lam = sum(self._lam_hist[-5:]) / min(len(self._lam_hist), 5)
+        return H_raw, lam_raw
 
+    def _order_from(self, H, lam, inventory, avg_demand) -> float:
         raw_scale = math.exp(-self.alpha * lam + self.beta * (H - 0.5))
         scale = min(max(raw_scale, self.scale_min), self.scale_max)
 
@@ -72,7 +209,40 @@ class FCIOPolicy:
 
         effective_inventory = inventory - self.gamma * self._backlog
 
-        avg_demand = sum(self._demand_buffer) / len(self._demand_buffer)
         k = min(self.k_cap, avg_demand / max(self.S0, 1.0))
 
         return max(0.0, k * (S_t - effective_inventory))
+
+    def order(self, inventory: float) -> float:
+        if len(self._demand_buffer) < 10:
+            return max(0.0, self.S0 - inventory)
+
+        window = self._demand_buffer.view()
+        avg_demand = float(window.mean())
+
+        if self.refresh.needs_stats:
+            due = self.refresh.due(avg_demand, float(window.std()))
+        else:
+            due = self.refresh.due()
+
+        if due or self.audit:
+            H_new, lam_new = self._estimate(window)
+        if due:
+            self._H_raw, self._lam_raw = H_new, lam_new
+
+        self._H_hist.append(self._H_raw)
+        self._lam_hist.append(self._lam_raw)
+
+        order = self._order_from(
+            self._H_hist.mean(), self._lam_hist.mean(), inventory, avg_demand
+        )
+
+        if self.audit:
+            self._H_fresh.append(H_new)
+            self._lam_fresh.append(lam_new)
+            fresh = self._order_from(
+                self._H_fresh.mean(), self._lam_fresh.mean(), inventory, avg_demand
+            )
+            self.refresh.record_deviation(order, fresh)
+
+        return order
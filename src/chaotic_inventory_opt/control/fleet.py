@@ -0,0 +1,293 @@
+import numpy as np
+
+from chaotic_inventory_opt.chaos.lyapunov import LyapunovExponentEstimator
+from chaotic_inventory_opt.control.base import as_param
+from chaotic_inventory_opt.control.refresh import RefreshSchedule
+from chaotic_inventory_opt.control.state import FCIOFleetState
+from chaotic_inventory_opt.fractal.hurst import HurstEstimator
+
+
+def _estimator_config(estimator) -> tuple:
+    # Public attributes define the estimates; private ones hold
+    # streaming state or caches
+    params = {
+        k: v for k, v in getattr(estimator, "__dict__", {}).items()
+        if not k.startswith("_")
+    }
+    return type(estimator), repr(sorted(params.items()))
+
+
+class FCIOFleetPolicy:
+    """
+    Vectorized FCIO policy for a fleet of N SKUs.
+
+    Follows ``FCIOPolicy`` SKU by SKU, but parameters are per-SKU
+    arrays (or scalars shared by all SKUs) and the state is an
+    ``FCIOFleetState``. H and λ are estimated for every SKU from the
+    (N, window) demand array with ``estimate_batch``, and all orders
+    are computed with a handful of array operations, so each period
+    costs one Python call instead of N.
+    """
+
+    def __init__(
+        self,
+        n_skus: int,
+        base_stock_level,
+        reorder_point,
+        alpha,
+        beta,
+        scale_min,
+        scale_max,
+        rho,
+        gamma,
+        k_cap,
+        window: int = 50,
+        hurst_estimator=None,
+        lyapunov_estimator=None,
+        dtype=float,
+        refresh_every: int = 1,
+        drift_threshold: float | None = None,
+        audit: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        n_skus : int
+            Number of SKUs
+
+        base_stock_level, reorder_point, alpha, beta, scale_min,
+        scale_max, rho, gamma, k_cap : float or array-like
+            FCIO parameters (see ``FCIOPolicy``), scalar or of shape (N,)
+
+        window : int
+            Demand window used for H and λ
+
+        hurst_estimator : object or None
+            Estimator exposing ``estimate_batch`` (default ``HurstEstimator``)
+
+        lyapunov_estimator : object or None
+            Estimator exposing ``estimate_batch``
+            (default ``LyapunovExponentEstimator``)
+
+        dtype : data-type
+            Element type of the stored demand window
+
+        refresh_every : int
+            Recompute H and λ of a SKU at least every this many periods
+
+        drift_threshold : float or None
+            Also recompute when the window mean/std drifts by more than
+            this fraction (see ``RefreshSchedule``)
+
+        audit : bool
+            Compute fresh estimates every period anyway and record how
+            much the orders deviate from them
+        """
+        params = {
+            "S0": base_stock_level,
+            "s": reorder_point,
+            "alpha": alpha,
+            "beta": beta,
+            "scale_min": scale_min,
+            "scale_max": scale_max,
+            "rho": rho,
+            "gamma": gamma,
+            "k_cap": k_cap,
+        }
+        for name, value in params.items():
+            value = as_param(value)
+            if np.ndim(value) and np.shape(value) != (n_skus,):
+                raise ValueError(f"{name} must be a scalar or of shape ({n_skus},)")
+            setattr(self, name, value)
+
+        self.window = window
+        # Streaming estimators define ``__len__``, so test for None
+        self.hurst = HurstEstimator() if hurst_estimator is None else hurst_estimator
+        self.lyapunov = (
+            LyapunovExponentEstimator()
+            if lyapunov_estimator is None
+            else lyapunov_estimator
+        )
+
+        self.state = FCIOFleetState(n_skus, window, dtype=dtype)
+
+        self.refresh = RefreshSchedule(refresh_every, drift_threshold, n_skus)
+        self.audit = audit
+        self._H_raw = np.full(n_skus, 0.5)
+        self._lam_raw = np.zeros(n_skus)
+        self._fresh = FCIOFleetState(n_skus, 1) if audit else None
+
+    @classmethod
+    def from_policies(cls, policies, dtype=float) -> "FCIOFleetPolicy":
+        """
+        Build a fleet policy from a sequence of ``FCIOPolicy`` objects.
+
+        Parameters are gathered into per-SKU arrays and the policies'
+        state (which must be in lockstep) is carried over. Window,
+        refresh and audit settings, and the configuration of the H
+        and λ estimators, must be shared by all policies.
+        """
+        policies = list(policies)
+
+        def shared(name, get):
+            values = {get(p) for p in policies}
+            if len(values) != 1:
+                raise ValueError(f"all policies must share the same {name}")
+            return values.pop()
+
+        def gather(name):
+            return np.array([getattr(p, name) for p in policies], dtype=float)
+
+        def estimator(name, get):
+            shared(name, lambda p: _estimator_config(get(p)))
+            est = get(policies[0])
+            if not hasattr(est, "estimate_batch"):
+                raise ValueError(f"{name} must expose estimate_batch")
+            return est
+
+        fleet = cls(
+            len(policies),
+            base_stock_level=gather("S0"),
+            reorder_point=gather("s"),
+            alpha=gather("alpha"),
+            beta=gather("beta"),
+            scale_min=gather("scale_min"),
+            scale_max=gather("scale_max"),
+            rho=gather("rho"),
+            gamma=gather("gamma"),
+            k_cap=gather("k_cap"),
+            window=shared("window", lambda p: p.window),
+            hurst_estimator=estimator("hurst_estimator", lambda p: p.hurst),
+            lyapunov_estimator=estimator("lyapunov_estimator", lambda p: p.lyapunov),
+            dtype=dtype,
+            refresh_every=shared("refresh_every", lambda p: p.refresh.every),
+            drift_threshold=shared(
+                "drift_threshold", lambda p: p.refresh.drift_threshold
+            ),
+            audit=shared("audit", lambda p: p.audit),
+        )
+        fleet.restore(FCIOFleetState.capture(policies))
+        return fleet
+
+    def __len__(self) -> int:
+        return len(self.state)
+
+    def observe_batch(self, demand):
+        """
+        Observe a demand vector of shape (N,).
+        """
+        demand = np.asarray(demand, dtype=float)
+        self.state.push_demand(demand)
+
+        backlog = self.state.backlog
+        unmet = np.maximum(0.0, demand - backlog)
+        self.state.backlog = self.rho * backlog + unmet
+
+    def _order_from(self, H, lam, inventory, avg_demand) -> np.ndarray:
+        raw_scale = np.exp(-self.alpha * lam + self.beta * (H - 0.5))
+        scale = np.minimum(np.maximum(raw_scale, self.scale_min), self.scale_max)
+
+        S_t = self.S0 * scale
+
+        effective_inventory = inventory - self.gamma * self.state.backlog
+
+        k = np.minimum(self.k_cap, avg_demand / np.maximum(self.S0, 1.0))
+
+        return np.maximum(0.0, k * (S_t - effective_inventory))
+
+    def order_batch(self, inventory) -> np.ndarray:
+        """
+        Compute the order vector for inventory levels of shape (N,).
+        """
+        inventory = np.asarray(inventory, dtype=float)
+        state = self.state
+
+        if len(state.demand) < 10:
+            return np.maximum(0.0, self.S0 - inventory)
+
+        window = state.demand.view()
+        avg_demand = window.mean(axis=1)
+
+        if self.refresh.needs_stats:
+            due = self.refresh.due(avg_demand, window.std(axis=1))
+        else:
+            due = self.refresh.due()
+
+        if self.audit:
+            H_new = self.hurst.estimate_batch(window)
+            lam_new = self.lyapunov.estimate_batch(window)
+            self._H_raw = np.where(due, H_new, self._H_raw)
+            self._lam_raw = np.where(due, lam_new, self._lam_raw)
+        elif due.all():
+            self._H_raw = self.hurst.estimate_batch(window)
+            self._lam_raw = self.lyapunov.estimate_batch(window)
+        elif due.any():
+            rows = np.flatnonzero(due)
+            self._H_raw[rows] = self.hurst.estimate_batch(window[rows])
+            self._lam_raw[rows] = self.lyapunov.estimate_batch(window[rows])
+
+        state.push_estimates(self._H_raw, self._lam_raw)
+        H, lam = state.smoothed()
+        order = self._order_from(H, lam, inventory, avg_demand)
+
+        if self.audit:
+            self._fresh.push_estimates(H_new, lam_new)
+            H_fresh, lam_fresh = self._fresh.smoothed()
+            fresh = self._order_from(H_fresh, lam_fresh, inventory, avg_demand)
+            self.refresh.record_deviation(order, fresh)
+
+        return order
+
+    def snapshot(self) -> FCIOFleetState:
+        """
+        Copy of the fleet state, including the cached estimates and
+        the refresh schedule state.
+        """
+        state = FCIOFleetState.from_arrays(
+            self.state.to_arrays(), window=self.window, dtype=self.state.dtype
+        )
+        refresh = self.refresh.get_state()
+        state.cache = {
+            "H_raw": self._H_raw.copy(),
+            "lam_raw": self._lam_raw.copy(),
+            "refresh_age": refresh["age"],
+            "refresh_mean": refresh["mean"],
+            "refresh_std": refresh["std"],
+        }
+        return state
+
+    def restore(self, state: FCIOFleetState):
+        """
+        Restore a state taken by ``snapshot`` (or ``FCIOFleetState.capture``).
+
+        Orders continue as without the interruption, up to the
+        rounding of running sums. A state without ``cache``
+        invalidates the cached estimates instead, so with
+        ``refresh_every > 1`` the resumed orders are only
+        approximately those of an uninterrupted run. Usage and audit
+        counters of ``refresh`` are not part of the state.
+        """
+        if len(state) != len(self) or state.window != self.window:
+            raise ValueError("state does not match the fleet size or window")
+
+        self.state = FCIOFleetState.from_arrays(
+            state.to_arrays(), window=self.window, dtype=self.state.dtype
+        )
+
+        cache, self.state.cache = self.state.cache, None
+        if cache is None:
+            self.refresh.reset()
+        else:
+            self._H_raw = cache["H_raw"]
+            self._lam_raw = cache["lam_raw"]
+            self.refresh.set_state(
+                {
+                    "age": cache["refresh_age"],
+                    "mean": cache["refresh_mean"],
+                    "std": cache["refresh_std"],
+                }
+            )
+        if self.audit:
+            arrays = state.to_arrays()
+            arrays["demand"] = arrays["demand"][:, :0]
+            self._fresh = FCIOFleetState.from_arrays(arrays, window=1)
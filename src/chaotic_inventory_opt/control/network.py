@@ -1,19 +1,33 @@
+import numpy as np
+
 from chaotic_inventory_opt.control.fcio import FCIOPolicy
+from chaotic_inventory_opt.control.state import FCIOFleetState
 
 
 class NetworkFCIOPolicy:
     """
     FCIO policy for multi-SKU inventory networks.
+
+    SKUs are assigned a stable index in construction order, which
+    defines the layout of the arrays accepted by ``observe_batch``
+    and returned by ``order_batch``.
     """
 
-    def __init__(self, policies: dict[str, FCIOPolicy]):
+    def __init__(self, policies: dict[str, FCIOPolicy] | list[FCIOPolicy]):
         """
         Parameters
         ----------
-        policies : dict
-            Mapping SKU -> FCIOPolicy
+        policies : dict or list
+            Mapping SKU -> FCIOPolicy, or a list of policies whose
+            position is used as the SKU key
         """
+        if not isinstance(policies, dict):
+            policies = dict(enumerate(policies))
+
         self.policies = policies
+        self.skus = list(policies)
+        self.sku_index = {sku: i for i, sku in enumerate(self.skus)}
+        self._ordered = [policies[sku] for sku in self.skus]
 
     def observe(self, demand_dict: dict[str, float]):
         """
@@ -35,3 +49,33 @@ class NetworkFCIOPolicy:
             orders[sku] = self.policies[sku].order(inventory)
 
         return orders
+
+    def observe_batch(self, demand: np.ndarray):
+        """
+        Observe a demand vector indexed by ``sku_index``.
+        """
+        for policy, d in zip(self._ordered, demand):
+            if hasattr(policy, "observe"):
+                policy.observe(d)
+
+    def order_batch(self, inventory: np.ndarray) -> np.ndarray:
+        """
+        Compute an order vector indexed by ``sku_index``.
+        """
+        return np.fromiter(
+            (p.order(float(i)) for p, i in zip(self._ordered, inventory)),
+            dtype=float,
+            count=len(self._ordered),
+        )
+
+    def snapshot(self) -> FCIOFleetState:
+        """
+        Array-backed state of all SKU policies, indexed by ``sku_index``.
+        """
+        return FCIOFleetState.capture(self._ordered)
+
+    def restore(self, state: FCIOFleetState):
+        """
+        Restore a state taken by ``snapshot``.
+        """
+        state.apply(self._ordered)
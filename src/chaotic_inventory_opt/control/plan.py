@@ -0,0 +1,87 @@
+import numpy as np
+
+
+class OrderPlan:
+    """
+    Precomputed (open-loop) replenishment plan.
+
+    Orders do not depend on inventory, so ``BatchInventorySimulator``
+    evaluates whole trajectories at once through ``plan`` instead of
+    stepping the policy. ``order`` and ``order_batch`` replay the
+    plan one period at a time for per-step engines.
+
+    ``orders`` is either one plan of shape (T,) shared by all SKUs
+    or per-SKU plans of shape (N, T).
+
+    The plan keeps a cursor ``t`` that ``plan``, ``order`` and
+    ``order_batch`` advance. ``BatchInventorySimulator.run`` rewinds
+    it with ``reset`` when it resets the simulation, so repeated runs
+    replay the plan from its first period; ``reset=False`` runs
+    continue from the cursor.
+    """
+
+    open_loop = True
+
+    def __init__(self, orders):
+        """
+        Parameters
+        ----------
+        orders : array-like
+            Order quantities of shape (T,) or (N, T)
+        """
+        self.orders = np.asarray(orders, dtype=float)
+        if self.orders.ndim not in (1, 2):
+            raise ValueError("orders must have shape (T,) or (N, T)")
+
+        self.t = 0
+
+    @property
+    def num_periods(self) -> int:
+        return self.orders.shape[-1]
+
+    def reset(self):
+        """
+        Rewind the plan to its first period.
+        """
+        self.t = 0
+
+    def plan(self, n_skus: int, n_periods: int) -> np.ndarray:
+        """
+        Orders of the next ``n_periods`` periods for ``n_skus`` SKUs.
+
+        Parameters
+        ----------
+        n_skus : int
+            Number of SKUs
+
+        n_periods : int
+            Number of periods
+
+        Returns
+        -------
+        np.ndarray
+            Read-only order matrix of shape (n_skus, n_periods)
+        """
+        stop = self.t + n_periods
+        if stop > self.num_periods:
+            raise ValueError("order plan is shorter than the simulation")
+        if self.orders.ndim == 2 and len(self.orders) != n_skus:
+            raise ValueError("order plan does not match number of SKUs")
+
+        block = self.orders[..., self.t:stop]
+        self.t = stop
+        return np.broadcast_to(block, (n_skus, n_periods))
+
+    def order(self, inventory: float) -> float:
+        """
+        Next planned order of a single-SKU plan.
+        """
+        if self.orders.ndim != 1:
+            raise ValueError("order requires a single-SKU plan")
+        return float(self.plan(1, 1)[0, 0])
+
+    def order_batch(self, inventory: np.ndarray) -> np.ndarray:
+        """
+        Next planned orders of all SKUs.
+        """
+        return self.plan(len(inventory), 1)[:, 0].copy()
@@ -0,0 +1,192 @@
+import numpy as np
+
+
+class RefreshSchedule:
+    """
+    Decides when cached H/λ estimates must be recomputed.
+
+    An estimate is refreshed when it is ``every`` periods old, or,
+    if ``drift_threshold`` is set, as soon as the demand window has
+    drifted since the last refresh:
+
+        max(|mean - mean_0|, |std - std_0|) / (std_0 + 1e-8) > threshold
+
+    where mean_0 and std_0 are the window statistics at the last
+    refresh. All state is elementwise, so one schedule serves a single
+    SKU (scalars) or a fleet (arrays of shape (N,)).
+
+    Usage counters report the cache hit rate, and policies running in
+    audit mode record how far the orders drift from orders computed
+    with fresh estimates every period.
+    """
+
+    def __init__(
+        self,
+        every: int = 1,
+        drift_threshold: float | None = None,
+        n_skus: int | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        every : int
+            Maximum age of an estimate in periods (1 refreshes every call)
+
+        drift_threshold : float or None
+            Relative change of the window mean/std forcing a refresh
+
+        n_skus : int or None
+            Number of SKUs for a fleet, None for a single SKU
+        """
+        if every < 1:
+            raise ValueError("every must be >= 1")
+        if drift_threshold is not None and drift_threshold <= 0:
+            raise ValueError("drift_threshold must be positive")
+
+        self.every = every
+        self.drift_threshold = drift_threshold
+        self.n_skus = n_skus
+        self.reset()
+        self.reset_stats()
+
+    def reset(self):
+        """
+        Invalidate all cached estimates.
+        """
+        if self.n_skus is None:
+            self._age = self.every
+            self._mean = 0.0
+            self._std = 0.0
+        else:
+            self._age = np.full(self.n_skus, self.every)
+            self._mean = np.zeros(self.n_skus)
+            self._std = np.zeros(self.n_skus)
+
+    def get_state(self) -> dict:
+        """
+        Snapshot of the schedule state (not the usage counters).
+
+        Returns
+        -------
+        dict
+            ``age``, ``mean`` and ``std`` of the cached estimates,
+            scalars for a single SKU and arrays of shape (N,) for a
+            fleet
+        """
+        if self.n_skus is None:
+            return {
+                "age": int(self._age),
+                "mean": float(self._mean),
+                "std": float(self._std),
+            }
+        return {
+            "age": np.array(self._age, dtype=np.int64),
+            "mean": np.array(self._mean, dtype=float),
+            "std": np.array(self._std, dtype=float),
+        }
+
+    def set_state(self, state: dict):
+        """
+        Restore a snapshot taken by ``get_state``.
+        """
+        if self.n_skus is None:
+            self._age = int(state["age"])
+            self._mean = float(state["mean"])
+            self._std = float(state["std"])
+            return
+
+        for name in ("age", "mean", "std"):
+            if np.shape(state[name]) != (self.n_skus,):
+                raise ValueError(f"{name} must be of shape ({self.n_skus},)")
+
+        self._age = np.array(state["age"], dtype=np.int64)
+        self._mean = np.array(state["mean"], dtype=float)
+        self._std = np.array(state["std"], dtype=float)
+
+    def reset_stats(self):
+        """
+        Clear the usage and audit counters.
+        """
+        self.calls = 0
+        self.refreshes = 0
+        self.audited = 0
+        self.deviation_sum = 0.0
+        self.deviation_max = 0.0
+
+    @property
+    def needs_stats(self) -> bool:
+        """
+        Whether ``due`` uses the window mean and std.
+        """
+        return self.drift_threshold is not None
+
+    def due(self, mean=None, std=None):
+        """
+        Which estimates must be refreshed this period.
+
+        Marks them as refreshed and ages the others.
+
+        Parameters
+        ----------
+        mean, std : float or np.ndarray or None
+            Current window mean and standard deviation (required
+            when ``drift_threshold`` is set)
+
+        Returns
+        -------
+        bool or np.ndarray
+            Refresh flag, per SKU for a fleet
+        """
+        due = self._age >= self.every
+
+        if self.drift_threshold is not None:
+            drift = np.maximum(
+                np.abs(mean - self._mean), np.abs(std - self._std)
+            ) / (self._std + 1e-8)
+            due = due | (drift > self.drift_threshold)
+
+            self._mean = np.where(due, mean, self._mean)
+            self._std = np.where(due, std, self._std)
+
+        self._age = np.where(due, 1, self._age + 1)
+
+        if self.n_skus is None:
+            due = bool(due)
+            self.calls += 1
+            self.refreshes += due
+        else:
+            self.calls += self.n_skus
+            self.refreshes += int(np.count_nonzero(due))
+
+        return due
+
+    def record_deviation(self, order, fresh_order):
+        """
+        Record |order - fresh_order| for audited orders.
+        """
+        deviation = np.abs(np.asarray(order) - np.asarray(fresh_order))
+        self.audited += deviation.size
+        self.deviation_sum += float(deviation.sum())
+        self.deviation_max = max(self.deviation_max, float(deviation.max(initial=0.0)))
+
+    def stats(self) -> dict:
+        """
+        Cache and audit statistics.
+
+        Returns
+        -------
+        dict
+            ``calls``, ``refreshes``, ``hit_rate`` and, once orders
+            were audited, ``mean_order_deviation`` and
+            ``max_order_deviation`` (NaN otherwise)
+        """
+        audited = self.audited > 0
+        return {
+            "calls": self.calls,
+            "refreshes": self.refreshes,
+            "hit_rate": 1.0 - self.refreshes / self.calls if self.calls else 0.0,
+            "mean_order_deviation": (
+                self.deviation_sum / self.audited if audited else float("nan")
+            ),
+            "max_order_deviation": self.deviation_max if audited else float("nan"),
+        }
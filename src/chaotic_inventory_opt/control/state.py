@@ -0,0 +1,222 @@
+import os
+
+import numpy as np
+
+from chaotic_inventory_opt.control.fcio import SMOOTHING_STEPS
+from chaotic_inventory_opt.utils.ring import RingBuffer2D
+
+
+# Per-SKU cached H/λ estimates and refresh schedule state
+CACHE_FIELDS = ("H_raw", "lam_raw", "refresh_age", "refresh_mean", "refresh_std")
+
+class FCIOFleetState:
+    """
+    Struct-of-arrays state of N FCIO policies observed in lockstep.
+
+    Every per-SKU quantity is a column over the fleet instead of a
+    field of N Python objects:
+
+    - ``demand``: (N, window) ring of recent demand
+    - ``H_hist``, ``lam_hist``: (N, SMOOTHING_STEPS) rings of recent
+      estimates, with running sums ``H_sum`` and ``lam_sum``
+    - ``backlog``: (N,) smoothed unmet demand
+    - ``cache``: dict of (N,) arrays ``CACHE_FIELDS`` holding the raw
+      estimates reused between refreshes and the refresh schedule
+      state, or None if unknown (the cache is then invalidated on
+      restore)
+
+    With ``dtype=np.float32`` the demand window costs 8 bytes per SKU
+    per slot (rings are stored twice for zero-copy views). The whole
+    fleet is saved to a single ``.npz`` file, so a job can warm-start
+    its policies instead of re-observing a demand window.
+    """
+
+    def __init__(self, n_skus: int, window: int, dtype=float):
+        """
+        Parameters
+        ----------
+        n_skus : int
+            Number of policies
+
+        window : int
+            Demand window length of the policies
+
+        dtype : data-type
+            Element type of the demand window
+        """
+        self.dtype = np.dtype(dtype)
+        self.demand = RingBuffer2D(n_skus, window, dtype=dtype)
+        self.H_hist = RingBuffer2D(n_skus, SMOOTHING_STEPS)
+        self.lam_hist = RingBuffer2D(n_skus, SMOOTHING_STEPS)
+        self.H_sum = np.zeros(n_skus)
+        self.lam_sum = np.zeros(n_skus)
+        self.backlog = np.zeros(n_skus)
+        self.cache = None
+        self._pushes = 0
+
+    def __len__(self) -> int:
+        return len(self.backlog)
+
+    @property
+    def window(self) -> int:
+        return self.demand.capacity
+
+    def push_demand(self, demand):
+        """
+        Append one demand vector of shape (N,).
+        """
+        self.demand.append(demand)
+
+    def push_estimates(self, H, lam):
+        """
+        Append one vector of H and λ estimates and update the
+        running sums (refreshed exactly each time the ring wraps).
+        """
+        if self.H_hist.full:
+            self.H_sum -= self.H_hist.view()[:, 0]
+            self.lam_sum -= self.lam_hist.view()[:, 0]
+
+        self.H_hist.append(H)
+        self.lam_hist.append(lam)
+        self.H_sum += H
+        self.lam_sum += lam
+
+        self._pushes += 1
+        if self._pushes % SMOOTHING_STEPS == 0:
+            self.H_sum = self.H_hist.view().sum(axis=1)
+            self.lam_sum = self.lam_hist.view().sum(axis=1)
+
+    def smoothed(self) -> tuple:
+        """
+        Mean of the stored H and λ estimates per SKU.
+        """
+        n = len(self.H_hist)
+        if n == 0:
+            return np.full(len(self), 0.5), np.zeros(len(self))
+        return self.H_sum / n, self.lam_sum / n
+
+    def to_arrays(self) -> dict:
+        """
+        Plain arrays holding the state, histories oldest first.
+        """
+        arrays = {
+            "demand": self.demand.view().copy(),
+            "H_hist": self.H_hist.view().copy(),
+            "lam_hist": self.lam_hist.view().copy(),
+            "backlog": self.backlog.copy(),
+        }
+        if self.cache is not None:
+            arrays.update({name: self.cache[name].copy() for name in CACHE_FIELDS})
+        return arrays
+
+    @classmethod
+    def from_arrays(
+        cls,
+        arrays: dict,
+        window: int | None = None,
+        dtype=None,
+    ) -> "FCIOFleetState":
+        """
+        Build a state from ``to_arrays`` output.
+
+        Parameters
+        ----------
+        arrays : dict
+            ``demand``, ``H_hist``, ``lam_hist`` and ``backlog``, and
+            optionally all of ``CACHE_FIELDS``
+
+        window : int or None
+            Demand window length (defaults to the stored length)
+
+        dtype : data-type or None
+            Element type of the demand window (defaults to the stored type)
+        """
+        demand = np.asarray(arrays["demand"])
+        window = window or demand.shape[1]
+        if demand.shape[1] > window:
+            raise ValueError("stored demand is longer than the window")
+
+        state = cls(len(arrays["backlog"]), window, dtype=dtype or demand.dtype)
+        if demand.shape[1]:
+            state.demand.fill(demand)
+
+        H_hist = np.asarray(arrays["H_hist"], dtype=float)
+        lam_hist = np.asarray(arrays["lam_hist"], dtype=float)
+        if H_hist.shape[1]:
+            state.H_hist.fill(H_hist)
+            state.lam_hist.fill(lam_hist)
+        state.H_sum = H_hist.sum(axis=1)
+        state.lam_sum = lam_hist.sum(axis=1)
+
+        state.backlog = np.array(arrays["backlog"], dtype=float)
+
+        if all(name in arrays for name in CACHE_FIELDS):
+            state.cache = {
+                name: np.array(arrays[name], dtype=float) for name in CACHE_FIELDS
+            }
+            state.cache["refresh_age"] = state.cache["refresh_age"].astype(np.int64)
+        return state
+
+    @classmethod
+    def capture(cls, policies) -> "FCIOFleetState":
+        """
+        Collect the state of a sequence of ``FCIOPolicy`` objects.
+
+        All policies must share one window and have observed the
+        same number of periods.
+        """
+        policies = list(policies)
+        if not policies:
+            raise ValueError("no policies to capture")
+
+        windows = {p.window for p in policies}
+        if len(windows) > 1:
+            raise ValueError("all policies must share the same window")
+
+        states = [p.get_state() for p in policies]
+        try:
+            arrays = {
+                name: np.array([s[name] for s in states], dtype=float)
+                for name in ("demand", "H_hist", "lam_hist", "backlog") + CACHE_FIELDS
+            }
+        except ValueError:
+            raise ValueError("policies were not observed in lockstep") from None
+
+        return cls.from_arrays(arrays, window=windows.pop())
+
+    def apply(self, policies):
+        """
+        Restore the state into a sequence of ``FCIOPolicy`` objects,
+        in the order they were captured.
+        """
+        policies = list(policies)
+        if len(policies) != len(self):
+            raise ValueError(
+                f"State holds {len(self)} policies, got {len(policies)}"
+            )
+
+        arrays = self.to_arrays()
+        for i, policy in enumerate(policies):
+            if policy.window != self.window:
+                raise ValueError("policy window does not match the saved state")
+
+            policy.set_state({name: values[i] for name, values in arrays.items()})
+
+    def save(self, path):
+        """
+        Atomically write the state to ``path`` (``.npz``).
+        """
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, window=self.window, **self.to_arrays())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path) -> "FCIOFleetState":
+        """
+        Read a state written by ``save``.
+        """
+        with np.load(path) as data:
+            return cls.from_arrays(data, window=int(data["window"]))
@@ -3,11 +3,16 @@ Core inventory dynamics and system definitions.
 """
 
 from .inventory_system import InventorySystem
-from .cost import CostModel
+from .cost import CostModel, CostBreakdown
 from .dynamics import InventoryDynamics
+from .batch import BatchInventorySimulator
+from .streaming import StreamingSimulator
 
 __all__ = [
     "InventorySystem",
     "CostModel",
+    "CostBreakdown",
     "InventoryDynamics",
+    "BatchInventorySimulator",
+    "StreamingSimulator",
 ]
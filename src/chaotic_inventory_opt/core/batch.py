@@ -0,0 +1,301 @@
+import numpy as np
+
+from chaotic_inventory_opt.core.cost import CostModel
+from chaotic_inventory_opt.core.inventory_system import inventory_path
+from chaotic_inventory_opt.utils.parallel import split_range
+
+
+# Elements per row block of the open-loop fast path
+PLAN_BLOCK_ELEMENTS = 2**16
+
+
+class _PolicySequence:
+    """
+    Adapter exposing a sequence of per-SKU scalar policies
+    through the batched policy interface.
+    """
+
+    def __init__(self, policies):
+        self.policies = list(policies)
+
+    def observe_batch(self, demand):
+        for policy, d in zip(self.policies, demand):
+            if hasattr(policy, "observe"):
+                policy.observe(d)
+
+    def order_batch(self, inventory):
+        return np.fromiter(
+            (p.order(float(i)) for p, i in zip(self.policies, inventory)),
+            dtype=float,
+            count=len(self.policies),
+        )
+
+
+def as_batch_policy(policy):
+    """
+    Return an object implementing ``order_batch``.
+
+    Parameters
+    ----------
+    policy : object or sequence
+        Either a batched policy (exposing ``order_batch`` and
+        optionally ``observe_batch``) or a sequence holding one
+        scalar policy per SKU.
+    """
+    if hasattr(policy, "order_batch"):
+        return policy
+    if hasattr(policy, "order"):
+        raise TypeError(
+            "scalar policies must be given as a sequence, one per SKU"
+        )
+    return _PolicySequence(policy)
+
+
+class BatchInventorySimulator:
+    """
+    Vectorized inventory simulation for N SKUs.
+
+    Inventory of every SKU is held in a single array of shape (N,)
+    and advanced in one array operation per period:
+        I_{t+1} = I_t + Q_t - D_t
+
+    Costs and service metrics follow ``CostModel.compute`` and
+    ``PerformanceMetrics.update`` exactly, but are accumulated
+    per SKU in a ``BatchPerformanceMetrics`` (``performance``).
+
+    Open-loop policies (exposing ``open_loop = True`` and
+    ``plan(n_skus, n_periods)``, e.g. ``OrderPlan``) skip the
+    per-period loop: whole trajectories are evaluated at once by
+    ``run_plan``.
+    """
+
+    def __init__(
+        self,
+        initial_inventory,
+        cost_model: CostModel,
+        relative_accuracy: float | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        initial_inventory : float or array-like
+            Starting inventory, either shared by all SKUs or per SKU
+
+        cost_model : CostModel
+            Cost model applied to every SKU, or with per-SKU
+            parameters of shape (N,)
+
+        relative_accuracy : float or None
+            Relative accuracy of the cost distribution sketch kept by
+            ``performance`` (None, the default, skips it)
+        """
+        self.initial_inventory = initial_inventory
+        self.cost_model = cost_model
+        self.relative_accuracy = relative_accuracy
+        self.reset(np.size(initial_inventory))
+
+    def reset(self, n_skus: int):
+        """
+        Reset inventory and accumulated metrics for ``n_skus`` SKUs.
+        """
+        self.I = np.empty(n_skus, dtype=float)
+        self.I[:] = self.initial_inventory
+
+        # evaluation imports core, so the metrics are imported lazily
+        from chaotic_inventory_opt.evaluation.performance import BatchPerformanceMetrics
+
+        self.performance = BatchPerformanceMetrics(n_skus, self.relative_accuracy)
+        self.last_cost = np.zeros(n_skus)
+
+    def step(self, demand, order) -> np.ndarray:
+        """
+        Advance all SKUs by one time step.
+
+        Parameters
+        ----------
+        demand : np.ndarray
+            Demand vector D_t of shape (N,)
+
+        order : np.ndarray
+            Order vector Q_t of shape (N,)
+
+        Returns
+        -------
+        np.ndarray
+            Inventory levels at time t+1
+        """
+        self.I = self.I + order - demand
+        cost = self.cost_model.compute_batch(self.I, order).total
+
+        self.last_cost = cost
+        self.performance.update(demand, self.I, cost)
+
+        return self.I
+
+    def _accumulate(self, rows, demand, order, inventory):
+        """
+        Add the metrics of (n, T) blocks of ``rows`` to the totals.
+        """
+        cm = self.cost_model.select(rows)
+        if self.performance.cost_distribution is None:
+            cost = cm.compute_totals(inventory, order).total
+        else:
+            cost = cm.compute_batch(inventory, order).total
+
+        self.performance.update_block(demand, inventory, cost, rows)
+        self.last_cost[rows] = cm.compute_batch(inventory[:, -1], order[:, -1]).total
+
+    def _prepare(self, n_skus: int, reset: bool):
+        if reset:
+            if np.ndim(self.initial_inventory) and n_skus != np.size(self.initial_inventory):
+                raise ValueError("initial_inventory does not match number of SKUs")
+            self.reset(n_skus)
+        elif n_skus != len(self.I):
+            raise ValueError("demand_matrix does not match number of SKUs")
+
+        cm = self.cost_model
+        if any(np.ndim(v) and np.size(v) != n_skus for v in (cm.h, cm.p, cm.k)):
+            raise ValueError("cost parameters do not match number of SKUs")
+
+    def results(self) -> dict:
+        """
+        Return per-SKU performance metrics.
+        """
+        return self.performance.results()
+
+    def run(
+        self,
+        demand_matrix,
+        policy,
+        record_trace: bool = True,
+        reset: bool = True,
+    ) -> dict:
+        """
+        Simulate a policy over a demand matrix.
+
+        Parameters
+        ----------
+        demand_matrix : array-like
+            Demand of shape (N, T), or (T,) for a single SKU
+
+        policy : object or sequence
+            Batched policy or one scalar policy per SKU
+            (see ``as_batch_policy``)
+
+        record_trace : bool
+            Whether to keep the (N, T) inventory trace
+
+        reset : bool
+            Start from ``initial_inventory``. If False, continue from
+            the current state, so consecutive time blocks of the same
+            SKUs can be simulated one after another. Open-loop
+            policies exposing ``reset`` (e.g. ``OrderPlan``) are
+            rewound along with the state, and continue from their
+            position if False.
+
+        Returns
+        -------
+        dict
+            Per-SKU ``total_cost``, ``service_level`` and
+            ``stockout_events``, plus ``inventory`` (N, T) when
+            ``record_trace`` is set
+        """
+        D = np.asarray(demand_matrix, dtype=float)
+        if D.ndim == 1:
+            D = D[None, :]
+
+        N, T = D.shape
+        if getattr(policy, "open_loop", False):
+            if reset and hasattr(policy, "reset"):
+                policy.reset()
+            return self.run_plan(D, policy.plan(N, T), record_trace, reset)
+
+        policy = as_batch_policy(policy)
+        observe = getattr(policy, "observe_batch", None)
+
+        self._prepare(N, reset)
+
+        # Time-major copy so that each period is a contiguous vector
+        D_t = np.ascontiguousarray(D.T)
+        trace = np.empty((T, N)) if record_trace else None
+
+        for t in range(T):
+            demand = D_t[t]
+
+            if observe is not None:
+                observe(demand)
+
+            order = np.asarray(policy.order_batch(self.I), dtype=float)
+            inventory = self.step(demand, order)
+
+            if trace is not None:
+                trace[t] = inventory
+
+        out = self.results()
+        if trace is not None:
+            out["inventory"] = trace.T
+        return out
+
+    def run_plan(
+        self,
+        demand_matrix,
+        orders,
+        record_trace: bool = True,
+        reset: bool = True,
+    ) -> dict:
+        """
+        Simulate an open-loop order plan without stepping.
+
+        Inventory trajectories come from one cumulative sum per row
+        block (see ``inventory_path``) and costs and metrics are
+        reduced along time, so the result matches ``run`` with the
+        same orders up to floating-point summation order.
+
+        Parameters
+        ----------
+        demand_matrix : array-like
+            Demand of shape (N, T), or (T,) for a single SKU
+
+        orders : array-like
+            Orders of shape (N, T), or (T,) shared by all SKUs
+
+        record_trace : bool
+            Whether to keep the (N, T) inventory trace
+
+        reset : bool
+            Start from ``initial_inventory`` (see ``run``)
+
+        Returns
+        -------
+        dict
+            Same as ``run``
+        """
+        D = np.asarray(demand_matrix, dtype=float)
+        if D.ndim == 1:
+            D = D[None, :]
+
+        N, T = D.shape
+        Q = np.broadcast_to(np.asarray(orders, dtype=float), (N, T))
+
+        self._prepare(N, reset)
+        trace = np.empty((N, T)) if record_trace else None
+
+        if T:
+            end = self.I.copy()
+            rows = max(1, PLAN_BLOCK_ELEMENTS // T)
+
+            for start, stop in split_range(N, rows):
+                block = slice(start, stop)
+                inventory = inventory_path(self.I[block], Q[block], D[block])
+
+                self._accumulate(block, D[block], Q[block], inventory)
+                end[block] = inventory[:, -1]
+                if trace is not None:
+                    trace[block] = inventory
+
+            self.I = end
+
+        out = self.results()
+        if trace is not None:
+            out["inventory"] = trace
+        return out
@@ -1,34 +1,104 @@
+from typing import NamedTuple
+
+import numpy as np
+
+
+# Elements per row block of ``CostModel.compute_totals``
+TOTALS_BLOCK_ELEMENTS = 2**16
+
+
+def _cost_param(value):
+    if np.ndim(value) == 0:
+        return float(value)
+    return np.asarray(value, dtype=float)
+
+
+class CostBreakdown(NamedTuple):
+    """
+    Inventory cost split into its components.
+    """
+
+    total: np.ndarray
+    holding: np.ndarray
+    stockout: np.ndarray
+    fixed: np.ndarray
+
+
 class CostModel:
     """
     Inventory cost model.
+
+    Cost parameters may be scalars or per-SKU arrays of shape (N,).
+    Per-SKU parameters are matched against the leading (SKU) axis of
+    the arrays given to ``compute_batch`` and ``compute_totals``;
+    the scalar ``compute`` then raises ValueError.
     """
 
     def __init__(
         self,
-        holding_cost_per_unit: float,
-        stockout_cost_per_unit: float,
-        fixed_order_cost: float = 0.0,
+        holding_cost_per_unit,
+        stockout_cost_per_unit,
+        fixed_order_cost=0.0,
     ):
         """
         Parameters
         ----------
-        holding_cost_per_unit : float
+        holding_cost_per_unit : float or array-like
             Cost per unit of positive inventory per time step
 
-        stockout_cost_per_unit : float
+        stockout_cost_per_unit : float or array-like
             Cost per unit of unmet demand / backorder per time step
 
-        fixed_order_cost : float
+        fixed_order_cost : float or array-like
             Fixed cost incurred when an order is placed (optional)
         """
-        self.h = float(holding_cost_per_unit)
-        self.p = float(stockout_cost_per_unit)
-        self.k = float(fixed_order_cost)
+        self.h = _cost_param(holding_cost_per_unit)
+        self.p = _cost_param(stockout_cost_per_unit)
+        self.k = _cost_param(fixed_order_cost)
+
+    @property
+    def per_sku(self) -> bool:
+        """
+        Whether any cost parameter varies by SKU.
+        """
+        # ``_cost_param`` stores scalars as floats and the rest as arrays
+        return (
+            isinstance(self.h, np.ndarray)
+            or isinstance(self.p, np.ndarray)
+            or isinstance(self.k, np.ndarray)
+        )
+
+    def select(self, rows) -> "CostModel":
+        """
+        Cost model restricted to a subset of SKUs.
+
+        Parameters
+        ----------
+        rows : slice or array-like
+            SKU indices into the per-SKU parameter arrays
+
+        Returns
+        -------
+        CostModel
+            ``self`` when all parameters are scalars
+        """
+        if not self.per_sku:
+            return self
+
+        return CostModel(
+            *(v if np.ndim(v) == 0 else v[rows] for v in (self.h, self.p, self.k))
+        )
 
     def compute(self, inventory: float, order: float) -> float:
         """
         Compute one-period inventory cost.
+
+        Only for scalar parameters; per-SKU cost models are
+        evaluated with ``compute_batch``.
         """
+        if self.per_sku:
+            raise ValueError("CostModel has per-SKU parameters; use compute_batch")
+
         cost = 0.0
 
         # Stockout / backorder penalty
@@ -44,3 +114,91 @@ class CostModel:
             cost += self.k
 
         return cost
+
+    def _params(self, ndim: int) -> tuple:
+        # Per-SKU parameters broadcast along the leading axis
+        return tuple(
+            v if np.ndim(v) == 0 else v.reshape(v.shape + (1,) * (ndim - 1))
+            for v in (self.h, self.p, self.k)
+        )
+
+    def compute_batch(self, inventory, order) -> CostBreakdown:
+        """
+        Vectorized ``compute`` over arrays of periods and SKUs.
+
+        Parameters
+        ----------
+        inventory : array-like
+            Inventory levels, e.g. of shape (N,) or (N, T)
+
+        order : array-like
+            Order quantities broadcastable to ``inventory``
+
+        Returns
+        -------
+        CostBreakdown
+            Total, holding, stockout and fixed-order costs, each of
+            the broadcast shape
+        """
+        inventory, order = np.broadcast_arrays(
+            np.asarray(inventory, dtype=float), np.asarray(order, dtype=float)
+        )
+        h, p, k = self._params(inventory.ndim)
+
+        holding = h * np.maximum(inventory, 0.0)
+        stockout = p * np.maximum(-inventory, 0.0)
+        fixed = np.where(order > 0, k, 0.0)
+
+        total = holding + stockout
+        total += fixed
+        return CostBreakdown(total, holding, stockout, fixed)
+
+    def compute_totals(self, inventory, order) -> CostBreakdown:
+        """
+        Costs summed over the time (last) axis.
+
+        Rows are processed in blocks, so no intermediate array of
+        the full (N, T) shape is allocated.
+
+        Parameters
+        ----------
+        inventory : array-like
+            Inventory levels of shape (N, T), or (T,) for one SKU
+
+        order : array-like
+            Order quantities broadcastable to ``inventory``
+
+        Returns
+        -------
+        CostBreakdown
+            Per-SKU totals of shape (N,), or floats for one SKU
+        """
+        inventory = np.asarray(inventory, dtype=float)
+        single = inventory.ndim == 1
+        if single:
+            inventory = inventory[None, :]
+
+        N, T = inventory.shape
+        order = np.broadcast_to(
+            np.asarray(order, dtype=float).reshape((1,) * single + np.shape(order)),
+            (N, T),
+        )
+
+        out = np.zeros((4, N))
+        rows = max(1, TOTALS_BLOCK_ELEMENTS // max(T, 1))
+
+        # Parameters are constant along time, so they scale row sums
+        for start in range(0, N, rows):
+            block = slice(start, min(start + rows, N))
+            h, p, k = self.select(block)._params(1)
+            I = inventory[block]
+
+            out[1, block] = h * np.maximum(I, 0.0).sum(axis=1)
+            out[2, block] = p * np.maximum(-I, 0.0).sum(axis=1)
+            out[3, block] = k * np.count_nonzero(order[block] > 0, axis=1)
+
+        out[0] = out[1] + out[2] + out[3]
+
+        if single:
+            return CostBreakdown(*(float(v[0]) for v in out))
+        return CostBreakdown(*out)
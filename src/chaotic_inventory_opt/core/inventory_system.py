@@ -1,3 +1,46 @@
+import numpy as np
+
+
+def inventory_path(initial_inventory, orders, demand) -> np.ndarray:
+    """
+    Inventory trajectory under an open-loop order plan.
+
+    Evaluates I_{t+1} = I_t + Q_t - D_t for all t with one cumulative
+    sum along the last axis. Orders and demands are interleaved so
+    that every partial sum is formed in the same order as stepping
+    the recurrence, making the result bit-identical to
+    ``InventorySystem.step``.
+
+    Parameters
+    ----------
+    initial_inventory : float or np.ndarray
+        Starting inventory, scalar or of shape (N,)
+
+    orders : np.ndarray
+        Order quantities of shape (T,) or (N, T)
+
+    demand : np.ndarray
+        Demand of shape (T,) or (N, T)
+
+    Returns
+    -------
+    np.ndarray
+        Inventory levels I_1 .. I_T
+    """
+    Q, D = np.broadcast_arrays(
+        np.asarray(orders, dtype=float), np.asarray(demand, dtype=float)
+    )
+    T = Q.shape[-1]
+
+    steps = np.empty(Q.shape[:-1] + (2 * T + 1,))
+    steps[..., 0] = initial_inventory
+    steps[..., 1::2] = Q
+    np.negative(D, out=steps[..., 2::2])
+
+    np.cumsum(steps, axis=-1, out=steps)
+    return steps[..., 2::2]
+
+
 class InventorySystem:
     """
     Inventory system state and evolution.
@@ -28,6 +71,28 @@ class InventorySystem:
         self.I = self.I + order - demand
         return self.I
 
+    def simulate(self, demand, orders) -> np.ndarray:
+        """
+        Advance inventory through a whole open-loop order plan.
+
+        Parameters
+        ----------
+        demand : array-like
+            Demand series of length T
+
+        orders : array-like
+            Order quantities of length T
+
+        Returns
+        -------
+        np.ndarray
+            Inventory levels at times 1..T
+        """
+        path = inventory_path(self.I, orders, demand)
+        if len(path):
+            self.I = float(path[-1])
+        return path
+
     def reset(self, inventory: float):
         """
         Reset inventory state.
@@ -0,0 +1,257 @@
+import os
+import pickle
+
+import numpy as np
+
+from chaotic_inventory_opt.control.state import FCIOFleetState
+from chaotic_inventory_opt.core.batch import BatchInventorySimulator, as_batch_policy
+from chaotic_inventory_opt.core.cost import CostModel
+
+
+class StreamingSimulator:
+    """
+    Online inventory control loop for N SKUs.
+
+    Demand arrives one period at a time as a vector over all SKUs,
+    e.g. from a daily POS feed. Each period the policy observes the
+    demand, places orders and the inventory is advanced, exactly as
+    in ``BatchInventorySimulator.run``. No history is kept: state is
+    the inventory and metric accumulators (O(1) per SKU) plus the
+    policy's own rolling window, so a long-running loop can be
+    checkpointed and resumed without replaying past demand.
+
+    Policies exposing ``snapshot``/``restore`` (e.g.
+    ``NetworkFCIOPolicy``) are checkpointed as plain arrays; any
+    other policy is pickled into the checkpoint.
+    """
+
+    def __init__(
+        self,
+        policy,
+        cost_model: CostModel,
+        initial_inventory,
+        n_skus: int | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        policy : object or sequence
+            Batched policy or one scalar policy per SKU
+            (see ``as_batch_policy``)
+
+        cost_model : CostModel
+            Cost model applied to every SKU
+
+        initial_inventory : float or array-like
+            Starting inventory, either shared by all SKUs or per SKU
+
+        n_skus : int or None
+            Number of SKUs (defaults to the size of ``initial_inventory``)
+        """
+        if n_skus is None:
+            n_skus = np.size(initial_inventory)
+        elif np.ndim(initial_inventory) and n_skus != np.size(initial_inventory):
+            raise ValueError("initial_inventory does not match number of SKUs")
+
+        self.policy = as_batch_policy(policy)
+        self.simulator = BatchInventorySimulator(initial_inventory, cost_model)
+        self.simulator.reset(n_skus)
+        self.t = 0
+
+    @property
+    def n_skus(self) -> int:
+        return len(self.simulator.I)
+
+    def step(self, demand) -> dict:
+        """
+        Process one period of demand.
+
+        Parameters
+        ----------
+        demand : array-like
+            Demand vector D_t of shape (N,)
+
+        Returns
+        -------
+        dict
+            ``t``, and per-SKU ``order``, ``inventory`` and ``cost``
+            for the period
+        """
+        demand = np.asarray(demand, dtype=float)
+        if demand.shape != (self.n_skus,):
+            raise ValueError(
+                f"Expected demand of shape ({self.n_skus},), got {demand.shape}"
+            )
+
+        observe = getattr(self.policy, "observe_batch", None)
+        if observe is not None:
+            observe(demand)
+
+        order = np.asarray(self.policy.order_batch(self.simulator.I), dtype=float)
+        inventory = self.simulator.step(demand, order)
+
+        record = {
+            "t": self.t,
+            "order": order,
+            "inventory": inventory.copy(),
+            "cost": self.simulator.last_cost,
+        }
+        self.t += 1
+        return record
+
+    def run(self, stream, checkpoint_path=None, checkpoint_every: int = 1):
+        """
+        Consume an iterable of per-period demand vectors.
+
+        Parameters
+        ----------
+        stream : iterable
+            Demand vectors of shape (N,), one per period
+
+        checkpoint_path : str or Path or None
+            If given, the state is checkpointed here while running
+
+        checkpoint_every : int
+            Periods between checkpoints
+
+        Yields
+        ------
+        dict
+            Per-period record (see ``step``)
+        """
+        for demand in stream:
+            record = self.step(demand)
+            if checkpoint_path is not None and self.t % checkpoint_every == 0:
+                self.checkpoint(checkpoint_path)
+            yield record
+
+    async def arun(self, stream, checkpoint_path=None, checkpoint_every: int = 1):
+        """
+        Asynchronous version of ``run``.
+
+        Parameters
+        ----------
+        stream : async iterable or iterable
+            Demand vectors of shape (N,), one per period
+
+        checkpoint_path : str or Path or None
+            If given, the state is checkpointed here while running
+
+        checkpoint_every : int
+            Periods between checkpoints
+
+        Yields
+        ------
+        dict
+            Per-period record (see ``step``)
+        """
+        if not hasattr(stream, "__aiter__"):
+            for record in self.run(stream, checkpoint_path, checkpoint_every):
+                yield record
+            return
+
+        async for demand in stream:
+            record = self.step(demand)
+            if checkpoint_path is not None and self.t % checkpoint_every == 0:
+                self.checkpoint(checkpoint_path)
+            yield record
+
+    def results(self) -> dict:
+        """
+        Per-SKU performance metrics accumulated so far.
+        """
+        return self.simulator.results()
+
+    def checkpoint(self, path):
+        """
+        Atomically write the full loop state to ``path`` (``.npz``).
+
+        The file is written next to ``path`` and renamed into place,
+        so a crash never leaves a partial checkpoint behind.
+        """
+        sim = self.simulator
+        cm = sim.cost_model
+        tmp = f"{path}.tmp"
+
+        if hasattr(self.policy, "snapshot"):
+            state = self.policy.snapshot()
+            policy = {
+                f"policy_{name}": values
+                for name, values in state.to_arrays().items()
+            }
+            policy["policy_window"] = state.window
+        else:
+            policy = {
+                "policy": np.frombuffer(pickle.dumps(self.policy), dtype=np.uint8)
+            }
+
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                t=self.t,
+                cost_h=cm.h,
+                cost_p=cm.p,
+                cost_k=cm.k,
+                initial_inventory=np.asarray(sim.initial_inventory, dtype=float),
+                inventory=sim.I,
+                total_cost=sim.performance.total_cost,
+                total_demand=sim.performance.total_demand,
+                total_fulfilled=sim.performance.total_fulfilled,
+                stockout_events=sim.performance.stockout_events,
+                **policy,
+            )
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp, path)
+
+    @classmethod
+    def restore(cls, path, policy=None) -> "StreamingSimulator":
+        """
+        Resume a loop from a checkpoint written by ``checkpoint``.
+
+        Parameters
+        ----------
+        path : str or Path
+            Checkpoint file
+
+        policy : object or None
+            Freshly constructed policy receiving the saved state.
+            Required when the policy was saved through its
+            ``snapshot`` method; otherwise the pickled policy
+            stored in the checkpoint is used.
+        """
+        with np.load(path) as state:
+            if "policy" in state.files:
+                policy = pickle.loads(state["policy"].tobytes())
+            elif policy is None:
+                raise ValueError("checkpoint holds policy state; pass the policy")
+            else:
+                arrays = {
+                    name[len("policy_"):]: state[name]
+                    for name in state.files
+                    if name.startswith("policy_")
+                }
+                window = int(arrays.pop("window"))
+                policy.restore(FCIOFleetState.from_arrays(arrays, window=window))
+
+            initial_inventory = state["initial_inventory"]
+            if initial_inventory.ndim == 0:
+                initial_inventory = float(initial_inventory)
+
+            loop = cls(
+                policy,
+                CostModel(state["cost_h"], state["cost_p"], state["cost_k"]),
+                initial_inventory,
+                n_skus=len(state["inventory"]),
+            )
+
+            sim = loop.simulator
+            sim.I = state["inventory"].copy()
+            sim.performance.total_cost = state["total_cost"].copy()
+            sim.performance.total_demand = state["total_demand"].copy()
+            sim.performance.total_fulfilled = state["total_fulfilled"].copy()
+            sim.performance.stockout_events = state["stockout_events"].copy()
+            loop.t = int(state["t"])
+
+        return loop
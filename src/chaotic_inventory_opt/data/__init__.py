@@ -0,0 +1,17 @@
+"""
+Demand data storage.
+
+This module converts wide demand tables (one row per SKU, one
+column per period) into compact on-disk arrays that can be
+memory-mapped and sliced without parsing text.
+"""
+
+from .store import DemandStore
+from .ingest import DemandBlock, iter_blocks, iter_csv_blocks
+
+__all__ = [
+    "DemandStore",
+    "DemandBlock",
+    "iter_blocks",
+    "iter_csv_blocks",
+]
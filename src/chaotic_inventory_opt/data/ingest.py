@@ -0,0 +1,165 @@
+import csv
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+from chaotic_inventory_opt.data.store import DemandStore
+from chaotic_inventory_opt.utils.validation import validate_matrix
+
+
+class DemandBlock(NamedTuple):
+    """
+    A bounded tile of a demand catalogue.
+    """
+
+    rows: np.ndarray
+    """Catalogue row index of every SKU in the block"""
+
+    period_start: int
+    """Index of the first period in the block"""
+
+    data: np.ndarray
+    """Validated float demand of shape (len(rows), periods)"""
+
+    keys: list | None
+    """SKU keys, when the source provides them"""
+
+
+def iter_blocks(
+    source,
+    block_rows: int = 1024,
+    block_periods: int | None = None,
+    rows=None,
+    validate: bool = True,
+) -> Iterator[DemandBlock]:
+    """
+    Stream a demand catalogue in blocks of bounded size.
+
+    Only one block of at most ``block_rows x block_periods`` values
+    is materialized at a time, so peak memory does not depend on the
+    catalogue size. Tiles are yielded row block by row block, each
+    walking forward in time, so a simulation can carry its state
+    across the time tiles of one row block.
+
+    Parameters
+    ----------
+    source : DemandStore, np.ndarray, str or Path
+        A store, an (N, T) array or memmap, or a wide CSV file
+        (CSV sources are read sequentially and support row blocks only)
+
+    block_rows : int
+        SKUs per block
+
+    block_periods : int or None
+        Periods per block (None yields full series)
+
+    rows : array-like or None
+        Subset of catalogue rows to stream (stores and arrays only)
+
+    validate : bool
+        Check blocks with ``validate_matrix`` (finite values)
+
+    Yields
+    ------
+    DemandBlock
+    """
+    if isinstance(source, (str, Path)):
+        if block_periods is not None or rows is not None:
+            raise ValueError(
+                "CSV sources support row blocks only; convert to a DemandStore"
+            )
+        yield from iter_csv_blocks(source, block_rows, validate=validate)
+        return
+
+    keys = None
+    if isinstance(source, DemandStore):
+        keys = source.keys
+        source = source.demand
+
+    N, T = source.shape
+    rows = np.arange(N) if rows is None else np.asarray(rows, dtype=np.int64)
+    step = T if block_periods is None else block_periods
+
+    for r0 in range(0, len(rows), block_rows):
+        block_idx = rows[r0:r0 + block_rows]
+        contiguous = len(block_idx) > 0 and np.all(np.diff(block_idx) == 1)
+        block_keys = [keys[i] for i in block_idx] if keys is not None else None
+
+        for t0 in range(0, T, step):
+            if contiguous:
+                data = source[block_idx[0]:block_idx[-1] + 1, t0:t0 + step]
+            else:
+                data = source[block_idx, t0:t0 + step]
+
+            if validate:
+                data = validate_matrix(data, rows=block_idx)
+            else:
+                data = np.asarray(data, dtype=float)
+
+            yield DemandBlock(block_idx, t0, data, block_keys)
+
+
+def iter_csv_blocks(
+    csv_path,
+    block_rows: int = 1024,
+    key_columns=("item_id", "store_id"),
+    period_prefix: str = "d_",
+    validate: bool = True,
+) -> Iterator[DemandBlock]:
+    """
+    Stream a wide demand CSV in row blocks without loading it.
+
+    Parameters
+    ----------
+    csv_path : str or Path
+        Wide CSV with one row per SKU
+
+    block_rows : int
+        SKUs per block
+
+    key_columns : tuple[str]
+        Columns identifying a SKU
+
+    period_prefix : str
+        Prefix of the demand columns
+
+    validate : bool
+        Check blocks with ``validate_matrix`` (finite values)
+
+    Yields
+    ------
+    DemandBlock
+    """
+    with open(csv_path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+
+        key_pos = [header.index(c) for c in key_columns]
+        period_pos = [i for i, c in enumerate(header) if c.startswith(period_prefix)]
+
+        start = 0
+        keys = []
+        values = []
+
+        for row in reader:
+            if not row:
+                continue
+
+            keys.append(tuple(row[j] for j in key_pos))
+            values.append([row[j] for j in period_pos])
+
+            if len(values) == block_rows:
+                yield _csv_block(start, keys, values, validate)
+                start += len(values)
+                keys, values = [], []
+
+        if values:
+            yield _csv_block(start, keys, values, validate)
+
+
+def _csv_block(start, keys, values, validate) -> DemandBlock:
+    data = np.array(values, dtype=float)
+    if validate:
+        data = validate_matrix(data, row_offset=start)
+    return DemandBlock(np.arange(start, start + len(data)), 0, data, keys)
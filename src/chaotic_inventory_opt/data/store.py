@@ -0,0 +1,197 @@
+import csv
+import json
+from pathlib import Path
+
+import numpy as np
+
+
+_DTYPES = ("float32", "float64", "uint16")
+
+
+class DemandStore:
+    """
+    Memory-mapped demand matrix with O(1) SKU lookup.
+
+    A store is a directory holding:
+        demand.npy   (N SKUs, T periods) array, opened as a memmap
+        index.json   key columns, SKU keys (row order) and periods
+
+    Single-SKU lookups return zero-copy views into the memmap;
+    loading many SKUs is one fancy-index slice.
+    """
+
+    DEMAND_FILE = "demand.npy"
+    INDEX_FILE = "index.json"
+
+    def __init__(self, path):
+        """
+        Parameters
+        ----------
+        path : str or Path
+            Store directory created by ``DemandStore.from_csv``
+        """
+        self.path = Path(path)
+
+        with open(self.path / self.INDEX_FILE) as f:
+            meta = json.load(f)
+
+        self.key_columns = tuple(meta["key_columns"])
+        self.periods = list(meta["periods"])
+        self.keys = [tuple(k) for k in meta["keys"]]
+        self.index = {key: i for i, key in enumerate(self.keys)}
+
+        self.demand = np.load(self.path / self.DEMAND_FILE, mmap_mode="r")
+
+        if self.demand.shape != (len(self.keys), len(self.periods)):
+            raise ValueError(f"{self.path} is inconsistent with its index")
+
+    @classmethod
+    def from_csv(
+        cls,
+        csv_path,
+        path,
+        key_columns=("item_id", "store_id"),
+        period_prefix: str = "d_",
+        dtype: str = "float32",
+    ) -> "DemandStore":
+        """
+        Convert a wide demand CSV into a store.
+
+        The CSV is streamed row by row straight into the on-disk
+        array, so conversion never holds the table in memory.
+
+        Parameters
+        ----------
+        csv_path : str or Path
+            Wide CSV with one row per SKU (e.g. M5 sales)
+
+        path : str or Path
+            Output store directory
+
+        key_columns : tuple[str]
+            Columns identifying a SKU
+
+        period_prefix : str
+            Prefix of the demand columns
+
+        dtype : str
+            Storage type: ``"float32"``, ``"float64"`` or ``"uint16"``
+            (non-negative integer unit sales up to 65535)
+
+        Returns
+        -------
+        DemandStore
+        """
+        if dtype not in _DTYPES:
+            raise ValueError(f"dtype must be one of {_DTYPES}")
+
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        # Count records, not lines: quoted fields may contain newlines
+        # and blank lines (e.g. a trailing one) hold no SKU
+        with open(csv_path, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            num_rows = sum(1 for row in reader if row)
+
+        key_pos = [header.index(c) for c in key_columns]
+        period_pos = [i for i, c in enumerate(header) if c.startswith(period_prefix)]
+        periods = [header[i] for i in period_pos]
+
+        demand = np.lib.format.open_memmap(
+            path / cls.DEMAND_FILE,
+            mode="w+",
+            dtype=dtype,
+            shape=(num_rows, len(periods)),
+        )
+        keys = []
+
+        with open(csv_path, newline="") as f:
+            reader = csv.reader(f)
+            next(reader)
+
+            for i, row in enumerate(row for row in reader if row):
+                values = np.array([row[j] for j in period_pos], dtype=float)
+
+                if dtype == "uint16" and (
+                    np.any(values < 0)
+                    or np.any(values > np.iinfo(np.uint16).max)
+                    or np.any(values != np.round(values))
+                ):
+                    raise ValueError(
+                        f"row {i} does not fit uint16; use a float dtype"
+                    )
+
+                demand[i] = values
+                keys.append([row[j] for j in key_pos])
+
+        demand.flush()
+        del demand
+
+        # The index is written last and marks the store as complete
+        with open(path / cls.INDEX_FILE, "w") as f:
+            json.dump(
+                {
+                    "key_columns": list(key_columns),
+                    "periods": periods,
+                    "keys": keys,
+                },
+                f,
+            )
+
+        return cls(path)
+
+    @classmethod
+    def open_or_convert(cls, path, csv_path, **kwargs) -> "DemandStore":
+        """
+        Open the store at ``path``, converting ``csv_path`` first if needed.
+        """
+        if (Path(path) / cls.INDEX_FILE).exists():
+            return cls(path)
+        return cls.from_csv(csv_path, path, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def shape(self) -> tuple:
+        return self.demand.shape
+
+    def get(self, *key) -> np.ndarray:
+        """
+        Demand series of one SKU as a read-only view.
+
+        Parameters
+        ----------
+        *key
+            Values of ``key_columns``, e.g. ``get("FOODS_3_090", "CA_1")``
+        """
+        try:
+            return self.demand[self.index[tuple(key)]]
+        except KeyError:
+            raise KeyError(f"Unknown SKU {key}") from None
+
+    def rows(self, keys) -> np.ndarray:
+        """
+        Row indices of a sequence of SKU keys.
+        """
+        return np.fromiter((self.index[tuple(k)] for k in keys), dtype=np.int64)
+
+    def take(self, rows) -> np.ndarray:
+        """
+        Demand of many SKUs (by row index) as an (n, T) array.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        order = np.argsort(rows, kind="stable")
+        out = np.empty((len(rows), self.demand.shape[1]), dtype=self.demand.dtype)
+        # Sorted access reads the memmap sequentially
+        out[order] = self.demand[rows[order]]
+        return out
+
+    def sample(self, n: int, seed=None) -> np.ndarray:
+        """
+        Row indices of ``n`` distinct SKUs drawn at random.
+        """
+        rng = np.random.default_rng(seed)
+        return np.sort(rng.choice(len(self), size=n, replace=False))
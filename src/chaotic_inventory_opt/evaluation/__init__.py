@@ -5,12 +5,23 @@ This module provides tools to evaluate economic performance,
 stability, and robustness of inventory control policies.
 """
 
-from .performance import PerformanceMetrics
-from .stability import StabilityMetrics
+from .performance import PerformanceMetrics, BatchPerformanceMetrics
+from .stability import StabilityMetrics, BatchStabilityMetrics
 from .robustness import RobustnessEvaluator
+from .sketch import QuantileSketch
+from .stress import RegimeSwitch, StressTest, SupplyInterruption
+from .sweep import FCIOSweep, pareto_front
 
 __all__ = [
     "PerformanceMetrics",
     "StabilityMetrics",
+    "BatchPerformanceMetrics",
+    "BatchStabilityMetrics",
     "RobustnessEvaluator",
+    "QuantileSketch",
+    "StressTest",
+    "RegimeSwitch",
+    "SupplyInterruption",
+    "FCIOSweep",
+    "pareto_front",
 ]
@@ -1,12 +1,34 @@
 import numpy as np
 
+from chaotic_inventory_opt.evaluation.sketch import (
+    merge_optional,
+    optional_quantiles,
+    optional_sketch,
+)
+
+
+_TOTALS = ("total_cost", "total_demand", "total_fulfilled", "stockout_events")
+
 
 class PerformanceMetrics:
     """
     Economic and service-level performance metrics.
+
+    Per-period costs can also be summarized in a ``QuantileSketch``
+    (opt-in through ``relative_accuracy``), and accumulators of
+    disjoint parts of an evaluation (e.g. SKU shards run in
+    different processes) combine exactly with ``merge``.
     """
 
-    def __init__(self):
+    def __init__(self, relative_accuracy: float | None = None):
+        """
+        Parameters
+        ----------
+        relative_accuracy : float or None
+            Relative accuracy of the cost distribution sketch used by
+            ``quantiles`` (None, the default, skips it)
+        """
+        self.relative_accuracy = relative_accuracy
         self.reset()
 
     def reset(self):
@@ -14,6 +36,7 @@ class PerformanceMetrics:
         self.total_demand = 0.0
         self.total_fulfilled = 0.0
         self.stockout_events = 0
+        self.cost_distribution = optional_sketch(self.relative_accuracy)
 
     def update(self, demand: float, inventory_after: float, cost: float):
         """
@@ -40,6 +63,31 @@ class PerformanceMetrics:
 
         self.total_fulfilled += max(0.0, fulfilled)
 
+        if self.cost_distribution is not None:
+            self.cost_distribution.add(cost)
+
+    def merge(self, other: "PerformanceMetrics"):
+        """
+        Add the totals and cost distribution of another accumulator.
+
+        Returns
+        -------
+        PerformanceMetrics
+            ``self``
+        """
+        self.total_cost += other.total_cost
+        self.total_demand += other.total_demand
+        self.total_fulfilled += other.total_fulfilled
+        self.stockout_events += other.stockout_events
+        merge_optional(self.cost_distribution, other.cost_distribution)
+        return self
+
+    def quantiles(self, q) -> dict:
+        """
+        Approximate quantiles of the per-period cost.
+        """
+        return {"cost": optional_quantiles(self.cost_distribution, q)}
+
     def results(self) -> dict:
         """
         Return aggregated performance metrics.
@@ -55,3 +103,158 @@ class PerformanceMetrics:
             "service_level": service_level,
             "stockout_events": self.stockout_events,
         }
+
+
+class BatchPerformanceMetrics:
+    """
+    ``PerformanceMetrics`` for N SKUs held as arrays of shape (N,).
+
+    One call updates every SKU for one period (``update``) or for a
+    block of periods (``update_block``), following
+    ``PerformanceMetrics.update`` exactly per SKU.
+
+    ``merge`` appends the SKUs of another accumulator, so shards of
+    a catalogue reduce to one accumulator in catalogue order; the
+    cost sketch pools every SKU and period.
+    """
+
+    def __init__(self, n_skus: int, relative_accuracy: float | None = None):
+        """
+        Parameters
+        ----------
+        n_skus : int
+            Number of SKUs
+
+        relative_accuracy : float or None
+            Relative accuracy of the cost distribution sketch used by
+            ``quantiles`` (None, the default, skips it)
+        """
+        self.n_skus = n_skus
+        self.relative_accuracy = relative_accuracy
+        self.reset()
+
+    def reset(self):
+        self.total_cost = np.zeros(self.n_skus)
+        self.total_demand = np.zeros(self.n_skus)
+        self.total_fulfilled = np.zeros(self.n_skus)
+        self.stockout_events = np.zeros(self.n_skus, dtype=np.int64)
+        self.cost_distribution = optional_sketch(self.relative_accuracy)
+
+    def update(self, demand, inventory_after, cost):
+        """
+        Update metrics of all SKUs for one time step.
+
+        Parameters
+        ----------
+        demand : np.ndarray
+            Demand vector of shape (N,)
+
+        inventory_after : np.ndarray
+            Inventory levels after demand fulfillment, shape (N,)
+
+        cost : np.ndarray
+            Costs incurred, shape (N,)
+        """
+        stockout = inventory_after < 0
+
+        self.total_cost += cost
+        self.total_demand += demand
+        self.total_fulfilled += np.where(
+            stockout, np.maximum(0.0, demand + inventory_after), demand
+        )
+        self.stockout_events += stockout
+
+        if self.cost_distribution is not None:
+            self.cost_distribution.update(cost)
+
+    def update_block(self, demand, inventory_after, cost, rows=slice(None)):
+        """
+        Update metrics for a block of consecutive time steps.
+
+        Parameters
+        ----------
+        demand : np.ndarray
+            Demand of shape (n, T)
+
+        inventory_after : np.ndarray
+            Inventory levels after demand fulfillment, shape (n, T)
+
+        cost : np.ndarray
+            Per-period costs of shape (n, T), or their sums over time
+            of shape (n,) when no cost sketch is kept
+
+        rows : slice or array-like
+            SKUs of the n rows (all SKUs by default)
+        """
+        cost = np.asarray(cost, dtype=float)
+        if cost.ndim == 2:
+            if self.cost_distribution is not None:
+                self.cost_distribution.update(cost)
+            cost = cost.sum(axis=1)
+        elif self.cost_distribution is not None:
+            raise ValueError("per-period costs are required by the cost sketch")
+
+        stockout = inventory_after < 0
+
+        self.total_cost[rows] += cost
+        self.total_demand[rows] += demand.sum(axis=1)
+        self.total_fulfilled[rows] += np.where(
+            stockout, np.maximum(0.0, demand + inventory_after), demand
+        ).sum(axis=1)
+        self.stockout_events[rows] += np.count_nonzero(stockout, axis=1)
+
+    def merge(self, other: "BatchPerformanceMetrics"):
+        """
+        Append the SKUs of another accumulator.
+
+        Returns
+        -------
+        BatchPerformanceMetrics
+            ``self``, now holding ``n_skus + other.n_skus`` SKUs
+        """
+        merge_optional(self.cost_distribution, other.cost_distribution)
+
+        for name in _TOTALS:
+            setattr(self, name, np.concatenate((getattr(self, name), getattr(other, name))))
+        self.n_skus += other.n_skus
+        return self
+
+    def quantiles(self, q) -> dict:
+        """
+        Approximate quantiles of the per-period cost over all SKUs.
+        """
+        return {"cost": optional_quantiles(self.cost_distribution, q)}
+
+    def results(self) -> dict:
+        """
+        Return per-SKU performance metrics, each of shape (N,).
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            service_level = np.where(
+                self.total_demand > 0,
+                self.total_fulfilled / self.total_demand,
+                1.0,
+            )
+
+        return {
+            "total_cost": self.total_cost.copy(),
+            "service_level": service_level,
+            "stockout_events": self.stockout_events.copy(),
+        }
+
+    def aggregate(self) -> dict:
+        """
+        Return performance metrics pooled over all SKUs.
+        """
+        total_demand = float(self.total_demand.sum())
+        service_level = (
+            float(self.total_fulfilled.sum()) / total_demand
+            if total_demand > 0
+            else 1.0
+        )
+
+        return {
+            "total_cost": float(self.total_cost.sum()),
+            "service_level": service_level,
+            "stockout_events": int(self.stockout_events.sum()),
+        }
@@ -1,13 +1,27 @@
-import copy
 import numpy as np
 
+from chaotic_inventory_opt.chaos.lyapunov import LyapunovExponentEstimator
+from chaotic_inventory_opt.core.batch import BatchInventorySimulator
+from chaotic_inventory_opt.core.cost import CostModel
+
 
 class RobustnessEvaluator:
     """
     Robustness evaluation via demand shocks and perturbations.
+
+    Shocks are drawn from the evaluator's own seeded
+    ``np.random.Generator`` as an (n_scenarios, T) mask in one call,
+    so results are reproducible and independent of global state.
+    ``spawn`` derives statistically independent evaluators, e.g. one
+    per worker process.
     """
 
-    def __init__(self, shock_probability: float, shock_magnitude: float):
+    def __init__(
+        self,
+        shock_probability: float,
+        shock_magnitude: float,
+        seed=None,
+    ):
         """
         Parameters
         ----------
@@ -16,24 +30,172 @@ class RobustnessEvaluator:
 
         shock_magnitude : float
             Multiplicative shock factor (e.g., 2.0 means doubling demand)
+
+        seed : int, np.random.SeedSequence or None
+            Seed of the shock stream (None draws fresh entropy)
         """
         self.shock_probability = shock_probability
         self.shock_magnitude = shock_magnitude
 
-    def apply_shocks(self, demand_series):
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self.seed_sequence = seed
+        self.rng = np.random.default_rng(seed)
+
+    def spawn(self, n: int) -> list:
+        """
+        Independent evaluators with the same shock parameters.
+
+        Parameters
+        ----------
+        n : int
+            Number of evaluators
+
+        Returns
+        -------
+        list[RobustnessEvaluator]
+            Evaluators seeded from children of this evaluator's
+            seed sequence
+        """
+        return [
+            RobustnessEvaluator(self.shock_probability, self.shock_magnitude, seed)
+            for seed in self.seed_sequence.spawn(n)
+        ]
+
+    def shock_mask(self, n_scenarios: int, num_periods: int) -> np.ndarray:
+        """
+        Boolean mask of shocked periods, shape (n_scenarios, T).
+        """
+        return self.rng.random((n_scenarios, num_periods)) < self.shock_probability
+
+    def apply_shocks(self, demand_series, n_scenarios: int | None = None):
         """
         Apply random demand shocks.
 
+        Parameters
+        ----------
+        demand_series : array-like
+            Demand series of length T
+
+        n_scenarios : int or None
+            Number of independent shock scenarios (None for one)
+
         Returns
         -------
         np.ndarray
-            Shocked demand series
+            Shocked demand series of shape (T,), or
+            (n_scenarios, T) when ``n_scenarios`` is given
+        """
+        demand = np.asarray(demand_series, dtype=float)
+
+        mask = self.shock_mask(1 if n_scenarios is None else n_scenarios, len(demand))
+        shocked = np.where(mask, demand * self.shock_magnitude, demand)
+
+        return shocked[0] if n_scenarios is None else shocked
+
+    def perturb(self, demand, rng: np.random.Generator) -> tuple:
+        """
+        Shock model interface used by ``StressTest``.
+
+        Parameters
+        ----------
+        demand : np.ndarray
+            Demand of shape (n, T)
+
+        rng : np.random.Generator
+            Random stream of the calling task
+
+        Returns
+        -------
+        tuple
+            (shocked demand, None); supply is not affected
+        """
+        mask = rng.random(demand.shape) < self.shock_probability
+        return np.where(mask, demand * self.shock_magnitude, demand), None
+
+    def evaluate(
+        self,
+        demand_series,
+        policy,
+        cost_model: CostModel,
+        initial_inventory: float,
+        n_scenarios: int = 1000,
+        lyapunov_estimator=None,
+        window: int = 50,
+        block_size: int = 1024,
+    ) -> dict:
+        """
+        Simulate a policy on many shocked copies of a demand series.
+
+        Scenarios are simulated side by side as the rows of one
+        batched simulation, ``block_size`` at a time.
+
+        Parameters
+        ----------
+        demand_series : array-like
+            Demand series of length T
+
+        policy : callable, object or sequence
+            Factory ``policy(n)`` returning a batched policy (or one
+            scalar policy per scenario) for n scenarios, or a
+            stateless batched policy shared by all scenarios
+
+        cost_model : CostModel
+            Cost model used to score each scenario
+
+        initial_inventory : float
+            Starting inventory
+
+        n_scenarios : int
+            Number of shock scenarios
+
+        lyapunov_estimator : object or None
+            Estimator exposing ``estimate_batch``, applied to the last
+            ``window`` inventory levels of each scenario
+
+        window : int
+            Length of the inventory tail used for stability metrics
+
+        block_size : int
+            Scenarios simulated together
+
+        Returns
+        -------
+        dict
+            Per-scenario ``total_cost``, ``service_level``,
+            ``stockout_events``, ``inventory_variance`` and
+            ``lyapunov_exponent``, each of shape (n_scenarios,)
         """
         demand = np.asarray(demand_series, dtype=float)
-        shocked = demand.copy()
+        # Streaming estimators define ``__len__``, so test for None
+        lyapunov = (
+            LyapunovExponentEstimator()
+            if lyapunov_estimator is None
+            else lyapunov_estimator
+        )
+        simulator = BatchInventorySimulator(initial_inventory, cost_model)
+
+        keys = (
+            "total_cost",
+            "service_level",
+            "stockout_events",
+            "inventory_variance",
+            "lyapunov_exponent",
+        )
+        out = {key: [] for key in keys}
+
+        for start in range(0, n_scenarios, block_size):
+            n = min(block_size, n_scenarios - start)
+            shocked = self.apply_shocks(demand, n)
+
+            batch_policy = policy(n) if callable(policy) else policy
+            res = simulator.run(shocked, batch_policy)
+
+            tail = res["inventory"][:, -window:]
+            res["inventory_variance"] = tail.var(axis=1)
+            res["lyapunov_exponent"] = lyapunov.estimate_batch(tail)
 
-        for t in range(len(shocked)):
-            if np.random.rand() < self.shock_probability:
-                shocked[t] *= self.shock_magnitude
+            for key in keys:
+                out[key].append(res[key])
 
-        return shocked
+        return {key: np.concatenate(values) for key, values in out.items()}
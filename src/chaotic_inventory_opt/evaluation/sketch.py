@@ -0,0 +1,221 @@
+import math
+
+import numpy as np
+
+
+class _Buckets:
+    """
+    Dense bucket counts over a contiguous range of integer keys.
+    """
+
+    __slots__ = ("counts", "offset")
+
+    def __init__(self):
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.offset = 0
+
+    def _cover(self, lo: int, hi: int):
+        if not len(self.counts):
+            self.counts = np.zeros(hi - lo + 1, dtype=np.int64)
+            self.offset = lo
+            return
+
+        start = min(lo, self.offset)
+        stop = max(hi + 1, self.offset + len(self.counts))
+        if start < self.offset or stop > self.offset + len(self.counts):
+            counts = np.zeros(stop - start, dtype=np.int64)
+            counts[self.offset - start:self.offset - start + len(self.counts)] = self.counts
+            self.counts = counts
+            self.offset = start
+
+    def add_key(self, key: int):
+        self._cover(key, key)
+        self.counts[key - self.offset] += 1
+
+    def add_keys(self, keys):
+        if not len(keys):
+            return
+        lo, hi = int(keys.min()), int(keys.max())
+        self._cover(lo, hi)
+        self.counts[lo - self.offset:hi + 1 - self.offset] += np.bincount(keys - lo)
+
+    def merge(self, other: "_Buckets"):
+        if not len(other.counts):
+            return
+        lo = other.offset
+        self._cover(lo, lo + len(other.counts) - 1)
+        self.counts[lo - self.offset:lo - self.offset + len(other.counts)] += other.counts
+
+    def items(self) -> tuple:
+        nz = np.flatnonzero(self.counts)
+        return nz + self.offset, self.counts[nz]
+
+
+class QuantileSketch:
+    """
+    Mergeable streaming quantile sketch with relative accuracy.
+
+    Values are counted in logarithmic buckets (as in DDSketch):
+    bucket k holds magnitudes in (gamma^(k-1), gamma^k] with
+    gamma = (1 + a) / (1 - a), so every quantile is returned within
+    a relative error a of an exact order statistic. Negative values
+    use mirrored buckets and magnitudes below ``min_value`` are
+    counted as zero.
+
+    Memory grows with the logarithm of the value range, not with
+    the number of samples. Merging adds bucket counts, which is
+    exact and order-independent, so sketches reduced from any split
+    of the data are identical.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-9):
+        """
+        Parameters
+        ----------
+        relative_accuracy : float
+            Relative error bound a of returned quantiles (0 < a < 1)
+
+        min_value : float
+            Magnitudes below this are counted in the zero bucket
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+
+        self._positive = _Buckets()
+        self._negative = _Buckets()
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _keys(self, magnitudes) -> np.ndarray:
+        return np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+
+    def add(self, value: float):
+        """
+        Add a single value (faster than ``update`` for scalars).
+        """
+        value = float(value)
+        if math.isnan(value):
+            return
+
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        magnitude = abs(value)
+        if magnitude < self.min_value:
+            self.zero_count += 1
+            return
+
+        key = math.ceil(math.log(magnitude) / self._log_gamma)
+        (self._positive if value > 0 else self._negative).add_key(key)
+
+    def update(self, values):
+        """
+        Add one value or an array of values.
+        """
+        x = np.asarray(values, dtype=float).ravel()
+        x = x[~np.isnan(x)]
+        if not len(x):
+            return
+
+        self.count += len(x)
+        self.min = min(self.min, float(x.min()))
+        self.max = max(self.max, float(x.max()))
+
+        small = np.abs(x) < self.min_value
+        self.zero_count += int(np.count_nonzero(small))
+
+        self._positive.add_keys(self._keys(x[(x > 0) & ~small]))
+        self._negative.add_keys(self._keys(-x[(x < 0) & ~small]))
+
+    def merge(self, other: "QuantileSketch"):
+        """
+        Add the counts of another sketch with the same accuracy.
+        """
+        if other.gamma != self.gamma or other.min_value != self.min_value:
+            raise ValueError("cannot merge sketches with different parameters")
+
+        self._positive.merge(other._positive)
+        self._negative.merge(other._negative)
+
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def quantile(self, q):
+        """
+        Approximate quantile(s) of the values seen so far.
+
+        Parameters
+        ----------
+        q : float or array-like
+            Quantile level(s) in [0, 1]
+
+        Returns
+        -------
+        float or np.ndarray
+            NaN when the sketch is empty
+        """
+        qs = np.atleast_1d(np.asarray(q, dtype=float))
+        if np.any((qs < 0) | (qs > 1)):
+            raise ValueError("quantiles must be in [0, 1]")
+
+        if self.count == 0:
+            out = np.full(len(qs), np.nan)
+            return out if np.ndim(q) else float(out[0])
+
+        # Buckets in increasing order of value with representative values
+        neg_keys, neg_counts = self._negative.items()
+        pos_keys, pos_counts = self._positive.items()
+
+        keys = np.concatenate((neg_keys[::-1], pos_keys)).astype(float)
+        sign = np.concatenate((-np.ones(len(neg_keys)), np.ones(len(pos_keys))))
+        counts = np.concatenate((neg_counts[::-1], [self.zero_count], pos_counts))
+
+        values = sign * 2 * self.gamma ** keys / (self.gamma + 1)
+        values = np.insert(values, len(neg_keys), 0.0)
+
+        cumulative = np.cumsum(counts)
+        ranks = qs * (self.count - 1)
+        idx = np.searchsorted(cumulative, ranks, side="right")
+
+        out = np.clip(values[np.minimum(idx, len(values) - 1)], self.min, self.max)
+        return out if np.ndim(q) else float(out[0])
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def optional_sketch(relative_accuracy):
+    """
+    A new ``QuantileSketch``, or None if ``relative_accuracy`` is None.
+    """
+    return None if relative_accuracy is None else QuantileSketch(relative_accuracy)
+
+
+def merge_optional(mine, theirs):
+    """
+    Merge two optional sketches in place of ``mine``.
+    """
+    if (mine is None) != (theirs is None):
+        raise ValueError("cannot merge metrics with and without distribution sketches")
+    if mine is not None:
+        mine.merge(theirs)
+
+
+def optional_quantiles(sketch, q):
+    """
+    Quantiles of an optional sketch.
+    """
+    if sketch is None:
+        raise ValueError("distribution sketches are disabled (relative_accuracy=None)")
+    return sketch.quantile(q)
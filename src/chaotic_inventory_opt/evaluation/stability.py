@@ -1,23 +1,77 @@
 import numpy as np
 from chaotic_inventory_opt.chaos.lyapunov import LyapunovExponentEstimator
+from chaotic_inventory_opt.evaluation.sketch import (
+    merge_optional,
+    optional_quantiles,
+    optional_sketch,
+)
+from chaotic_inventory_opt.utils.ring import RingBuffer, RingBuffer2D
+
+
+WINDOW_METRICS = ("inventory_variance", "lyapunov_exponent")
+
+
+def combine_moments(count_a, mean_a, m2_a, count_b, mean_b, m2_b) -> tuple:
+    """
+    Combine Welford moments of two disjoint samples.
+
+    Parallel form of Welford's algorithm (Chan et al.); works
+    elementwise on scalars or arrays.
+
+    Returns
+    -------
+    tuple
+        (count, mean, M2) of the union, where variance = M2 / count
+    """
+    count = count_a + count_b
+    weight = count_b / np.maximum(count, 1)
+    delta = mean_b - mean_a
+    mean = mean_a + delta * weight
+    m2 = m2_a + m2_b + delta**2 * count_a * weight
+    return count, mean, m2
 
 
 class StabilityMetrics:
     """
     Stability and chaos metrics for inventory trajectories.
+
+    Besides the inventory window, every level seen updates Welford
+    running moments and, if ``relative_accuracy`` is set, a
+    ``QuantileSketch`` of the inventory distribution. ``merge``
+    combines accumulators of disjoint parts of an evaluation:
+    moments with the parallel Welford formula, sketches exactly,
+    and window metrics as the mean over the merged parts.
     """
 
     def __init__(
         self,
         lyapunov_estimator: LyapunovExponentEstimator,
         window: int = 50,
+        relative_accuracy: float | None = None,
     ):
+        if getattr(lyapunov_estimator, "window", window) != window:
+            raise ValueError("lyapunov_estimator window must match window")
+
         self.lyapunov = lyapunov_estimator
         self.window = window
+        self.relative_accuracy = relative_accuracy
         self.reset()
 
     def reset(self):
-        self._inventory_trace = []
+        self._clear_window()
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.inventory_distribution = optional_sketch(self.relative_accuracy)
+
+        # Window metrics of parts folded in by ``merge``
+        self._window_sums = dict.fromkeys(WINDOW_METRICS, 0.0)
+        self._window_parts = 0
+
+    def _clear_window(self):
+        self._inventory_trace = RingBuffer(self.window)
+        if hasattr(self.lyapunov, "push"):
+            self.lyapunov.reset()
 
     def update(self, inventory: float):
         """
@@ -25,21 +79,254 @@ class StabilityMetrics:
         """
         self._inventory_trace.append(inventory)
 
-        if len(self._inventory_trace) > self.window:
-            self._inventory_trace.pop(0)
+        if hasattr(self.lyapunov, "push"):
+            self.lyapunov.push(inventory)
+
+        self.count += 1
+        delta = inventory - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (inventory - self.mean)
+
+        if self.inventory_distribution is not None:
+            self.inventory_distribution.add(inventory)
+
+    def _window_results(self) -> dict:
+        trace = self._inventory_trace.view()
+        variance = float(np.var(trace)) if len(trace) else 0.0
+
+        if len(trace) < 10:
+            lyap = 0.0
+        elif hasattr(self.lyapunov, "push"):
+            lyap = self.lyapunov.value()
+        else:
+            lyap = self.lyapunov.estimate(trace)
+
+        return {
+            "inventory_variance": variance,
+            "lyapunov_exponent": lyap,
+        }
+
+    def _window_totals(self) -> tuple:
+        sums = dict(self._window_sums)
+        parts = self._window_parts
+        if len(self._inventory_trace):
+            for key, value in self._window_results().items():
+                sums[key] += value
+            parts += 1
+        return sums, parts
+
+    def merge(self, other: "StabilityMetrics"):
+        """
+        Combine with the accumulator of a disjoint part.
+
+        The current window of each side becomes one part of the
+        window metrics; later updates start a new window.
+
+        Returns
+        -------
+        StabilityMetrics
+            ``self``
+        """
+        if other.window != self.window:
+            raise ValueError("cannot merge metrics with different windows")
+
+        mine, my_parts = self._window_totals()
+        theirs, their_parts = other._window_totals()
+        self._window_sums = {key: mine[key] + theirs[key] for key in WINDOW_METRICS}
+        self._window_parts = my_parts + their_parts
+        self._clear_window()
+
+        self.count, self.mean, self.m2 = combine_moments(
+            self.count, self.mean, self.m2, other.count, other.mean, other.m2
+        )
+        merge_optional(self.inventory_distribution, other.inventory_distribution)
+        return self
+
+    def quantiles(self, q) -> dict:
+        """
+        Approximate quantiles of the inventory level.
+        """
+        return {"inventory": optional_quantiles(self.inventory_distribution, q)}
 
     def results(self) -> dict:
         """
         Return stability metrics.
+
+        ``running_variance`` covers every level seen; the window
+        metrics are averaged over merged parts, if any.
         """
-        variance = float(np.var(self._inventory_trace)) if self._inventory_trace else 0.0
-        lyap = (
-            self.lyapunov.estimate(self._inventory_trace)
-            if len(self._inventory_trace) >= 10
-            else 0.0
+        if self._window_parts:
+            sums, parts = self._window_totals()
+            out = {key: sums[key] / parts for key in WINDOW_METRICS}
+        else:
+            out = self._window_results()
+
+        out["running_variance"] = float(self.m2 / self.count) if self.count else 0.0
+        return out
+
+
+class BatchStabilityMetrics:
+    """
+    ``StabilityMetrics`` for N SKUs held as arrays.
+
+    Each SKU keeps its own inventory window (one row of a
+    ``RingBuffer2D``) and Welford running moments over every level
+    seen, so traces of different SKUs are never mixed.
+
+    ``merge`` appends the SKUs of another accumulator, so shards of
+    a catalogue reduce to one accumulator in catalogue order; the
+    inventory sketch pools every SKU and period.
+    """
+
+    def __init__(
+        self,
+        n_skus: int,
+        lyapunov_estimator=None,
+        window: int = 50,
+        relative_accuracy: float | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        n_skus : int
+            Number of SKUs
+
+        lyapunov_estimator : object or None
+            Estimator exposing ``estimate_batch`` (or ``estimate``),
+            applied to the inventory window of each SKU
+
+        window : int
+            Length of the inventory window
+
+        relative_accuracy : float or None
+            Relative accuracy of the inventory distribution sketch used
+            by ``quantiles`` (None, the default, skips it)
+        """
+        self.n_skus = n_skus
+        # Streaming estimators define ``__len__``, so test for None
+        self.lyapunov = (
+            LyapunovExponentEstimator()
+            if lyapunov_estimator is None
+            else lyapunov_estimator
         )
+        self.window = window
+        self.relative_accuracy = relative_accuracy
+        self.reset()
+
+    def reset(self):
+        self._inventory_trace = RingBuffer2D(self.n_skus, self.window)
+        self.count = np.zeros(self.n_skus, dtype=np.int64)
+        self.mean = np.zeros(self.n_skus)
+        self.m2 = np.zeros(self.n_skus)
+        self.inventory_distribution = optional_sketch(self.relative_accuracy)
+
+    def update(self, inventory):
+        """
+        Update all SKUs with the inventory vector of one period.
+        """
+        x = np.asarray(inventory, dtype=float)
+        self._inventory_trace.append(x)
+
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+        if self.inventory_distribution is not None:
+            self.inventory_distribution.update(x)
+
+    def update_block(self, inventory):
+        """
+        Update all SKUs with an (N, T) block of consecutive levels.
+
+        Block moments are combined with the running ones by the
+        parallel form of Welford's algorithm.
+        """
+        X = np.asarray(inventory, dtype=float)
+        T = X.shape[1]
+        if T == 0:
+            return
+
+        trace = self._inventory_trace
+        if T < self.window and len(trace):
+            trace.fill(np.concatenate((trace.view(), X), axis=1))
+        else:
+            trace.fill(X)
+
+        block_mean = X.mean(axis=1)
+        block_m2 = ((X - block_mean[:, None]) ** 2).sum(axis=1)
+
+        self.count, self.mean, self.m2 = combine_moments(
+            self.count, self.mean, self.m2, T, block_mean, block_m2
+        )
+
+        if self.inventory_distribution is not None:
+            self.inventory_distribution.update(X)
+
+    def merge(self, other: "BatchStabilityMetrics"):
+        """
+        Append the SKUs of another accumulator.
+
+        Both must hold windows of the same length, e.g. shards of a
+        catalogue simulated over the same periods.
+
+        Returns
+        -------
+        BatchStabilityMetrics
+            ``self``, now holding ``n_skus + other.n_skus`` SKUs
+        """
+        if other.window != self.window:
+            raise ValueError("cannot merge metrics with different windows")
+        if len(other._inventory_trace) != len(self._inventory_trace):
+            raise ValueError("cannot merge metrics with windows of different lengths")
+
+        merge_optional(self.inventory_distribution, other.inventory_distribution)
+
+        views = (self._inventory_trace.view(), other._inventory_trace.view())
+        self.n_skus += other.n_skus
+        self._inventory_trace = RingBuffer2D(self.n_skus, self.window)
+        self._inventory_trace.fill(np.concatenate(views))
+
+        self.count = np.concatenate((self.count, other.count))
+        self.mean = np.concatenate((self.mean, other.mean))
+        self.m2 = np.concatenate((self.m2, other.m2))
+        return self
+
+    def quantiles(self, q) -> dict:
+        """
+        Approximate quantiles of the inventory level over all SKUs.
+        """
+        return {"inventory": optional_quantiles(self.inventory_distribution, q)}
+
+    def _lyapunov(self, trace) -> np.ndarray:
+        if trace.shape[1] < 10:
+            return np.zeros(len(trace))
+        if hasattr(self.lyapunov, "estimate_batch"):
+            return np.asarray(self.lyapunov.estimate_batch(trace), dtype=float)
+        return np.array([self.lyapunov.estimate(row) for row in trace], dtype=float)
+
+    def results(self) -> dict:
+        """
+        Return per-SKU stability metrics, each of shape (N,).
+
+        ``inventory_variance`` and ``lyapunov_exponent`` cover the
+        inventory window as in ``StabilityMetrics``;
+        ``running_variance`` covers every level seen.
+        """
+        trace = self._inventory_trace.view()
+        variance = trace.var(axis=1) if trace.shape[1] else np.zeros(self.n_skus)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            running = np.where(self.count > 0, self.m2 / self.count, 0.0)
 
         return {
             "inventory_variance": variance,
-            "lyapunov_exponent": lyap,
+            "lyapunov_exponent": self._lyapunov(trace),
+            "running_variance": running,
         }
+
+    def aggregate(self) -> dict:
+        """
+        Return the per-SKU stability metrics averaged over SKUs.
+        """
+        return {key: float(np.mean(v)) for key, v in self.results().items()}
@@ -0,0 +1,370 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from chaotic_inventory_opt.chaos.lyapunov import LyapunovExponentEstimator
+from chaotic_inventory_opt.core.batch import BatchInventorySimulator, as_batch_policy
+from chaotic_inventory_opt.core.cost import CostModel
+from chaotic_inventory_opt.data.store import DemandStore
+from chaotic_inventory_opt.evaluation.sketch import QuantileSketch
+from chaotic_inventory_opt.utils.parallel import (
+    attach_shared,
+    resolve_n_jobs,
+    shared_array,
+    split_range,
+)
+from chaotic_inventory_opt.utils.ring import RingBuffer2D
+
+
+STRESS_METRICS = (
+    "total_cost",
+    "service_level",
+    "stockout_events",
+    "lyapunov_exponent",
+    "inventory",
+)
+
+
+class RegimeSwitch:
+    """
+    Markov switching between a normal and a stressed demand regime.
+
+    Each period the regime flips with ``switch_probability``; demand
+    in the stressed regime is multiplied by ``scale``.
+    """
+
+    def __init__(self, switch_probability: float, scale: float):
+        """
+        Parameters
+        ----------
+        switch_probability : float
+            Probability of changing regime at each time step
+
+        scale : float
+            Demand multiplier in the stressed regime
+        """
+        self.switch_probability = switch_probability
+        self.scale = scale
+
+    def perturb(self, demand, rng: np.random.Generator) -> tuple:
+        flips = rng.random(demand.shape) < self.switch_probability
+        stressed = np.cumsum(flips, axis=1) % 2 == 1
+        return np.where(stressed, demand * self.scale, demand), None
+
+
+class SupplyInterruption:
+    """
+    Random supply outages during which orders are not delivered.
+
+    An outage starts with ``probability`` at each time step and
+    lasts ``duration`` periods.
+    """
+
+    def __init__(self, probability: float, duration: int):
+        """
+        Parameters
+        ----------
+        probability : float
+            Probability of an outage starting at each time step
+
+        duration : int
+            Length of an outage in periods
+        """
+        if duration < 1:
+            raise ValueError("duration must be >= 1")
+
+        self.probability = probability
+        self.duration = duration
+
+    def perturb(self, demand, rng: np.random.Generator) -> tuple:
+        starts = rng.random(demand.shape) < self.probability
+
+        # Period t is blocked if an outage started in (t - duration, t]
+        c = np.cumsum(starts, axis=1)
+        lagged = np.zeros_like(c)
+        lagged[:, self.duration:] = c[:, :-self.duration]
+        blocked = c - lagged > 0
+
+        return demand, ~blocked
+
+
+def _shock_name(model, i: int) -> str:
+    return f"{i}:{type(model).__name__}"
+
+
+# Worker-process state, populated once per worker by ``_init_worker``
+_WORKER = {}
+
+
+def _init_worker(source):
+    _WORKER.clear()
+    if isinstance(source, str):
+        _WORKER["demand"] = DemandStore(source).demand
+    else:
+        _WORKER["shm"], _WORKER["demand"] = attach_shared(source)
+
+
+def _run_task(task, config) -> dict:
+    """
+    Simulate one (shock model, SKU block, scenario block) task.
+
+    Returns per-metric sketches and per-SKU sums, never trajectories.
+    """
+    demand = _WORKER["demand"]
+    shock, rows, n_scenarios, seed = task
+
+    rng = np.random.default_rng(seed)
+    base = np.asarray(demand[rows[0]:rows[-1] + 1], dtype=float)
+    nb, T = base.shape
+
+    # Scenario-major copies of every SKU in the block: row s * nb + i
+    D = np.tile(base, (n_scenarios, 1))
+    D, supply = shock.perturb(D, rng)
+
+    n = len(D)
+    policy = as_batch_policy(config["policy_factory"](n))
+    observe = getattr(policy, "observe_batch", None)
+
+    cost_model = config["cost_model"].select(np.tile(rows, n_scenarios))
+    sim = BatchInventorySimulator(config["initial_inventory"], cost_model)
+    sim.reset(n)
+    tail = RingBuffer2D(n, config["window"])
+    inventory = QuantileSketch(config["relative_accuracy"])
+
+    D_t = np.ascontiguousarray(D.T)
+    supply_t = None if supply is None else np.ascontiguousarray(supply.T)
+
+    for t in range(T):
+        if observe is not None:
+            observe(D_t[t])
+
+        order = np.asarray(policy.order_batch(sim.I), dtype=float)
+        if supply_t is not None:
+            order = np.where(supply_t[t], order, 0.0)
+
+        level = sim.step(D_t[t], order)
+        tail.append(level)
+        inventory.update(level)
+
+    res = sim.results()
+    res["lyapunov_exponent"] = config["lyapunov"].estimate_batch(tail.view())
+
+    sketches = {"inventory": inventory}
+    sku_sums = {}
+    for metric in STRESS_METRICS[:-1]:
+        values = np.asarray(res[metric], dtype=float)
+        sketch = QuantileSketch(config["relative_accuracy"])
+        sketch.update(values)
+        sketches[metric] = sketch
+        sku_sums[metric] = values.reshape(n_scenarios, nb).sum(axis=0)
+
+    return {"sketches": sketches, "sku_sums": sku_sums}
+
+
+class StressTest:
+    """
+    Monte-Carlo stress testing of a policy across a catalogue.
+
+    For every shock model the catalogue is split into (SKU block,
+    scenario block) tasks that run on a process pool. Each task
+    draws its shocks from its own child of one ``SeedSequence``,
+    spawned in a fixed task order, and returns only quantile
+    sketches and per-SKU sums. Results are merged in task order, so
+    they are bit-identical whatever the number of workers.
+
+    Shock models expose ``perturb(demand, rng)`` returning the
+    shocked (n, T) demand and an optional (n, T) supply mask
+    (False where orders are not delivered), e.g.
+    ``RobustnessEvaluator``, ``RegimeSwitch`` and
+    ``SupplyInterruption``.
+    """
+
+    def __init__(
+        self,
+        policy_factory,
+        cost_model: CostModel,
+        initial_inventory: float,
+        lyapunov_estimator=None,
+        window: int = 50,
+        relative_accuracy: float = 0.01,
+    ):
+        """
+        Parameters
+        ----------
+        policy_factory : callable
+            Picklable ``policy_factory(n)`` returning a batched policy
+            (or n scalar policies) for n simulated series
+
+        cost_model : CostModel
+            Cost model used to score each scenario; per-SKU parameters
+            are indexed by catalogue row
+
+        initial_inventory : float
+            Starting inventory
+
+        lyapunov_estimator : object or None
+            Estimator exposing ``estimate_batch``, applied to the last
+            ``window`` inventory levels of each scenario
+
+        window : int
+            Length of the inventory tail used for the Lyapunov exponent
+
+        relative_accuracy : float
+            Relative error of the quantile sketches
+        """
+        self.policy_factory = policy_factory
+        self.cost_model = cost_model
+        self.initial_inventory = float(initial_inventory)
+        # Streaming estimators define ``__len__``, so test for None
+        self.lyapunov = (
+            LyapunovExponentEstimator()
+            if lyapunov_estimator is None
+            else lyapunov_estimator
+        )
+        self.window = window
+        self.relative_accuracy = relative_accuracy
+
+    def run(
+        self,
+        source,
+        shocks,
+        n_scenarios: int,
+        seed=None,
+        rows=None,
+        sku_block: int = 256,
+        scenario_block: int = 64,
+        n_jobs: int = 1,
+        quantiles=(0.05, 0.25, 0.5, 0.75, 0.95),
+    ) -> dict:
+        """
+        Stress test every SKU under every shock model.
+
+        Parameters
+        ----------
+        source : DemandStore or np.ndarray
+            Demand catalogue of shape (N, T)
+
+        shocks : list
+            Shock models exposing ``perturb``
+
+        n_scenarios : int
+            Scenarios per SKU and shock model
+
+        seed : int, np.random.SeedSequence or None
+            Root seed of all tasks
+
+        rows : array-like or None
+            Sorted subset of catalogue rows to test
+
+        sku_block : int
+            Contiguous catalogue rows per task
+
+        scenario_block : int
+            Scenarios per task
+
+        n_jobs : int
+            Worker processes (1 runs in-process, -1 uses all cores)
+
+        quantiles : tuple[float]
+            Quantile levels reported in the summary
+
+        Returns
+        -------
+        dict
+            Shock name -> {``quantiles``: metric -> array of values at
+            ``quantiles``, ``sketches``: metric -> QuantileSketch,
+            ``sku_mean``: metric -> per-SKU mean over scenarios}.
+            Metrics are ``STRESS_METRICS``; ``inventory`` covers every
+            simulated inventory level.
+        """
+        if isinstance(source, DemandStore):
+            init_source, N = str(source.path), len(source)
+        else:
+            source = np.asarray(source, dtype=float)
+            init_source, N = None, len(source)
+
+        rows = np.arange(N) if rows is None else np.asarray(rows, dtype=np.int64)
+        if np.any(np.diff(rows) <= 0):
+            raise ValueError("rows must be sorted and unique")
+
+        # Tasks cover contiguous runs of ``rows`` so workers read slices
+        breaks = np.flatnonzero(np.diff(rows) != 1) + 1
+        runs = [
+            run[start:stop]
+            for run in np.split(rows, breaks)
+            for start, stop in split_range(len(run), sku_block)
+        ]
+
+        tasks, owners = [], []
+        for i, shock in enumerate(shocks):
+            for sku_rows in runs:
+                for start, stop in split_range(n_scenarios, scenario_block):
+                    tasks.append((shock, sku_rows, stop - start))
+                    owners.append(i)
+
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        tasks = [task + (s,) for task, s in zip(tasks, seed.spawn(len(tasks)))]
+
+        config = {
+            "policy_factory": self.policy_factory,
+            "cost_model": self.cost_model,
+            "initial_inventory": self.initial_inventory,
+            "lyapunov": self.lyapunov,
+            "window": self.window,
+            "relative_accuracy": self.relative_accuracy,
+        }
+
+        n_jobs = resolve_n_jobs(n_jobs)
+        if n_jobs == 1 or len(tasks) <= 1:
+            if init_source is None:
+                _WORKER.clear()
+                _WORKER["demand"] = source
+            else:
+                _init_worker(init_source)
+            try:
+                outputs = [_run_task(task, config) for task in tasks]
+            finally:
+                _WORKER.clear()
+        elif init_source is None:
+            with shared_array(source) as spec, ProcessPoolExecutor(
+                n_jobs, initializer=_init_worker, initargs=(spec,)
+            ) as pool:
+                outputs = list(pool.map(_run_task, tasks, [config] * len(tasks)))
+        else:
+            with ProcessPoolExecutor(
+                n_jobs, initializer=_init_worker, initargs=(init_source,)
+            ) as pool:
+                outputs = list(pool.map(_run_task, tasks, [config] * len(tasks)))
+
+        return self._reduce(shocks, owners, tasks, outputs, rows, n_scenarios, quantiles)
+
+    def _reduce(
+        self, shocks, owners, tasks, outputs, rows, n_scenarios, quantiles
+    ) -> dict:
+        position = {int(r): i for i, r in enumerate(rows)}
+        results = {}
+
+        for i, shock in enumerate(shocks):
+            sketches = {m: QuantileSketch(self.relative_accuracy) for m in STRESS_METRICS}
+            sku_sums = {m: np.zeros(len(rows)) for m in STRESS_METRICS[:-1]}
+
+            for owner, task, out in zip(owners, tasks, outputs):
+                if owner != i:
+                    continue
+                idx = [position[int(r)] for r in task[1]]
+                for m in STRESS_METRICS:
+                    sketches[m].merge(out["sketches"][m])
+                for m, values in out["sku_sums"].items():
+                    sku_sums[m][idx] += values
+
+            results[_shock_name(shock, i)] = {
+                "quantiles": {
+                    m: sketch.quantile(np.asarray(quantiles))
+                    for m, sketch in sketches.items()
+                },
+                "sketches": sketches,
+                "sku_mean": {m: s / n_scenarios for m, s in sku_sums.items()},
+            }
+
+        return results
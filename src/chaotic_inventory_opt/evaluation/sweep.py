@@ -0,0 +1,400 @@
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from chaotic_inventory_opt.chaos.lyapunov import StreamingLyapunovEstimator
+from chaotic_inventory_opt.control.fcio import SMOOTHING_STEPS
+from chaotic_inventory_opt.core.batch import BatchInventorySimulator
+from chaotic_inventory_opt.core.cost import CostModel
+from chaotic_inventory_opt.fractal.hurst import IncrementalHurstEstimator
+from chaotic_inventory_opt.utils.parallel import resolve_n_jobs, split_range
+from chaotic_inventory_opt.utils.ring import RingBuffer, RollingMean
+
+
+FCIO_PARAMETERS = (
+    "base_stock_level",
+    "reorder_point",
+    "alpha",
+    "beta",
+    "scale_min",
+    "scale_max",
+    "rho",
+    "gamma",
+    "k_cap",
+    "window",
+)
+
+METRICS = ("total_cost", "service_level", "stockout_events")
+
+
+def _fcio_features(demand, window: int) -> dict:
+    """
+    Parameter-independent FCIO signals for one demand series.
+
+    H, λ (after 5-step smoothing) and the window mean depend only on
+    the demand and the window length, so they are shared by every
+    parameter combination with the same window.
+    """
+    hurst = IncrementalHurstEstimator(window=window)
+    lyapunov = StreamingLyapunovEstimator(window=window)
+    buffer = RingBuffer(window)
+    H_hist = RollingMean(SMOOTHING_STEPS)
+    lam_hist = RollingMean(SMOOTHING_STEPS)
+
+    T = len(demand)
+    ready = np.zeros(T, dtype=bool)
+    H = np.full(T, 0.5)
+    lam = np.zeros(T)
+    avg = np.zeros(T)
+
+    for t, d in enumerate(demand):
+        d = float(d)
+        buffer.append(d)
+        hurst.push(d)
+        lyapunov.push(d)
+
+        if len(buffer) < 10:
+            continue
+
+        H_hist.append(hurst.value())
+        lam_hist.append(lyapunov.value())
+
+        ready[t] = True
+        H[t] = H_hist.mean()
+        lam[t] = lam_hist.mean()
+        avg[t] = buffer.view().mean()
+
+    return {"ready": ready, "H": H, "lam": lam, "avg": avg}
+
+
+def _simulate_grid(demand, features, params, cost_model, initial_inventory) -> dict:
+    """
+    Run FCIO for C parameter combinations on one series in lockstep.
+
+    ``params`` maps parameter name -> array of shape (C,). Orders
+    follow ``FCIOPolicy.order`` exactly, with one vector operation
+    per period across all combinations.
+    """
+    C = len(params["alpha"])
+    S0 = params["base_stock_level"]
+    S0_floor = np.maximum(S0, 1.0)
+
+    sim = BatchInventorySimulator(initial_inventory, cost_model)
+    sim.reset(C)
+    backlog = np.zeros(C)
+
+    for t, d in enumerate(demand):
+        d = float(d)
+        backlog = params["rho"] * backlog + np.maximum(0.0, d - backlog)
+
+        if features["ready"][t]:
+            raw_scale = np.exp(
+                -params["alpha"] * features["lam"][t]
+                + params["beta"] * (features["H"][t] - 0.5)
+            )
+            scale = np.minimum(
+                np.maximum(raw_scale, params["scale_min"]), params["scale_max"]
+            )
+            effective_inventory = sim.I - params["gamma"] * backlog
+            k = np.minimum(params["k_cap"], features["avg"][t] / S0_floor)
+            order = np.maximum(0.0, k * (S0 * scale - effective_inventory))
+        else:
+            order = np.maximum(0.0, S0 - sim.I)
+
+        sim.step(d, order)
+
+    return sim.results()
+
+
+# Worker-process state, populated once per worker by ``_init_worker``
+_WORKER = {}
+
+
+def _init_worker(demand, cost, initial_inventory):
+    _WORKER.clear()
+    _WORKER["demand"] = demand
+    _WORKER["cost_model"] = CostModel(*cost)
+    _WORKER["initial_inventory"] = initial_inventory
+    _WORKER["features"] = {}
+
+
+def _run_task(window: int, indices, params: dict) -> tuple:
+    features = _WORKER["features"].get(window)
+    if features is None:
+        features = _fcio_features(_WORKER["demand"], window)
+        _WORKER["features"][window] = features
+
+    res = _simulate_grid(
+        _WORKER["demand"],
+        features,
+        params,
+        _WORKER["cost_model"],
+        _WORKER["initial_inventory"],
+    )
+    return indices, res
+
+
+def pareto_front(total_cost, service_level) -> np.ndarray:
+    """
+    Boolean mask of cost/service-level Pareto-optimal results.
+
+    A result is on the front if no other result has lower or equal
+    cost and strictly higher service level (or equal service level
+    and strictly lower cost).
+    """
+    cost = np.asarray(total_cost, dtype=float)
+    sl = np.asarray(service_level, dtype=float)
+
+    order = np.lexsort((-sl, cost))
+    best_sl = np.maximum.accumulate(sl[order])
+    prev_best = np.concatenate(([-np.inf], best_sl[:-1]))
+
+    mask = np.zeros(len(cost), dtype=bool)
+    mask[order] = sl[order] > prev_best
+    return mask
+
+
+class FCIOSweep:
+    """
+    Grid search over FCIO hyperparameters on one demand series.
+
+    All combinations sharing a ``window`` are simulated in lockstep
+    as one vector. The window-dependent H/λ signals are computed
+    once per worker and window, and combinations are spread over
+    a process pool in chunks. Each finished result is appended to
+    a JSON-lines file, so an interrupted sweep resumes where it
+    stopped.
+    """
+
+    def __init__(
+        self,
+        demand,
+        cost_model: CostModel,
+        initial_inventory: float,
+        base_params: dict | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        demand : array-like
+            Demand series, loaded once and shared with every worker
+
+        cost_model : CostModel
+            Cost model used to score each combination
+
+        initial_inventory : float
+            Starting inventory
+
+        base_params : dict or None
+            Values for FCIO parameters that are not swept
+        """
+        self.demand = np.asarray(demand, dtype=float)
+        self.cost_model = cost_model
+        self.initial_inventory = float(initial_inventory)
+        self.base_params = dict(base_params or {})
+
+    def combinations(self, grid: dict) -> dict:
+        """
+        Expand a grid into columnar parameter arrays.
+
+        Parameters
+        ----------
+        grid : dict
+            Parameter name -> list of values to sweep
+
+        Returns
+        -------
+        dict
+            Parameter name -> array over all combinations, in
+            ``itertools.product`` order over ``FCIO_PARAMETERS``
+        """
+        unknown = set(grid) | set(self.base_params)
+        unknown -= set(FCIO_PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown FCIO parameters: {sorted(unknown)}")
+
+        missing = [
+            p for p in FCIO_PARAMETERS
+            if p not in grid and p not in self.base_params
+        ]
+        if missing:
+            raise ValueError(f"Missing FCIO parameters: {missing}")
+
+        axes = [
+            list(grid[p]) if p in grid else [self.base_params[p]]
+            for p in FCIO_PARAMETERS
+        ]
+        rows = list(itertools.product(*axes))
+
+        combos = {
+            p: np.array([row[i] for row in rows], dtype=float)
+            for i, p in enumerate(FCIO_PARAMETERS)
+        }
+        combos["window"] = combos["window"].astype(int)
+        return combos
+
+    def run(
+        self,
+        grid: dict,
+        output_path=None,
+        n_jobs: int = 1,
+        chunk_size: int = 256,
+    ) -> dict:
+        """
+        Evaluate every combination of the grid.
+
+        Parameters
+        ----------
+        grid : dict
+            Parameter name -> list of values to sweep
+
+        output_path : str or Path or None
+            JSON-lines file receiving one record per combination.
+            If it exists and was written for the same sweep (grid,
+            parameters, demand, cost model and initial inventory),
+            finished combinations are skipped.
+
+        n_jobs : int
+            Worker processes (1 runs in-process, -1 uses all cores)
+
+        chunk_size : int
+            Combinations simulated together in one task
+
+        Returns
+        -------
+        dict
+            Columnar results: ``index``, every FCIO parameter,
+            ``total_cost``, ``service_level``, ``stockout_events``
+            and ``pareto`` (mask of the cost/service frontier)
+        """
+        combos = self.combinations(grid)
+        C = len(combos["alpha"])
+
+        header = {
+            "grid": {k: list(map(float, v)) for k, v in sorted(grid.items())},
+            "base_params": {k: float(v) for k, v in sorted(self.base_params.items())},
+            "num_periods": len(self.demand),
+            "demand_sha256": hashlib.sha256(
+                np.ascontiguousarray(self.demand).tobytes()
+            ).hexdigest(),
+            "cost": [
+                np.asarray(v, dtype=float).tolist()
+                for v in (self.cost_model.h, self.cost_model.p, self.cost_model.k)
+            ],
+            "initial_inventory": self.initial_inventory,
+        }
+
+        metrics = {
+            "total_cost": np.full(C, np.nan),
+            "service_level": np.full(C, np.nan),
+            "stockout_events": np.full(C, -1, dtype=np.int64),
+        }
+        done = np.zeros(C, dtype=bool)
+
+        out = None
+        if output_path is not None:
+            for record in self._read_records(output_path, header):
+                i = record["index"]
+                done[i] = True
+                for m in METRICS:
+                    metrics[m][i] = record[m]
+
+            fresh = not os.path.exists(output_path) or os.path.getsize(output_path) == 0
+            out = open(output_path, "a")
+            if fresh:
+                out.write(json.dumps({"header": header}) + "\n")
+                out.flush()
+
+        tasks = []
+        for window in np.unique(combos["window"]):
+            todo = np.flatnonzero((combos["window"] == window) & ~done)
+            for start, stop in split_range(len(todo), chunk_size):
+                idx = todo[start:stop]
+                params = {p: combos[p][idx] for p in FCIO_PARAMETERS}
+                tasks.append((int(window), idx, params))
+
+        cost = (self.cost_model.h, self.cost_model.p, self.cost_model.k)
+        initargs = (self.demand, cost, self.initial_inventory)
+
+        def collect(indices, res):
+            for m in METRICS:
+                metrics[m][indices] = res[m]
+            if out is not None:
+                for j, i in enumerate(indices):
+                    record = {"index": int(i)}
+                    record.update({p: float(combos[p][i]) for p in FCIO_PARAMETERS})
+                    record.update({m: res[m][j].item() for m in METRICS})
+                    out.write(json.dumps(record) + "\n")
+                out.flush()
+                os.fsync(out.fileno())
+
+        try:
+            n_jobs = resolve_n_jobs(n_jobs)
+            if n_jobs == 1 or len(tasks) <= 1:
+                _init_worker(*initargs)
+                for task in tasks:
+                    collect(*_run_task(*task))
+            else:
+                with ProcessPoolExecutor(
+                    n_jobs, initializer=_init_worker, initargs=initargs
+                ) as pool:
+                    futures = [pool.submit(_run_task, *task) for task in tasks]
+                    for future in as_completed(futures):
+                        collect(*future.result())
+        finally:
+            if out is not None:
+                out.close()
+
+        result = {"index": np.arange(C)}
+        result.update(combos)
+        result.update(metrics)
+        result["pareto"] = pareto_front(
+            metrics["total_cost"], metrics["service_level"]
+        )
+        return result
+
+    @staticmethod
+    def _read_records(path, header) -> list:
+        """
+        Records already written to ``path``.
+
+        A torn final line left by an interrupted write is truncated
+        so that appending can continue cleanly.
+        """
+        if not os.path.exists(path):
+            return []
+
+        records = []
+        offset = 0
+
+        with open(path, "rb") as f:
+            lines = f.readlines()
+
+        for n, line in enumerate(lines):
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("incomplete line")
+                record = json.loads(line)
+            except ValueError:
+                if n == len(lines) - 1:
+                    with open(path, "r+b") as f:
+                        f.truncate(offset)
+                    break
+                raise
+
+            offset += len(line)
+
+            if n == 0:
+                if record.get("header") != header:
+                    raise ValueError(
+                        f"{path} was written for a different sweep"
+                    )
+                continue
+
+            records.append(record)
+
+        return records
@@ -5,10 +5,11 @@ This module provides tools to quantify long-range dependence
 and memory structure in demand time series.
 """
 
-from .hurst import HurstEstimator
+from .hurst import HurstEstimator, IncrementalHurstEstimator
 from .rs_analysis import RSAnalysis
 
 __all__ = [
     "HurstEstimator",
+    "IncrementalHurstEstimator",
     "RSAnalysis",
 ]
@@ -1,5 +1,9 @@
 import numpy as np
 
+from chaotic_inventory_opt.utils.regression import masked_slope
+from chaotic_inventory_opt.utils.ring import RingBuffer
+from chaotic_inventory_opt.utils.rolling import window_starts, window_sums
+
 
 class HurstEstimator:
     """
@@ -61,3 +65,276 @@ class HurstEstimator:
         slope, _ = np.polyfit(np.log(lags), np.log(tau), 1)
         return float(slope)
 
+    def estimate_batch(self, matrix) -> np.ndarray:
+        """
+        Estimate Hurst exponents for many series of equal length.
+
+        Parameters
+        ----------
+        matrix : array-like
+            2-D array of shape (N, T), one series per row
+
+        Returns
+        -------
+        np.ndarray
+            Estimated Hurst exponents of shape (N,)
+        """
+        X = np.asarray(matrix, dtype=float)
+        if X.ndim != 2:
+            raise ValueError("matrix must be a 2-D array")
+
+        if X.shape[1] < self.max_lag + 1:
+            return np.full(X.shape[0], 0.5)
+
+        lags = np.arange(self.min_lag, self.max_lag + 1)
+        tau = np.empty((X.shape[0], len(lags)))
+
+        for j, lag in enumerate(lags):
+            tau[:, j] = np.std(X[:, lag:] - X[:, :-lag], axis=1)
+
+        valid = tau > 1e-8
+        log_tau = np.log(np.where(valid, tau, 1.0))
+
+        return masked_slope(np.log(lags), log_tau, valid, default=0.5)
+
+    def estimate_rolling(self, series, window: int, step: int = 1) -> np.ndarray:
+        """
+        Hurst exponent of every sliding window of a series.
+
+        For each lag the lagged differences are reduced to windowed
+        sums of d and d^2 with one cumulative sum, so all windows
+        cost O(T * num_lags) in total. Windows whose differences are
+        constant are detected exactly (by counting value changes),
+        as in ``estimate``.
+
+        Parameters
+        ----------
+        series : array-like
+            Time series data
+
+        window : int
+            Window length
+
+        step : int
+            Offset between consecutive windows
+
+        Returns
+        -------
+        np.ndarray
+            Estimate for the window starting at i * step, one per window
+        """
+        x = np.asarray(series, dtype=float)
+        starts = window_starts(len(x), window, step)
+
+        if window < self.max_lag + 1 or len(starts) == 0:
+            return np.full(len(starts), 0.5)
+
+        lags = np.arange(self.min_lag, self.max_lag + 1)
+        tau = np.zeros((len(starts), len(lags)))
+
+        for j, lag in enumerate(lags):
+            d = x[lag:] - x[:-lag]
+            n = window - lag
+
+            # Centering keeps the cumulative sums small
+            dc = d - d.mean()
+            mean = window_sums(dc, starts, n) / n
+            var = np.maximum(window_sums(dc * dc, starts, n) / n - mean * mean, 0.0)
+
+            changes = window_sums(d[1:] != d[:-1], starts, n - 1)
+            tau[:, j] = np.where(changes > 0, np.sqrt(var), 0.0)
+
+        valid = tau > 1e-8
+        log_tau = np.log(np.where(valid, tau, 1.0))
+
+        return masked_slope(np.log(lags), log_tau, valid, default=0.5)
+
+
+
+class IncrementalHurstEstimator(HurstEstimator):
+    """
+    Streaming Hurst estimator over a sliding window.
+
+    For every lag the running sum and sum of squares of the lagged
+    differences x_t - x_{t-lag} inside the window are maintained,
+    so pushing one sample (and evicting the oldest) costs
+    O(max_lag) instead of O(window * max_lag). ``value()`` returns
+    the same estimate as ``HurstEstimator.estimate`` on the window.
+
+    As in ``estimate_rolling``, lags whose differences are constant
+    are detected exactly, here by counting value changes between
+    consecutive differences, so rounding leftovers of the running
+    sums never pass for variance. Lags whose running variance is
+    within rounding error of zero are recomputed from the window.
+    """
+
+    def __init__(
+        self,
+        window: int = 50,
+        min_lag: int = 2,
+        max_lag: int = 20,
+    ):
+        """
+        Parameters
+        ----------
+        window : int
+            Number of most recent samples the estimate covers
+
+        min_lag : int
+            Minimum lag used in scaling analysis
+
+        max_lag : int
+            Maximum lag used in scaling analysis
+        """
+        super().__init__(min_lag=min_lag, max_lag=max_lag)
+
+        if window < 1:
+            raise ValueError("window must be positive")
+
+        self.window = window
+
+        # Regression design constants for the full set of lags
+        self._lags = np.arange(min_lag, max_lag + 1)
+        self._log_lags = np.log(self._lags)
+        self._log_lags_c = self._log_lags - self._log_lags.mean()
+        self._ssx = float(np.sum(self._log_lags_c ** 2))
+
+        # Indices into a full window (before eviction) of the evicted
+        # first difference, its successor, the new last difference
+        # and its predecessor, when every lag has all four
+        lags = self._lags
+        if window > max_lag + 1:
+            self._full_idx = (lags, lags + 1, window - lags, window - 1 - lags)
+        else:
+            self._full_idx = None
+
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the window and running sums.
+        """
+        self._x = RingBuffer(self.window)
+        self._sum = np.zeros(len(self._lags))
+        self._sumsq = np.zeros(len(self._lags))
+        self._changes = np.zeros(len(self._lags), dtype=np.int64)
+        self._pushes = 0
+
+    def _recompute(self):
+        # Exact refresh of the running sums to bound rounding drift
+        x = self._x.view()
+        for j, lag in enumerate(self._lags):
+            d = x[lag:] - x[:-lag]
+            self._sum[j] = d.sum()
+            self._sumsq[j] = np.dot(d, d)
+            self._changes[j] = np.count_nonzero(d[1:] != d[:-1])
+
+    def restore(self, values):
+        """
+        Rebuild the state from the most recent samples.
+
+        Equivalent (up to rounding) to ``reset`` followed by pushing
+        the last ``window`` of ``values``, in O(window * max_lag).
+        """
+        self.reset()
+        self._x.fill(np.asarray(values, dtype=float))
+        self._recompute()
+
+    def push(self, value: float):
+        """
+        Add one sample, evicting the oldest once the window is full.
+        """
+        value = float(value)
+        x = self._x.view()
+        n = len(x)
+
+        if self._x.full and self._full_idx is not None:
+            first, second, last, before_last = self._full_idx
+            d_old = x[first] - x[0]
+            d_new = value - x[last]
+
+            self._sum += d_new - d_old
+            self._sumsq += d_new * d_new - d_old * d_old
+            self._changes += (x[-1] - x[before_last] != d_new).astype(np.int64) - (
+                x[second] - x[1] != d_old
+            )
+        else:
+            self._push_partial(value, x, n)
+
+        self._x.append(value)
+
+        self._pushes += 1
+        if self._pushes % self.window == 0:
+            self._recompute()
+
+    def _push_partial(self, value: float, x, n: int):
+        # General update while lags are only partly covered
+        lags = self._lags
+
+        if self._x.full:
+            # Differences that start at the evicted sample
+            active = lags < n
+            d = x[lags[active]] - x[0]
+            self._sum[active] -= d
+            self._sumsq[active] -= d * d
+
+            # ... and whether the next difference of each lag differs
+            paired = lags < n - 1
+            if paired.any():
+                self._changes[paired] -= (
+                    x[lags[paired] + 1] - x[1] != d[paired[active]]
+                )
+            x = x[1:]
+            n -= 1
+
+        active = lags <= n
+        d = value - x[n - lags[active]]
+        self._sum[active] += d
+        self._sumsq[active] += d * d
+
+        # Change from the previous last difference of each lag
+        paired = lags < n
+        if paired.any():
+            self._changes[paired] += (
+                x[n - 1] - x[n - 1 - lags[paired]] != d[paired[active]]
+            )
+
+    def value(self) -> float:
+        """
+        Hurst exponent of the current window.
+        """
+        n = len(self._x)
+        if n < self.max_lag + 1:
+            return 0.5
+
+        count = n - self._lags
+        mean = self._sum / count
+        mean_sq = self._sumsq / count
+        var = mean_sq - mean * mean
+        if not self._changes.all():
+            var[self._changes == 0] = 0.0
+
+        # Variances within rounding error of zero: exactly zero for
+        # constant differences, recomputed from the window otherwise
+        suspect = var < 1e-10 * mean_sq
+        if suspect.any():
+            x = self._x.view()
+            for j in np.flatnonzero(suspect):
+                if self._changes[j]:
+                    lag = self._lags[j]
+                    var[j] = np.var(x[lag:] - x[:-lag])
+
+        valid = var > 1e-16
+
+        n_valid = int(np.count_nonzero(valid))
+        if n_valid < 2:
+            return 0.5
+
+        log_tau = 0.5 * np.log(var[valid])
+
+        if n_valid == len(self._lags):
+            return float(np.dot(self._log_lags_c, log_tau) / self._ssx)
+
+        lx = self._log_lags[valid]
+        lx = lx - lx.mean()
+        return float(np.dot(lx, log_tau) / np.dot(lx, lx))
@@ -1,9 +1,20 @@
 import numpy as np
 
+from chaotic_inventory_opt.utils.regression import masked_slope
+from chaotic_inventory_opt.utils.rolling import rolling_window
+
+
+DEFAULT_WINDOW_SIZES = (10, 20, 50, 100, 200)
+
 
 class RSAnalysis:
     """
     Rescaled Range (R/S) analysis for Hurst exponent estimation.
+
+    For every window size the series is reshaped into
+    (num_segments, size) and R/S is computed for all segments in
+    one pass. The (size, num_segments) plan is cached per series
+    length.
     """
 
     def __init__(self, window_sizes=None):
@@ -15,6 +26,22 @@ class RSAnalysis:
             If None, defaults are inferred from data length.
         """
         self.window_sizes = window_sizes
+        self._plans = {}
+
+    def _plan(self, N: int) -> tuple:
+        sizes = tuple(
+            self.window_sizes
+            if self.window_sizes is not None
+            else DEFAULT_WINDOW_SIZES
+        )
+        key = (N, sizes)
+
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = tuple((size, N // size) for size in sizes if size < N)
+            self._plans[key] = plan
+
+        return plan
 
     def estimate(self, series) -> float:
         """
@@ -31,40 +58,97 @@ class RSAnalysis:
             Estimated Hurst exponent
         """
         x = np.asarray(series, dtype=float)
-        N = len(x)
+        return float(self.estimate_batch(x[None, :])[0])
+
+    def estimate_batch(self, matrix, block_rows: int = 1024) -> np.ndarray:
+        """
+        Estimate Hurst exponents for many series of equal length.
+
+        Parameters
+        ----------
+        matrix : array-like
+            2-D array of shape (N SKUs, T)
+
+        block_rows : int
+            Number of series processed together, bounding the size
+            of temporary (rows, segments, size) arrays
+
+        Returns
+        -------
+        np.ndarray
+            Estimated Hurst exponents of shape (N,)
+        """
+        X = np.asarray(matrix, dtype=float)
+        if X.ndim != 2:
+            raise ValueError("matrix must be a 2-D array")
+
+        n, T = X.shape
+        out = np.full(n, 0.5)
 
-        if N < 50:
-            return 0.5
+        if T < 50 or n == 0:
+            return out
 
-        if self.window_sizes is None:
-            self.window_sizes = [10, 20, 50, 100, 200]
+        plan = self._plan(T)
+        if not plan:
+            return out
 
-        rs_values = []
-        sizes = []
+        log_sizes = np.log([size for size, _ in plan])
 
-        for size in self.window_sizes:
-            if size >= N:
-                continue
+        for start in range(0, n, block_rows):
+            block = X[start:start + block_rows]
+            rs = np.empty((len(block), len(plan)))
 
-            num_segments = N // size
-            rs_segment = []
+            for j, (size, num_segments) in enumerate(plan):
+                rs[:, j] = _mean_rescaled_range(block, size, num_segments)
 
-            for i in range(num_segments):
-                segment = x[i * size:(i + 1) * size]
-                mean = np.mean(segment)
-                cumulative_dev = np.cumsum(segment - mean)
-                R = np.max(cumulative_dev) - np.min(cumulative_dev)
-                S = np.std(segment)
+            valid = rs > 0
+            log_rs = np.log(np.where(valid, rs, 1.0))
+            out[start:start + len(block)] = masked_slope(
+                log_sizes, log_rs, valid, default=0.5
+            )
 
-                if S > 0:
-                    rs_segment.append(R / S)
+        return out
+
+    def estimate_rolling(self, series, window: int, step: int = 1) -> np.ndarray:
+        """
+        Hurst exponent (R/S) of every sliding window of a series.
+
+        The windows are zero-copy rows of ``rolling_window`` and are
+        evaluated together with ``estimate_batch``.
+
+        Parameters
+        ----------
+        series : array-like
+            Time series data
+
+        window : int
+            Window length
+
+        step : int
+            Offset between consecutive windows
+
+        Returns
+        -------
+        np.ndarray
+            Estimate for the window starting at i * step, one per window
+        """
+        return self.estimate_batch(rolling_window(series, window, step))
+
+
+def _mean_rescaled_range(X, size: int, num_segments: int) -> np.ndarray:
+    """
+    Mean R/S over the segments of every row; 0 if no segment has S > 0.
+    """
+    seg = X[:, :num_segments * size].reshape(len(X), num_segments, size)
 
-            if rs_segment:
-                rs_values.append(np.mean(rs_segment))
-                sizes.append(size)
+    dev = seg - seg.mean(axis=-1, keepdims=True)
+    cumulative_dev = np.cumsum(dev, axis=-1)
+    R = cumulative_dev.max(axis=-1) - cumulative_dev.min(axis=-1)
+    S = seg.std(axis=-1)
 
-        if len(rs_values) < 2:
-            return 0.5
+    valid = S > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = np.where(valid, R / S, 0.0)
 
-        slope, _ = np.polyfit(np.log(sizes), np.log(rs_values), 1)
-        return float(slope)
+    count = valid.sum(axis=-1)
+    return np.where(count > 0, rs.sum(axis=-1) / np.maximum(count, 1), 0.0)
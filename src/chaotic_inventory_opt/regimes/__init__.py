@@ -6,8 +6,10 @@ Maps fractal memory (Hurst exponent) and chaos intensity
 """
 
 from .classifier import RegimeClassifier, Regime
+from .profiling import profile_catalogue
 
 __all__ = [
     "RegimeClassifier",
     "Regime",
+    "profile_catalogue",
 ]
@@ -1,5 +1,7 @@
 from enum import Enum
 
+import numpy as np
+
 
 class Regime(Enum):
     """
@@ -68,3 +70,34 @@ class RegimeClassifier:
             return Regime.PERSISTENT
 
         return Regime.STABLE
+
+    def classify_batch(self, hurst, lyapunov) -> np.ndarray:
+        """
+        Classify many (H, λ) pairs at once.
+
+        Parameters
+        ----------
+        hurst : array-like
+            Hurst exponents
+
+        lyapunov : array-like
+            Largest Lyapunov exponents
+
+        Returns
+        -------
+        np.ndarray
+            Regime values (``Regime.value`` strings), same shape
+            as the broadcast inputs
+        """
+        persistent = np.asarray(hurst, dtype=float) > self.hurst_threshold
+        chaotic = np.asarray(lyapunov, dtype=float) > self.lyapunov_threshold
+
+        return np.select(
+            [chaotic & persistent, chaotic, persistent],
+            [
+                Regime.STRUCTURED_CHAOS.value,
+                Regime.CHAOTIC.value,
+                Regime.PERSISTENT.value,
+            ],
+            default=Regime.STABLE.value,
+        )
@@ -0,0 +1,181 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from chaotic_inventory_opt.chaos.entropy import SampleEntropy
+from chaotic_inventory_opt.chaos.lyapunov import LyapunovExponentEstimator
+from chaotic_inventory_opt.chaos.recurrence import RecurrenceAnalyzer
+from chaotic_inventory_opt.fractal.hurst import HurstEstimator
+from chaotic_inventory_opt.regimes.classifier import RegimeClassifier
+from chaotic_inventory_opt.utils.cache import CachedEstimator, EstimatorCache
+from chaotic_inventory_opt.utils.parallel import (
+    attach_shared,
+    resolve_n_jobs,
+    shared_array,
+    split_range,
+)
+
+
+DEFAULT_ESTIMATORS = (
+    "hurst",
+    "lyapunov",
+    "sample_entropy",
+    "recurrence_rate",
+    "wavelet_slope",
+)
+
+# Method called per series for each named column; "estimate" columns
+# use ``estimate_batch`` when the estimator provides it
+_METHODS = {
+    "recurrence_rate": "recurrence_rate",
+    "wavelet_slope": "energy_slope",
+}
+
+
+def _default_estimator(name: str):
+    if name == "hurst":
+        return HurstEstimator()
+    if name == "lyapunov":
+        return LyapunovExponentEstimator()
+    if name == "sample_entropy":
+        return SampleEntropy()
+    if name == "recurrence_rate":
+        return RecurrenceAnalyzer()
+    if name == "wavelet_slope":
+        from chaotic_inventory_opt.fractal.wavelets import WaveletEnergyAnalyzer
+        return WaveletEnergyAnalyzer()
+    raise ValueError(f"Unknown estimator '{name}'")
+
+
+def _resolve_estimators(estimators) -> dict:
+    if estimators is None:
+        names = list(DEFAULT_ESTIMATORS)
+        try:
+            import pywt  # noqa: F401
+        except ImportError:
+            names.remove("wavelet_slope")
+        return {name: _default_estimator(name) for name in names}
+
+    if isinstance(estimators, dict):
+        return dict(estimators)
+
+    return {name: _default_estimator(name) for name in estimators}
+
+
+def _evaluate(name: str, estimator, block) -> np.ndarray:
+    method = _METHODS.get(name, "estimate")
+
+    if method == "estimate" and hasattr(estimator, "estimate_batch"):
+        return np.asarray(estimator.estimate_batch(block), dtype=float)
+
+    fn = getattr(estimator, method)
+    return np.fromiter((fn(row) for row in block), dtype=float, count=len(block))
+
+
+def _profile_rows(X, estimators: dict) -> dict:
+    return {name: _evaluate(name, est, X) for name, est in estimators.items()}
+
+
+def _profile_shared(spec, start: int, stop: int, estimators: dict):
+    shm, X = attach_shared(spec)
+    try:
+        out = _profile_rows(X[start:stop], estimators)
+    finally:
+        del X
+        shm.close()
+    return start, out
+
+
+def profile_catalogue(
+    demand_matrix,
+    estimators=None,
+    n_jobs: int = 1,
+    block_size: int | None = None,
+    classifier: RegimeClassifier | None = None,
+    sku_ids=None,
+    cache: EstimatorCache | None = None,
+) -> dict:
+    """
+    Fractal/chaos profile of every SKU in a catalogue.
+
+    SKUs are sharded into row blocks and evaluated on a process
+    pool. The demand matrix is placed in shared memory once, so
+    workers read it directly instead of receiving pickled copies.
+
+    Parameters
+    ----------
+    demand_matrix : array-like
+        Demand of shape (N SKUs, T)
+
+    estimators : list[str], dict or None
+        Columns to compute. Names select default estimators from
+        ``DEFAULT_ESTIMATORS``; a dict maps column name -> configured
+        (picklable) estimator instance. None computes all defaults
+        (``wavelet_slope`` only if PyWavelets is installed).
+
+    n_jobs : int
+        Worker processes (1 runs in-process, -1 uses all cores)
+
+    block_size : int or None
+        SKUs per task. Defaults to about four tasks per worker.
+
+    classifier : RegimeClassifier or None
+        Classifier used for the ``regime`` column, which is added
+        when both ``hurst`` and ``lyapunov`` are computed
+
+    sku_ids : array-like or None
+        Labels stored in the ``sku`` column (defaults to row index)
+
+    cache : EstimatorCache or None
+        Memoize results per SKU series; with an on-disk tier,
+        profiling the same catalogue again reads every value back
+
+    Returns
+    -------
+    dict
+        Column name -> array of length N
+    """
+    X = np.asarray(demand_matrix)
+    if X.ndim != 2:
+        raise ValueError("demand_matrix must be a 2-D array")
+
+    N = X.shape[0]
+    estimators = _resolve_estimators(estimators)
+    if cache is not None:
+        estimators = {
+            name: CachedEstimator(est, cache) for name, est in estimators.items()
+        }
+    n_jobs = resolve_n_jobs(n_jobs)
+
+    if block_size is None:
+        block_size = max(1, min(1024, math.ceil(N / (4 * n_jobs))))
+
+    columns = {name: np.empty(N) for name in estimators}
+
+    if n_jobs == 1 or N <= block_size:
+        for start, stop in split_range(N, block_size):
+            block = _profile_rows(X[start:stop], estimators)
+            for name, values in block.items():
+                columns[name][start:stop] = values
+    else:
+        with shared_array(X) as spec, ProcessPoolExecutor(n_jobs) as pool:
+            futures = [
+                pool.submit(_profile_shared, spec, start, stop, estimators)
+                for start, stop in split_range(N, block_size)
+            ]
+            for future in futures:
+                start, block = future.result()
+                for name, values in block.items():
+                    columns[name][start:start + len(values)] = values
+
+    result = {"sku": np.arange(N) if sku_ids is None else np.asarray(sku_ids)}
+    result.update(columns)
+
+    if "hurst" in columns and "lyapunov" in columns:
+        classifier = classifier or RegimeClassifier()
+        result["regime"] = classifier.classify_batch(
+            columns["hurst"], columns["lyapunov"]
+        )
+
+    return result
@@ -1,6 +1,7 @@
 import numpy as np
 from chaotic_inventory_opt.core.inventory_system import InventorySystem
 from chaotic_inventory_opt.core.cost import CostModel
+from chaotic_inventory_opt.utils.ring import RingBuffer
 
 
 class InventoryEnv:
@@ -28,7 +29,7 @@ class InventoryEnv:
         self.system = InventorySystem(initial_inventory)
         self.cost_model = cost_model
 
-        self._demand_buffer = []
+        self._demand_buffer = RingBuffer(window)
 
     def reset(self):
         self.t = 0
@@ -43,9 +44,6 @@ class InventoryEnv:
         demand_t = self.demand[self.t]
         self._demand_buffer.append(demand_t)
 
-        if len(self._demand_buffer) > self.window:
-            self._demand_buffer.pop(0)
-
         inventory_next = self.system.step(demand_t, action)
         cost = self.cost_model.compute(inventory_next, action)
 
@@ -58,11 +56,12 @@ class InventoryEnv:
         """
         Construct state representation.
         """
-        if not self._demand_buffer:
+        if not len(self._demand_buffer):
             mean_d = 0.0
             std_d = 0.0
         else:
-            mean_d = float(np.mean(self._demand_buffer))
-            std_d = float(np.std(self._demand_buffer))
+            window = self._demand_buffer.view()
+            mean_d = float(np.mean(window))
+            std_d = float(np.std(window))
 
         return np.array([self.system.I, mean_d, std_d], dtype=float)
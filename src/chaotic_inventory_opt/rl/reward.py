@@ -1,4 +1,5 @@
 from chaotic_inventory_opt.chaos.lyapunov import LyapunovExponentEstimator
+from chaotic_inventory_opt.utils.ring import RingBuffer
 
 
 class RewardFunction:
@@ -12,10 +13,13 @@ class RewardFunction:
         lyapunov_estimator: LyapunovExponentEstimator,
         window: int = 50,
     ):
+        if getattr(lyapunov_estimator, "window", window) != window:
+            raise ValueError("lyapunov_estimator window must match window")
+
         self.chaos_weight = chaos_weight
         self.lyapunov = lyapunov_estimator
         self.window = window
-        self._inventory_trace = []
+        self._inventory_trace = RingBuffer(self.window)
 
     def compute(self, inventory: float, cost: float) -> float:
         """
@@ -23,11 +27,14 @@ class RewardFunction:
         """
         self._inventory_trace.append(inventory)
 
-        if len(self._inventory_trace) > self.window:
-            self._inventory_trace.pop(0)
+        if hasattr(self.lyapunov, "push"):
+            self.lyapunov.push(inventory)
 
         chaos_penalty = 0.0
         if len(self._inventory_trace) >= 10:
-            chaos_penalty = self.lyapunov.estimate(self._inventory_trace)
+            if hasattr(self.lyapunov, "push"):
+                chaos_penalty = self.lyapunov.value()
+            else:
+                chaos_penalty = self.lyapunov.estimate(self._inventory_trace.view())
 
         return -cost - self.chaos_weight * chaos_penalty
@@ -5,14 +5,38 @@ This module contains small, reusable helper functions
 used across the library. No domain logic lives here.
 """
 
-from .rolling import rolling_window
+from .ring import RingBuffer, RingBuffer2D, RollingMean
+from .cache import EstimatorCache, CachedEstimator, cache_key
+from .parallel import (
+    resolve_n_jobs,
+    split_range,
+    shared_array,
+    attach_shared,
+)
+from .regression import masked_slope
+from .rolling import rolling_window, window_starts, window_sums
 from .validation import (
     validate_series,
+    validate_matrix,
     validate_positive,
 )
 
 __all__ = [
+    "RingBuffer",
+    "RingBuffer2D",
+    "RollingMean",
+    "EstimatorCache",
+    "CachedEstimator",
+    "cache_key",
+    "resolve_n_jobs",
+    "split_range",
+    "shared_array",
+    "attach_shared",
+    "masked_slope",
     "rolling_window",
+    "window_starts",
+    "window_sums",
     "validate_series",
+    "validate_matrix",
     "validate_positive",
 ]
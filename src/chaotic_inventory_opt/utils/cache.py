@@ -0,0 +1,326 @@
+import hashlib
+import pickle
+import sqlite3
+import sys
+from collections import OrderedDict
+
+import numpy as np
+
+
+# Methods of a wrapped estimator whose results are memoized; each
+# takes one series as first argument
+CACHED_METHODS = (
+    "estimate",
+    "recurrence_rate",
+    "rqa",
+    "energy_slope",
+)
+
+
+def _param_token(value) -> str:
+    """
+    Stable text form of an estimator parameter.
+    """
+    if isinstance(value, np.ndarray):
+        digest = hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()
+        return f"ndarray({value.dtype.str},{value.shape},{digest})"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_param_token(v) for v in value) + "]"
+    if isinstance(value, dict):
+        items = sorted((str(k), _param_token(v)) for k, v in value.items())
+        return "{" + ",".join(f"{k}:{v}" for k, v in items) + "}"
+    if hasattr(value, "__dict__") and not isinstance(value, type):
+        return estimator_token(value)
+    return repr(value)
+
+
+def estimator_token(estimator) -> str:
+    """
+    Class and public parameters of an estimator as a stable string.
+
+    Attributes starting with an underscore (caches, buffers,
+    running state) are not part of the identity.
+    """
+    cls = type(estimator)
+    params = sorted(
+        (name, _param_token(value))
+        for name, value in vars(estimator).items()
+        if not name.startswith("_")
+    )
+    body = ",".join(f"{name}={token}" for name, token in params)
+    return f"{cls.__module__}.{cls.__qualname__}({body})"
+
+
+def cache_key(estimator, method: str, series, kwargs=None) -> str:
+    """
+    Content address of ``estimator.method(series, **kwargs)``.
+
+    Parameters
+    ----------
+    estimator : object
+        Estimator instance
+
+    method : str
+        Method name
+
+    series : array-like
+        Input series (hashed by dtype, shape and bytes)
+
+    kwargs : dict or None
+        Extra keyword arguments of the call
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest
+    """
+    x = np.ascontiguousarray(series, dtype=float)
+
+    h = hashlib.sha256()
+    h.update(estimator_token(estimator).encode())
+    h.update(method.encode())
+    h.update(_param_token(dict(kwargs or {})).encode())
+    h.update(f"{x.dtype.str}{x.shape}".encode())
+    h.update(x.tobytes())
+    return h.hexdigest()
+
+
+def _sizeof(value) -> int:
+    if isinstance(value, np.ndarray):
+        return value.nbytes + 112
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value.values())
+    return sys.getsizeof(value)
+
+
+class EstimatorCache:
+    """
+    Two-tier memoization store for estimator results.
+
+    - memory: LRU dictionary evicting least recently used entries
+      once their total size exceeds ``max_bytes``
+    - disk (optional): a SQLite file of pickled results, shared by
+      processes and runs
+
+    Keys are content addresses from ``cache_key``, so identical
+    series and parameters hit the cache regardless of where they
+    come from.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20, path=None):
+        """
+        Parameters
+        ----------
+        max_bytes : int
+            Size budget of the in-memory tier
+
+        path : str or Path or None
+            SQLite file of the on-disk tier (None keeps results in
+            memory only)
+        """
+        self.max_bytes = max_bytes
+        self.path = None if path is None else str(path)
+
+        self._memory = OrderedDict()
+        self._size = 0
+        self._db = None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        # Workers get an empty memory tier and reopen the database
+        return {"max_bytes": self.max_bytes, "path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _connect(self):
+        if self._db is None:
+            self._db = sqlite3.connect(self.path, timeout=60)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+            )
+            self._db.commit()
+        return self._db
+
+    def _remember(self, key, value):
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return
+
+        size = _sizeof(value)
+        if size > self.max_bytes:
+            return
+
+        self._memory[key] = (value, size)
+        self._size += size
+
+        while self._size > self.max_bytes:
+            _, (_, evicted) = self._memory.popitem(last=False)
+            self._size -= evicted
+
+    def get(self, key, default=None):
+        """
+        Cached value for ``key``, or ``default``.
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        if self.path is not None:
+            row = self._connect().execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                value = pickle.loads(row[0])
+                self._remember(key, value)
+                self.hits += 1
+                self.disk_hits += 1
+                return value
+
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        """
+        Store ``value`` under ``key`` in both tiers.
+        """
+        self.put_many([(key, value)])
+
+    def put_many(self, items):
+        """
+        Store (key, value) pairs, writing the disk tier in one transaction.
+        """
+        items = list(items)
+        for key, value in items:
+            self._remember(key, value)
+
+        if self.path is not None:
+            db = self._connect()
+            db.executemany(
+                "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                [(key, pickle.dumps(value)) for key, value in items],
+            )
+            db.commit()
+
+    def __contains__(self, key) -> bool:
+        if key in self._memory:
+            return True
+        if self.path is None:
+            return False
+        row = self._connect().execute(
+            "SELECT 1 FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def clear(self):
+        """
+        Drop all entries from both tiers.
+        """
+        self._memory.clear()
+        self._size = 0
+        if self.path is not None:
+            db = self._connect()
+            db.execute("DELETE FROM results")
+            db.commit()
+
+    def close(self):
+        """
+        Close the database connection (reopened on next use).
+        """
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def stats(self) -> dict:
+        """
+        Hit/miss counters and memory-tier usage.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._memory),
+            "bytes": self._size,
+        }
+
+
+class CachedEstimator:
+    """
+    Memoizing wrapper around an estimator.
+
+    Calls of ``CACHED_METHODS`` are looked up in an
+    ``EstimatorCache`` by content address. ``estimate_batch`` is
+    cached row by row, so a catalogue is reused however it is split
+    into blocks; only missing rows reach the wrapped estimator. All
+    other attributes are forwarded unchanged.
+    """
+
+    def __init__(self, estimator, cache: EstimatorCache | None = None):
+        """
+        Parameters
+        ----------
+        estimator : object
+            Estimator to wrap
+
+        cache : EstimatorCache or None
+            Shared cache (a private in-memory cache if None)
+        """
+        self.estimator = estimator
+        self.cache = cache if cache is not None else EstimatorCache()
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the wrapper
+        if name in ("estimator", "cache"):
+            raise AttributeError(name)
+
+        attr = getattr(self.estimator, name)
+        if name == "estimate_batch":
+            return self._estimate_batch
+        if name not in CACHED_METHODS or not callable(attr):
+            return attr
+
+        def cached(series, **kwargs):
+            key = cache_key(self.estimator, name, series, kwargs)
+            value = self.cache.get(key)
+            if value is None:
+                value = attr(series, **kwargs)
+                self.cache.put(key, value)
+            return value
+
+        return cached
+
+    def _estimate_batch(self, matrix, **kwargs) -> np.ndarray:
+        """
+        Row-wise cached ``estimate_batch`` of the wrapped estimator.
+        """
+        X = np.asarray(matrix, dtype=float)
+        out = np.empty(len(X))
+
+        keys = [cache_key(self.estimator, "estimate_batch", row, kwargs) for row in X]
+        missing = []
+        for i, key in enumerate(keys):
+            value = self.cache.get(key)
+            if value is None:
+                missing.append(i)
+            else:
+                out[i] = value
+
+        if missing:
+            values = self.estimator.estimate_batch(X[missing], **kwargs)
+            out[missing] = values
+            self.cache.put_many(
+                (keys[i], float(v)) for i, v in zip(missing, out[missing])
+            )
+
+        return out
@@ -0,0 +1,70 @@
+import os
+import sys
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+def resolve_n_jobs(n_jobs: int | None) -> int:
+    """
+    Number of worker processes for ``n_jobs`` (None/1 -> 1, -1 -> all cores).
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, n_jobs)
+
+
+def split_range(n: int, block_size: int) -> list[tuple[int, int]]:
+    """
+    Split range(n) into consecutive (start, stop) blocks.
+    """
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+    return [(start, min(start + block_size, n)) for start in range(0, n, block_size)]
+
+
+@contextmanager
+def shared_array(array):
+    """
+    Copy an array into shared memory for the duration of a block.
+
+    Yields a picklable spec ``(name, shape, dtype)`` that worker
+    processes pass to ``attach_shared`` instead of receiving the
+    array itself. The segment is released on exit.
+    """
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    try:
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+        view[...] = array
+        del view
+        yield (shm.name, array.shape, array.dtype.str)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def attach_shared(spec):
+    """
+    Attach to an array published with ``shared_array``.
+
+    Returns
+    -------
+    tuple
+        (SharedMemory handle, read-only np.ndarray view). Keep the
+        handle alive while the view is in use.
+    """
+    name, shape, dtype = spec
+
+    if sys.version_info >= (3, 13):
+        # The creating process owns (and unlinks) the segment
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+
+    view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    view.flags.writeable = False
+    return shm, view
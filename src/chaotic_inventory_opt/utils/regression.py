@@ -0,0 +1,54 @@
+import numpy as np
+
+
+def masked_slope(x, y, mask=None, default: float = np.nan) -> np.ndarray:
+    """
+    Least-squares slopes of many regressions sharing one abscissa.
+
+    Equivalent to ``np.polyfit(x[m], y_i[m], 1)[0]`` for every row i
+    with m = mask[i], computed in one vectorized pass.
+
+    Parameters
+    ----------
+    x : array-like
+        Abscissa of shape (K,)
+
+    y : array-like
+        Ordinates of shape (..., K)
+
+    mask : array-like or None
+        Boolean array broadcastable to ``y`` selecting the points
+        used in each regression. None uses all points.
+
+    default : float
+        Value returned for rows with fewer than two points
+
+    Returns
+    -------
+    np.ndarray
+        Slopes of shape ``y.shape[:-1]``
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    if mask is None:
+        mask = np.ones(y.shape, dtype=bool)
+    mask = np.broadcast_to(mask, y.shape)
+
+    w = mask.astype(float)
+    n = w.sum(axis=-1)
+    safe_n = np.maximum(n, 1.0)
+
+    x_mean = (w * x).sum(axis=-1) / safe_n
+    y_mean = (w * np.where(mask, y, 0.0)).sum(axis=-1) / safe_n
+
+    dx = np.where(mask, x - x_mean[..., None], 0.0)
+    dy = np.where(mask, y - y_mean[..., None], 0.0)
+
+    sxx = (dx * dx).sum(axis=-1)
+    sxy = (dx * dy).sum(axis=-1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = sxy / sxx
+
+    return np.where((n >= 2) & (sxx > 0), slope, default)
@@ -0,0 +1,235 @@
+import math
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Fixed-capacity FIFO window backed by a preallocated NumPy array.
+
+    Every sample is written twice, at position p and p + capacity,
+    so the most recent samples always form one contiguous slice.
+    ``append`` is O(1) and ``view`` is zero-copy.
+    """
+
+    __slots__ = ("capacity", "_data", "_pos", "_n")
+
+    def __init__(self, capacity: int, dtype=float):
+        """
+        Parameters
+        ----------
+        capacity : int
+            Maximum number of samples held (must be > 0)
+
+        dtype : data-type
+            Element type of the buffer
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=dtype)
+        self.clear()
+
+    def clear(self):
+        """
+        Drop all samples.
+        """
+        self._pos = 0
+        self._n = 0
+
+    def append(self, value):
+        """
+        Add one sample, evicting the oldest once the buffer is full.
+        """
+        self._data[self._pos] = value
+        self._data[self._pos + self.capacity] = value
+        self._pos = (self._pos + 1) % self.capacity
+        if self._n < self.capacity:
+            self._n += 1
+
+    def fill(self, values):
+        """
+        Replace the contents with the last ``capacity`` of ``values``.
+        """
+        values = np.asarray(values)[-self.capacity:]
+        n = len(values)
+        self._data[:n] = values
+        self._data[self.capacity:self.capacity + n] = values
+        self._pos = n % self.capacity
+        self._n = n
+
+    def view(self) -> np.ndarray:
+        """
+        Read-only contiguous view of the samples, oldest first.
+        """
+        end = self._pos + self.capacity if self._n == self.capacity else self._pos
+        out = self._data[end - self._n:end]
+        out.flags.writeable = False
+        return out
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def full(self) -> bool:
+        return self._n == self.capacity
+
+
+class RingBuffer2D:
+    """
+    Fixed-capacity window over N parallel series (e.g. SKUs).
+
+    Stored as an (N, 2 * capacity) array with the same double-write
+    scheme as ``RingBuffer``; ``view`` returns an (N, len) slice
+    whose rows are contiguous, ready for row-wise estimators.
+    """
+
+    __slots__ = ("n_series", "capacity", "_data", "_pos", "_n")
+
+    def __init__(self, n_series: int, capacity: int, dtype=float):
+        """
+        Parameters
+        ----------
+        n_series : int
+            Number of parallel series
+
+        capacity : int
+            Maximum number of samples held per series (must be > 0)
+
+        dtype : data-type
+            Element type of the buffer
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.n_series = n_series
+        self.capacity = capacity
+        self._data = np.zeros((n_series, 2 * capacity), dtype=dtype)
+        self.clear()
+
+    def clear(self):
+        """
+        Drop all samples.
+        """
+        self._pos = 0
+        self._n = 0
+
+    def append(self, values):
+        """
+        Add one sample per series from a vector of shape (N,).
+        """
+        self._data[:, self._pos] = values
+        self._data[:, self._pos + self.capacity] = values
+        self._pos = (self._pos + 1) % self.capacity
+        if self._n < self.capacity:
+            self._n += 1
+
+    def fill(self, values):
+        """
+        Replace the contents with the last ``capacity`` columns of
+        an (N, n) array.
+        """
+        values = np.asarray(values)[:, -self.capacity:]
+        n = values.shape[1]
+        self._data[:, :n] = values
+        self._data[:, self.capacity:self.capacity + n] = values
+        self._pos = n % self.capacity
+        self._n = n
+
+    def view(self) -> np.ndarray:
+        """
+        Read-only (N, len) view of the samples, oldest first.
+        """
+        end = self._pos + self.capacity if self._n == self.capacity else self._pos
+        out = self._data[:, end - self._n:end]
+        out.flags.writeable = False
+        return out
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def full(self) -> bool:
+        return self._n == self.capacity
+
+
+class RollingMean:
+    """
+    Mean of the last ``capacity`` values of a scalar stream.
+
+    Values live in a preallocated ring and the mean is kept as a
+    running sum, so memory is fixed and ``append``/``mean`` are O(1).
+    The sum is refreshed exactly each time the ring wraps to bound
+    rounding drift.
+    """
+
+    __slots__ = ("capacity", "_values", "_pos", "_n", "_sum")
+
+    def __init__(self, capacity: int):
+        """
+        Parameters
+        ----------
+        capacity : int
+            Number of most recent values averaged (must be > 0)
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self._values = [0.0] * capacity
+        self.clear()
+
+    def clear(self):
+        """
+        Drop all values.
+        """
+        self._pos = 0
+        self._n = 0
+        self._sum = 0.0
+
+    def append(self, value: float):
+        """
+        Add one value, evicting the oldest once the ring is full.
+        """
+        value = float(value)
+        pos = self._pos
+
+        if self._n == self.capacity:
+            self._sum -= self._values[pos]
+        else:
+            self._n += 1
+
+        self._values[pos] = value
+        self._sum += value
+
+        pos += 1
+        if pos == self.capacity:
+            pos = 0
+            self._sum = math.fsum(self._values)
+        self._pos = pos
+
+    def fill(self, values):
+        """
+        Replace the contents with the last ``capacity`` of ``values``.
+        """
+        self.clear()
+        for value in list(values)[-self.capacity:]:
+            self.append(value)
+
+    def mean(self) -> float:
+        """
+        Mean of the stored values (0.0 when empty).
+        """
+        return self._sum / self._n if self._n else 0.0
+
+    def values(self) -> list:
+        """
+        Stored values, oldest first.
+        """
+        if self._n < self.capacity:
+            return self._values[:self._n]
+        return self._values[self._pos:] + self._values[:self._pos]
+
+    def __len__(self) -> int:
+        return self._n
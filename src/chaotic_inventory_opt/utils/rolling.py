@@ -1,36 +1,66 @@
-from collections import deque
-from typing import Iterable, List
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 def rolling_window(
-    series: Iterable[float],
+    series,
     window: int,
-) -> List[list[float]]:
+    step: int = 1,
+) -> np.ndarray:
     """
     Generate rolling windows over a series.
 
     Parameters
     ----------
-    series : iterable of float
-        Input time series
+    series : array-like or iterable
+        Input time series; iterables without a length (e.g.
+        generators) are consumed into an array first
 
     window : int
         Window size (must be > 0)
 
+    step : int
+        Offset between consecutive windows (must be > 0)
+
     Returns
     -------
-    list of lists
-        Rolling windows
+    np.ndarray
+        Read-only view of shape (num_windows, window); row i is
+        the window ending at sample i * step + window - 1. No data
+        is copied beyond the float conversion of ``series``.
+    """
+    if window <= 0:
+        raise ValueError("window must be positive")
+    if step <= 0:
+        raise ValueError("step must be positive")
+
+    if hasattr(series, "__len__"):
+        x = np.asarray(series, dtype=float)
+    else:
+        x = np.fromiter(series, dtype=float)
+
+    if len(x) < window:
+        return np.empty((0, window))
+
+    return sliding_window_view(x, window)[::step]
+
+
+def window_starts(length: int, window: int, step: int = 1) -> np.ndarray:
+    """
+    Start index of every window produced by ``rolling_window``.
     """
     if window <= 0:
         raise ValueError("window must be positive")
+    if step <= 0:
+        raise ValueError("step must be positive")
 
-    buffer = deque(maxlen=window)
-    windows = []
+    return np.arange(0, max(length - window + 1, 0), step)
 
-    for x in series:
-        buffer.append(float(x))
-        if len(buffer) == window:
-            windows.append(list(buffer))
 
-    return windows
+def window_sums(values, starts, width: int) -> np.ndarray:
+    """
+    Sums of ``values[s:s + width]`` for every start s, from one
+    cumulative sum.
+    """
+    c = np.concatenate(([0], np.cumsum(values)))
+    return c[starts + width] - c[starts]
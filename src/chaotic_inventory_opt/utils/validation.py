@@ -48,3 +48,47 @@ def validate_positive(value: float, name: str = "value"):
     """
     if value < 0:
         raise ValueError(f"{name} must be non-negative")
+
+
+def validate_matrix(matrix, min_length: int = 1, row_offset: int = 0, rows=None):
+    """
+    Validate a block of numeric time series (vectorized ``validate_series``).
+
+    Parameters
+    ----------
+    matrix : array-like
+        2-D array of shape (N series, T)
+
+    min_length : int
+        Minimum required length of every series
+
+    row_offset : int
+        Index of the first row, used in error messages
+
+    rows : array-like or None
+        Index of every row, used in error messages instead of
+        ``row_offset`` (e.g. a non-contiguous subset of a catalogue)
+
+    Returns
+    -------
+    np.ndarray
+        Validated float array of shape (N, T)
+    """
+    X = np.asarray(matrix, dtype=float)
+
+    if X.ndim != 2:
+        raise ValueError(f"Expected a 2-D array, got {X.ndim} dimensions")
+
+    if X.shape[1] < min_length:
+        raise ValueError(
+            f"Series length {X.shape[1]} < required minimum {min_length}"
+        )
+
+    finite = np.isfinite(X)
+    if not finite.all():
+        row = int(np.flatnonzero(~finite.all(axis=1))[0])
+        kind = "NaN" if np.isnan(X[row]).any() else "infinite"
+        index = row_offset + row if rows is None else int(rows[row])
+        raise ValueError(f"Series {index} contains {kind} values")
+
+    return X